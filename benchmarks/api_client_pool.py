@@ -0,0 +1,75 @@
+"""
+Benchmark: APIClient.make_request with a pooled transport vs. a client per call.
+
+Runs both strategies against a local stub server and reports requests/sec.
+
+Usage:
+    python benchmarks/api_client_pool.py --requests 2000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from xpander_sdk import Configuration
+from xpander_sdk.core.xpander_api_client import APIClient
+
+from stub_server import StubServer
+
+
+async def _run(fn, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await fn()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+async def main(total: int, concurrency: int) -> None:
+    async with StubServer() as server:
+        configuration = Configuration(
+            api_key="benchmark", base_url=server.base_url, organization_id="benchmark"
+        )
+        client = APIClient(configuration=configuration)
+
+        async def per_call_client():
+            # the previous make_request behaviour: a brand new client per call
+            async with httpx.AsyncClient() as http:
+                response = await http.get(
+                    f"{server.base_url}/agents/list",
+                    headers={"x-api-key": configuration.api_key},
+                    timeout=1200,
+                )
+                response.raise_for_status()
+                response.json()
+
+        async def pooled_client():
+            await client.make_request(path="/agents/list")
+
+        connections_before = server.connections
+        baseline = await _run(per_call_client, total, concurrency)
+        baseline_connections = server.connections - connections_before
+
+        connections_before = server.connections
+        pooled = await _run(pooled_client, total, concurrency)
+        pooled_connections = server.connections - connections_before
+        await APIClient.aclose_connections()
+
+    print(f"requests={total} concurrency={concurrency}")
+    print(f"client per call : {baseline:9.1f} req/s ({baseline_connections} connections)")
+    print(f"pooled transport: {pooled:9.1f} req/s ({pooled_connections} connections)")
+    print(f"speedup         : {pooled / baseline:9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(total=args.requests, concurrency=args.concurrency))
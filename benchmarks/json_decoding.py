@@ -0,0 +1,110 @@
+"""
+Benchmark: response decoding in APIClient.
+
+Compares the previous decoding (`response.json()` twice, then `model(**data)`)
+with single-pass validation from bytes, and reports the peak memory of
+buffering a large list response vs. streaming it item by item.
+
+Usage:
+    python benchmarks/json_decoding.py --messages 5000 --tasks 50000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from xpander_sdk.models.activity import AgentActivityThread
+from xpander_sdk.modules.tasks.models.tasks_list import TasksListItem
+from xpander_sdk.utils.json_stream import aiter_json_array, loads
+
+
+def _activity_log(messages: int) -> bytes:
+    now = datetime.now(timezone.utc).isoformat()
+    return json.dumps(
+        {
+            "id": "thread",
+            "created_at": now,
+            "messages": [
+                {
+                    "id": f"msg-{i}",
+                    "created_at": now,
+                    "role": "agent" if i % 2 else "user",
+                    "content": {"text": "lorem ipsum " * 20, "files": []},
+                }
+                for i in range(messages)
+            ],
+        }
+    ).encode()
+
+
+def _tasks(count: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "id": f"task-{i}",
+                "agent_id": "agent",
+                "organization_id": "org",
+                "status": "completed",
+                "result": "done " * 40,
+            }
+            for i in range(count)
+        ]
+    ).encode()
+
+
+def _timeit(fn, repeat: int = 20) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+async def _peak_memory_streaming(body: bytes, chunk_size: int = 65536) -> int:
+    async def chunks():
+        for i in range(0, len(body), chunk_size):
+            yield body[i : i + chunk_size]
+
+    tracemalloc.start()
+    async for _ in aiter_json_array(chunks(), parse=TasksListItem.model_validate_json):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def _peak_memory_buffered(body: bytes) -> int:
+    tracemalloc.start()
+    tasks = [TasksListItem(**task) for task in loads(body)]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del tasks
+    return peak
+
+
+def main(messages: int, tasks: int) -> None:
+    log = _activity_log(messages)
+    previous = _timeit(lambda: json.loads(log) and AgentActivityThread(**json.loads(log)))
+    single_pass = _timeit(lambda: AgentActivityThread.model_validate_json(log))
+    print(f"activity log ({len(log) / 1e6:.1f} MB, {messages} messages)")
+    print(f"  json twice + model(**data): {previous * 1000:8.1f} ms")
+    print(f"  model_validate_json(bytes): {single_pass * 1000:8.1f} ms ({previous / single_pass:.2f}x)")
+
+    history = _tasks(tasks)
+    buffered = _peak_memory_buffered(history)
+    streamed = asyncio.run(_peak_memory_streaming(history))
+    print(f"tasks history ({len(history) / 1e6:.1f} MB, {tasks} tasks) peak memory")
+    print(f"  buffered list: {buffered / 1e6:8.1f} MB")
+    print(f"  streamed     : {streamed / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--tasks", type=int, default=50000)
+    args = parser.parse_args()
+    main(messages=args.messages, tasks=args.tasks)
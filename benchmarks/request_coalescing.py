@@ -0,0 +1,61 @@
+"""
+Benchmark: concurrent identical GETs with and without request coalescing.
+
+Simulates a burst of tasks for the same agent each fetching the same resources
+(agent definition, LLM extra headers) against a stub server with latency.
+
+Usage:
+    python benchmarks/request_coalescing.py --tasks 50 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from xpander_sdk import Configuration
+from xpander_sdk.core.xpander_api_client import APIClient
+
+from stub_server import StubServer
+
+_PATHS = ["/agents/agent-1", "/metadata/default_llm_extra_headers", "/agents/agent-1/db"]
+
+
+async def _burst(client: APIClient, configuration: Configuration, tasks: int) -> float:
+    async def task():
+        await asyncio.gather(*(client.make_request(path=path, configuration=configuration) for path in _PATHS))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(task() for _ in range(tasks)))
+    return time.perf_counter() - started
+
+
+async def main(tasks: int, latency: float) -> None:
+    async with StubServer(delay=latency) as server:
+        client = APIClient()
+        results = {}
+        for coalesce in (False, True):
+            configuration = Configuration(
+                api_key="benchmark",
+                base_url=server.base_url,
+                organization_id="benchmark",
+                coalesce_requests=coalesce,
+            )
+            requests_before = server.requests
+            elapsed = await _burst(client, configuration, tasks)
+            results[coalesce] = (elapsed, server.requests - requests_before)
+        await APIClient.aclose_connections()
+
+    stats = APIClient.get_coalescing_stats()
+    print(f"tasks={tasks} gets/task={len(_PATHS)} server latency={latency * 1000:.0f}ms")
+    for coalesce, (elapsed, requests) in results.items():
+        label = "coalesced" if coalesce else "independent"
+        print(f"{label:12}: {elapsed * 1000:8.1f} ms, {requests} server requests")
+    print(f"calls saved : {stats.coalesced}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(tasks=args.tasks, latency=args.latency))
@@ -0,0 +1,82 @@
+"""
+Benchmark: overhead of sync SDK calls (`run_sync`) per call.
+
+Compares the previous behaviour (a new event loop per call, i.e. `asyncio.run`
+from plain sync code or a thread + loop per call under uvloop) with the
+long-lived background loop, for an empty coroutine and for an API call against
+a local stub server (where the background loop also keeps the connection pool).
+
+Usage:
+    python benchmarks/run_sync_overhead.py --calls 500
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+from xpander_sdk import Configuration
+from xpander_sdk.core.xpander_api_client import APIClient
+from xpander_sdk.utils.event_loop import _run_and_release_connections, run_sync
+
+from stub_server import StubServer
+
+
+def _per_call_loop(coro):
+    return asyncio.run(_run_and_release_connections(coro))
+
+
+def _per_call_thread(coro):
+    def run():
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(_run_and_release_connections(coro))
+        finally:
+            loop.close()
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        return executor.submit(run).result()
+
+
+def _measure(runner, make_coro, calls: int) -> float:
+    runner(make_coro())  # warm up
+    started = time.perf_counter()
+    for _ in range(calls):
+        runner(make_coro())
+    return (time.perf_counter() - started) / calls
+
+
+def main(calls: int) -> None:
+    server = StubServer()
+    server_loop = asyncio.new_event_loop()
+    server_loop.run_until_complete(server.__aenter__())
+    threading.Thread(target=server_loop.run_forever, daemon=True).start()
+
+    client = APIClient(
+        configuration=Configuration(api_key="benchmark", base_url=server.base_url, organization_id="benchmark")
+    )
+    workloads = {
+        "empty coroutine": lambda: asyncio.sleep(0),
+        "api call": lambda: client.make_request(path="/agents/agent-1"),
+    }
+    runners = {
+        "loop per call": _per_call_loop,
+        "thread+loop per call": _per_call_thread,
+        "background loop": run_sync,
+    }
+
+    print(f"calls={calls}")
+    for workload, make_coro in workloads.items():
+        for label, runner in runners.items():
+            before = server.connections
+            per_call = _measure(runner, make_coro, calls)
+            opened = server.connections - before
+            print(f"{workload:16} {label:21}: {per_call * 1e6:9.1f} us/call, {opened} connections")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+    main(calls=args.calls)
@@ -0,0 +1,75 @@
+"""
+Minimal local HTTP/1.1 stub server used by the SDK benchmarks.
+
+Serves a fixed JSON body for every request and honours keep-alive, so the
+benchmarks measure client-side overhead (connection setup, pooling, parsing)
+without depending on the xpander.ai backend.
+"""
+
+import asyncio
+import json
+from typing import Any, Optional
+
+
+class StubServer:
+    """
+    Async context manager running a keep-alive JSON stub server on localhost.
+
+    Example:
+        >>> async with StubServer(body={"ok": True}) as server:
+        ...     print(server.base_url)
+    """
+
+    def __init__(self, body: Optional[Any] = None, delay: float = 0.0):
+        self.body = json.dumps(body if body is not None else {"ok": True}).encode()
+        self.delay = delay
+        self.requests = 0
+        self.connections = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def __aenter__(self) -> "StubServer":
+        while True:
+            self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+            # Configuration.get_full_url treats "9016" in the URL as the agent controller
+            if "9016" not in self.base_url:
+                return self
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aexit__(self, *_exc) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                content_length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        content_length = int(line.split(b":", 1)[1])
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                self.requests += 1
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Connection: keep-alive\r\n"
+                    + f"Content-Length: {len(self.body)}\r\n\r\n".encode()
+                    + self.body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
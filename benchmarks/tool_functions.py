@@ -0,0 +1,68 @@
+"""
+Benchmark: building `ToolsRepository.functions` for a large agent.
+
+Reports the time to build the tool functions of a synthetic agent:
+- cold: no cached schema or wrappers (first task of a worker, or the cost
+  previously paid on every access),
+- new repository: a fresh agent with the same tool definitions (every later
+  task, since agents are rebuilt per task),
+- same repository: repeated access on the same agent.
+
+Usage:
+    python benchmarks/tool_functions.py --tools 500
+"""
+
+import argparse
+import time
+
+from xpander_sdk.modules.tools_repository import tools_repository_module
+from xpander_sdk.modules.tools_repository.sub_modules import tool as tool_module
+from xpander_sdk.modules.tools_repository.tools_repository_module import ToolsRepository
+
+
+def _tool_definitions(count: int) -> list[dict]:
+    parameters = {
+        "type": "object",
+        "properties": {
+            "body_params": {
+                "type": "object",
+                "properties": {f"field_{i}": {"type": "string", "description": "x" * 40} for i in range(10)},
+                "required": ["field_0"],
+            },
+            "query_params": {"type": "object", "properties": {"limit": {"type": "integer"}}},
+        },
+    }
+    return [
+        {"id": f"tool-{i}", "name": f"tool_{i}", "method": "POST", "path": "/x", "description": "does things " * 10, "parameters": parameters}
+        for i in range(count)
+    ]
+
+
+def _build(definitions: list[dict], repository: ToolsRepository = None) -> tuple[float, ToolsRepository]:
+    repository = repository or ToolsRepository(tools=definitions)
+    started = time.perf_counter()
+    functions = repository.functions
+    assert len(functions) == len(definitions)
+    return time.perf_counter() - started, repository
+
+
+def main(tools: int) -> None:
+    definitions = _tool_definitions(tools)
+
+    tool_module._build_tool_schema.cache_clear()
+    tools_repository_module._describe_tool_schema.cache_clear()
+    cold, _ = _build(definitions)
+    fresh, repository = _build(definitions)
+    same, _ = _build(definitions, repository)
+
+    print(f"tools={tools}")
+    print(f"cold            : {cold * 1000:9.1f} ms")
+    print(f"new repository  : {fresh * 1000:9.1f} ms")
+    print(f"same repository : {same * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=500)
+    args = parser.parse_args()
+    main(tools=args.tools)
@@ -0,0 +1,77 @@
+"""
+Benchmark: per-invocation payload validation cost of `Tool.schema`.
+
+`Tool.ainvoke` validates the payload against `tool.schema`. The previous
+implementation rebuilt the pydantic model on every access; it is now memoized
+on the tool definition. This script invokes every tool of a synthetic agent
+once and reports the validation cost per invocation, with and without the
+cache.
+
+Usage:
+    python benchmarks/tool_schema.py --tools 200 --rounds 5
+"""
+
+import argparse
+import time
+
+from xpander_sdk.modules.tools_repository.sub_modules import tool as tool_module
+from xpander_sdk.modules.tools_repository.sub_modules.tool import Tool
+
+
+def _tools(count: int) -> list[Tool]:
+    parameters = {
+        "type": "object",
+        "properties": {
+            "body_params": {
+                "type": "object",
+                "properties": {f"field_{i}": {"type": "string", "description": "x" * 40} for i in range(10)},
+                "required": ["field_0"],
+            },
+            "query_params": {"type": "object", "properties": {"limit": {"type": "integer"}}},
+        },
+    }
+    return [
+        Tool(id=f"tool-{i}", name=f"tool_{i}", method="POST", path="/x", parameters=parameters)
+        for i in range(count)
+    ]
+
+
+def _validate_all(tools: list[Tool]) -> None:
+    payload = {"body_params": {"field_0": "value"}, "query_params": {"limit": 10}}
+    for tool in tools:
+        # same accesses as Tool.ainvoke
+        if tool.schema and payload:
+            tool.schema.model_validate(payload)
+
+
+def _per_invocation(tools: list[Tool], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        _validate_all(tools)
+    return (time.perf_counter() - started) / (rounds * len(tools))
+
+
+def main(tools: int, rounds: int) -> None:
+    agent_tools = _tools(tools)
+    cached = tool_module._build_tool_schema
+
+    tool_module._build_tool_schema = cached.__wrapped__
+    uncached = _per_invocation(agent_tools, rounds)
+
+    tool_module._build_tool_schema = cached
+    cached.cache_clear()
+    cold = _per_invocation(agent_tools, 1)
+    warm = _per_invocation(agent_tools, rounds)
+
+    print(f"tools={tools} rounds={rounds}")
+    print(f"rebuilt per access : {uncached * 1e6:9.1f} us/invocation")
+    print(f"cached (first call): {cold * 1e6:9.1f} us/invocation")
+    print(f"cached (warm)      : {warm * 1e6:9.1f} us/invocation")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(tools=args.tools, rounds=args.rounds)
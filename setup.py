@@ -28,6 +28,7 @@ setup(
     ],
     extras_require={
         "agno": ["agno==2.5.9", "sqlalchemy" ,"psycopg[binary,pool]", "greenlet"],
+        "http2": ["h2>=4.1.0"],
         "dev": ["black", "pre-commit", "pytest", "anthropic", "mcp", "openai", "fireworks-ai", "aioboto3", "google-genai", "azure-ai-inference", "aiohttp"],
     },
     classifiers=[
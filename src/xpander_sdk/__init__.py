@@ -32,6 +32,8 @@ from xpander_sdk.modules.events.decorators.on_tool import on_tool_before, on_too
 
 # Tools and repository imports
 from .modules.tools_repository.tools_repository_module import ToolsRepository, Tool
+from .modules.tools_repository.models.tool_execution import ToolExecutionClass, ToolExecutorStats, ToolLimits
+from .modules.tools_repository.models.tool_invocation_request import ToolInvocationRequest
 from .modules.tools_repository.models.tool_invocation_result import ToolInvocationResult
 from .modules.tools_repository.utils.schemas import build_model_from_schema
 from .models.user import User
@@ -72,6 +74,10 @@ __all__ = [
     # Tools and repository
     "ToolsRepository",
     "Tool",
+    "ToolExecutionClass",
+    "ToolExecutorStats",
+    "ToolLimits",
+    "ToolInvocationRequest",
     "ToolInvocationResult",
     "MCPServerDetails",
     "MCPServerType",
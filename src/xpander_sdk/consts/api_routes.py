@@ -5,7 +5,10 @@ This module defines all API endpoint paths used by the xpander.ai SDK for
 autonomous agent management, task operations, and knowledge base interactions.
 """
 
+import re
 from enum import Enum
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple
 
 
 class APIRoute(str, Enum):
@@ -75,3 +78,46 @@ and deleting resources.
 
     def __repr__(self) -> str:
         return str(self.value)
+
+    @classmethod
+    def match(cls, path: str) -> Optional["APIRoute"]:
+        """
+        Resolve the route template a concrete (already formatted) path belongs to.
+
+        When several templates match, the most specific one (fewest placeholders,
+        longest literal part) wins, e.g. "/knowledge_bases/create" resolves to
+        `CreateKnowledgeBase` rather than `KnowledgeBaseDocumentsCrud`.
+
+        Args:
+            path (str): Request path, e.g. "/agents/agent-123/db".
+
+        Returns:
+            Optional[APIRoute]: The matching route, or None for unknown paths.
+
+        Example:
+            >>> APIRoute.match("/agent-execution/task-1/status")
+            /agent-execution/{task_id}/status
+        """
+        return _match_route(path.split("?", 1)[0].rstrip("/") or "/")
+
+
+_PLACEHOLDER = re.compile(r"\{[^}]+\}")
+
+
+@lru_cache(maxsize=None)
+def _route_patterns() -> List[Tuple[Pattern, APIRoute]]:
+    patterns = []
+    for route in APIRoute:
+        literals = _PLACEHOLDER.split(route.value)
+        regex = "[^/]+".join(re.escape(literal) for literal in literals)
+        specificity = (len(literals) - 1, -sum(len(literal) for literal in literals))
+        patterns.append((specificity, re.compile(f"^{regex}$"), route))
+    return [(pattern, route) for _, pattern, route in sorted(patterns, key=lambda p: p[0])]
+
+
+@lru_cache(maxsize=1024)
+def _match_route(path: str) -> Optional[APIRoute]:
+    for pattern, route in _route_patterns():
+        if pattern.match(path):
+            return route
+    return None
@@ -0,0 +1,236 @@
+"""
+Background reporting for the xpander.ai SDK.
+
+Fire-and-forget API calls (graph preflight reports, tool-call monitoring) are
+queued and sent in batches by a worker running on the SDK's background event
+loop, so they stay off the critical path of the caller and survive the
+caller's event loop.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+from collections import deque
+from os import getenv
+from typing import Any, Awaitable, Callable, Deque, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+
+from xpander_sdk.utils.event_loop import get_background_loop
+
+Report = Callable[[], Awaitable[Any]]
+
+
+class ReporterStats(BaseModel):
+    """
+    Snapshot of reporter counters.
+
+    Attributes:
+        submitted (int): Reports accepted into the queue.
+        sent (int): Reports sent successfully.
+        failed (int): Reports that raised (logged and dropped).
+        inline (int): Reports sent by the caller because the queue was full.
+        pending (int): Reports queued or in flight.
+    """
+
+    submitted: int = 0
+    sent: int = 0
+    failed: int = 0
+    inline: int = 0
+    pending: int = 0
+
+
+class BackgroundReporter:
+    """
+    Bounded, batching queue of fire-and-forget reports.
+
+    Reports are coroutine factories. They are sent concurrently in batches of
+    `batch_size`, as soon as a batch is full or `flush_interval` seconds after
+    the first queued report. When the queue is full, `asubmit` sends the report
+    itself, which slows producers down to the reporting rate (backpressure)
+    instead of dropping reports or growing without bound.
+
+    Args:
+        name (str): Name used in logs.
+        max_queue_size (int): Maximum queued reports.
+        batch_size (int): Reports sent concurrently per batch.
+        flush_interval (float): Maximum seconds a report waits for its batch to fill.
+
+    Example:
+        >>> await telemetry_reporter.asubmit(lambda: client.make_request(path=..., method="POST"))
+        >>> await telemetry_reporter.adrain(timeout=5)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_queue_size: int = 1000,
+        batch_size: int = 20,
+        flush_interval: float = 0.2,
+    ):
+        self.name = name
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: Deque[Report] = deque()
+        self._lock = threading.Lock()
+        self._stats = ReporterStats()
+        self._in_flight = 0
+        self._worker: Optional[concurrent.futures.Future] = None
+        self._worker_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def _reset_after_fork(self) -> None:
+        # queued reports belong to the parent, which still sends them
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._worker, self._worker_loop, self._wakeup = None, None, None
+
+    async def asubmit(self, report: Report) -> None:
+        """
+        Queue a report, or send it right away if the queue is full.
+
+        Args:
+            report (Report): Factory of the coroutine sending the report.
+        """
+        if self._offer(report):
+            return
+        with self._lock:
+            self._stats.inline += 1
+        await self._send(report)
+
+    def _offer(self, report: Report) -> bool:
+        with self._lock:
+            if len(self._queue) >= self.max_queue_size:
+                return False
+            self._queue.append(report)
+            self._stats.submitted += 1
+            batch_ready = len(self._queue) >= self.batch_size
+            loop = get_background_loop()
+            # a worker bound to another loop is gone (e.g. after fork)
+            if self._worker is None or self._worker.done() or self._worker_loop is not loop:
+                # run in a fresh context: the submitter's context carries its task deadline,
+                # which must not apply to reports queued later by other tasks
+                self._worker = contextvars.Context().run(
+                    asyncio.run_coroutine_threadsafe, self._run(), loop
+                )
+                self._worker_loop = loop
+                return True
+        if batch_ready:
+            loop.call_soon_threadsafe(self._wake)
+        return True
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _take_batch(self) -> list:
+        with self._lock:
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            self._in_flight += len(batch)
+            return batch
+
+    async def _send_batch(self, batch: list) -> None:
+        try:
+            await asyncio.gather(*(self._send(report) for report in batch))
+        finally:
+            with self._lock:
+                self._in_flight -= len(batch)
+
+    async def _send(self, report: Report) -> None:
+        try:
+            await report()
+            with self._lock:
+                self._stats.sent += 1
+        except Exception as e:
+            with self._lock:
+                self._stats.failed += 1
+            logger.warning(f"Failed to send {self.name} report - {str(e)}")
+
+    async def _run(self) -> None:
+        self._wakeup = asyncio.Event()
+        while True:
+            with self._lock:
+                batch_ready = len(self._queue) >= self.batch_size
+            if not batch_ready:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+            batch = self._take_batch()
+            if not batch:
+                with self._lock:
+                    if not self._queue:
+                        # idle: the next report starts a new worker
+                        self._worker = None
+                        return
+                continue
+            await self._send_batch(batch)
+
+    async def _adrain(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch:
+                await self._send_batch(batch)
+                continue
+            with self._lock:
+                if not self._queue and not self._in_flight:
+                    return
+            await asyncio.sleep(0.01)  # a batch is still in flight
+
+    async def adrain(self, timeout: Optional[float] = None) -> None:
+        """
+        Send every queued report and wait for reports in flight.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait.
+
+        Raises:
+            asyncio.TimeoutError: If the reports were not sent within `timeout`.
+        """
+        future = contextvars.Context().run(
+            asyncio.run_coroutine_threadsafe, self._adrain(), get_background_loop()
+        )
+        await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Synchronously send every queued report and wait for reports in flight.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the reports were not sent within `timeout`.
+        """
+        contextvars.Context().run(
+            asyncio.run_coroutine_threadsafe, self._adrain(), get_background_loop()
+        ).result(timeout=timeout)
+
+    @property
+    def stats(self) -> ReporterStats:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            ReporterStats: Current counters.
+        """
+        with self._lock:
+            return self._stats.model_copy(update={"pending": len(self._queue) + self._in_flight})
+
+
+# shared by the SDK's fire-and-forget reports (graph preflight, tool monitoring)
+telemetry_reporter = BackgroundReporter(
+    name="telemetry",
+    max_queue_size=int(getenv("XPANDER_REPORTER_QUEUE_SIZE", "1000")),
+    batch_size=int(getenv("XPANDER_REPORTER_BATCH_SIZE", "20")),
+    flush_interval=float(getenv("XPANDER_REPORTER_FLUSH_INTERVAL", "0.2")),
+)
@@ -0,0 +1,131 @@
+"""
+Shared HTTP connection pools for the xpander.ai SDK.
+
+This module keeps long-lived `httpx.AsyncClient` instances so consecutive API
+calls reuse keep-alive connections instead of paying a new TCP/TLS handshake
+per request. An AsyncClient is bound to the event loop it was first used on,
+so clients are kept per event loop and per connection pool settings.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from xpander_sdk.models.configuration import Configuration, ConnectionPoolSettings
+
+
+class HTTPClientPool:
+    """
+    Registry of pooled `httpx.AsyncClient` instances.
+
+    Clients are keyed by the running event loop and by the connection pool
+    settings of the configuration, so all configurations with identical
+    settings share one pool per loop. Entries belonging to closed loops are
+    discarded lazily.
+
+    Example:
+        >>> client = HTTPClientPool.get_client(configuration)
+        >>> response = await client.get("https://inbound.xpander.ai/agents/list")
+        >>> await HTTPClientPool.aclose()
+    """
+
+    _clients: Dict[int, Tuple[asyncio.AbstractEventLoop, Dict[tuple, httpx.AsyncClient]]] = {}
+    _lock = threading.Lock()
+    _http2_available: Optional[bool] = None
+
+    @classmethod
+    def get_client(cls, configuration: Optional[Configuration] = None) -> httpx.AsyncClient:
+        """
+        Return the pooled client for the running event loop and configuration.
+
+        Args:
+            configuration (Optional[Configuration]): Configuration whose connection
+                pool settings select the pool. Defaults to the default settings.
+
+        Returns:
+            httpx.AsyncClient: A long-lived client bound to the running loop.
+
+        Raises:
+            RuntimeError: If called without a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        settings = (
+            configuration.connection_pool
+            if configuration and configuration.connection_pool
+            else ConnectionPoolSettings()
+        )
+        key = settings.pool_key()
+
+        with cls._lock:
+            cls._purge_closed_loops()
+            _, loop_clients = cls._clients.setdefault(id(loop), (loop, {}))
+            client = loop_clients.get(key)
+            if client is None or client.is_closed:
+                client = cls._create_client(settings)
+                loop_clients[key] = client
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Close all pooled clients bound to the running event loop.
+
+        Safe to call multiple times; the next request simply opens a new pool.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            entry = cls._clients.pop(id(loop), None)
+        if not entry:
+            return
+        _, loop_clients = entry
+        await asyncio.gather(
+            *(client.aclose() for client in loop_clients.values()),
+            return_exceptions=True,
+        )
+
+    @classmethod
+    def _purge_closed_loops(cls) -> None:
+        for loop_id in [
+            loop_id for loop_id, (loop, _) in cls._clients.items() if loop.is_closed()
+        ]:
+            del cls._clients[loop_id]
+
+    @classmethod
+    def _create_client(cls, settings: ConnectionPoolSettings) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=settings.http2 and cls._is_http2_available(),
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+        )
+
+    @classmethod
+    def _is_http2_available(cls) -> bool:
+        if cls._http2_available is None:
+            try:
+                import h2  # noqa: F401
+
+                cls._http2_available = True
+            except ImportError:
+                logger.warning(
+                    "HTTP/2 requested but the 'h2' package is not installed, falling back to HTTP/1.1. "
+                    "Run `pip install xpander-sdk[http2]`."
+                )
+                cls._http2_available = False
+        return cls._http2_available
+
+
+def _reset_after_fork() -> None:
+    # pooled connections belong to the parent; the child opens its own
+    HTTPClientPool._clients = {}
+    HTTPClientPool._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
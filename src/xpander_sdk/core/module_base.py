@@ -34,13 +34,14 @@ class ModuleBase(ABC):
 
     _shared_instances: Dict[Type['ModuleBase'], 'ModuleBase'] = {}
 
-    def __new__(cls, configuration: Optional[Configuration] = None):
+    def __new__(cls, configuration: Optional[Configuration] = None, *args, **kwargs):
         """
         Create or return an existing module singleton instance.
         
         Args:
             configuration (Optional[Configuration]): If provided, a new independent
                 instance is created. Otherwise, returns a singleton per class.
+            *args, **kwargs: Further arguments of the subclass initializer, ignored here.
                 
         Returns:
             ModuleBase: The module instance.
@@ -0,0 +1,166 @@
+"""
+Client-side concurrency and rate limiting for the xpander.ai SDK.
+
+A `RateLimiter` caps the number of concurrent calls (semaphore) and their
+rate (token bucket). Its state is guarded by a thread lock rather than bound
+to an event loop, so one limiter applies to calls made from the caller's loop
+and from the SDK's background loop (sync calls) alike.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class RateLimiterStats(BaseModel):
+    """
+    Snapshot of limiter counters.
+
+    Attributes:
+        in_flight (int): Calls holding a slot.
+        queued (int): Calls waiting for a concurrency slot.
+        acquired (int): Calls admitted so far.
+        throttled (int): Calls delayed by the rate limit.
+        wait_seconds (float): Total time calls spent waiting to be admitted.
+    """
+
+    in_flight: int = 0
+    queued: int = 0
+    acquired: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+
+
+def _grant(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class RateLimiter:
+    """
+    Concurrency cap plus token bucket, usable as an async context manager.
+
+    Waiters are admitted in FIFO order. The token bucket starts full and
+    refills at `rate` tokens per second up to `burst`; a call that finds it
+    empty reserves the next token and sleeps until it is due, so delayed calls
+    are spread evenly instead of retrying in bursts.
+
+    Args:
+        max_concurrency (Optional[int]): Maximum concurrent calls, None for unlimited.
+        rate (Optional[float]): Sustained calls per second, None for unlimited.
+        burst (Optional[int]): Calls allowed at once before the rate applies.
+            Defaults to `max(1, rate)`.
+
+    Example:
+        >>> limiter = RateLimiter(max_concurrency=4, rate=10)
+        >>> async with limiter:
+        ...     await call_upstream()
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._stats = RateLimiterStats()
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot, then for a rate token."""
+        started = time.monotonic()
+        await self._acquire_slot()
+        try:
+            await self._acquire_token()
+        except BaseException:
+            self.release()
+            raise
+        with self._lock:
+            self._stats.acquired += 1
+            self._stats.wait_seconds += time.monotonic() - started
+
+    async def _acquire_slot(self) -> None:
+        if self.max_concurrency is None:
+            with self._lock:
+                self._in_flight += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self.max_concurrency and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    granted = False
+                except ValueError:
+                    granted = True  # the slot was handed over before the cancellation
+            if granted:
+                self.release()
+            raise
+
+    async def _acquire_token(self) -> None:
+        if self.rate is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens -= 1  # negative tokens are reservations of future refills
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if delay:
+                self._stats.throttled += 1
+        if delay:
+            await asyncio.sleep(delay)
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next waiter if any."""
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._in_flight -= 1
+                    return
+                loop, future = self._waiters.popleft()  # the slot moves to the waiter
+            try:
+                loop.call_soon_threadsafe(_grant, future)
+                return
+            except RuntimeError:
+                continue  # the waiter's loop is closed, try the next one
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        self.release()
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            RateLimiterStats: Current counters.
+        """
+        with self._lock:
+            return self._stats.model_copy(
+                update={"in_flight": self._in_flight, "queued": len(self._waiters)}
+            )
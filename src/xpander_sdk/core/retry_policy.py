@@ -0,0 +1,308 @@
+"""
+Retry policy for xpander.ai API requests.
+
+This module provides the pluggable retry policy used by `APIClient.make_request`:
+exponential backoff with full jitter, a retry budget per sliding time window,
+idempotency-aware retry decisions and per-route overrides keyed on `APIRoute`.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import ClassVar, Deque, Dict, Mapping, Optional, Set
+
+import httpx
+from pydantic import BaseModel, Field, PrivateAttr
+
+from xpander_sdk.consts.api_routes import APIRoute
+
+# Errors raised before the request reached the server - always safe to retry
+_CONNECTION_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryStats(BaseModel):
+    """
+    Snapshot of retry counters.
+
+    Attributes:
+        requests (int): Logical requests issued.
+        attempts (int): HTTP attempts sent, including retries.
+        retries (int): Retries performed.
+        exhausted (int): Requests that failed after the last allowed attempt.
+        budget_rejections (int): Retries skipped because the retry budget was spent.
+    """
+
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    budget_rejections: int = 0
+
+    @property
+    def amplification(self) -> float:
+        """
+        Ratio of HTTP attempts to logical requests (1.0 means no retries).
+
+        Returns:
+            float: The retry amplification factor.
+        """
+        return self.attempts / self.requests if self.requests else 1.0
+
+
+class RetryPolicy(BaseModel):
+    """
+    Retry policy applied by `APIClient` to failed requests.
+
+    Transient failures (connection errors, timeouts and the statuses in
+    `retry_on_status`) are retried with exponential backoff and full jitter,
+    honouring `Retry-After` when the server sends it. Only idempotent requests
+    are retried: methods in `idempotent_methods`, or any request carrying the
+    `idempotency_header`. Connection failures are always retried since the
+    request never reached the server.
+
+    Retries are capped by a budget shared by all requests using the policy
+    (`budget_max_retries` per `budget_window_seconds`), so an outage does not
+    multiply the load on the backend. Counters are exposed via `stats` and
+    `stats_by_route`.
+
+    Subclass and override `should_retry` / `get_delay` to plug in custom logic,
+    and pass the instance through `Configuration(retry_policy=...)`.
+
+    Attributes:
+        max_attempts (int): Maximum attempts per request, including the first one.
+        backoff_base (float): Base backoff in seconds, doubled on every attempt.
+        backoff_max (float): Upper bound of a single backoff in seconds.
+        jitter (bool): Apply full jitter to the backoff.
+        respect_retry_after (bool): Honour the `Retry-After` response header.
+        retry_on_status (Set[int]): Response statuses considered transient.
+        idempotent_methods (Set[str]): Methods retried without an idempotency key.
+        idempotency_header (str): Header marking a non-idempotent request as safe to retry.
+        budget_max_retries (int): Maximum retries per budget window.
+        budget_window_seconds (float): Length of the retry budget window in seconds.
+        route_overrides (Dict[APIRoute, RetryPolicy]): Per-route policies. Budget and
+            counters are always tracked by the policy owning the overrides.
+
+    Example:
+        >>> policy = RetryPolicy(
+        ...     max_attempts=5,
+        ...     route_overrides={APIRoute.InvokeTool: RetryPolicy(max_attempts=1)},
+        ... )
+        >>> config = Configuration(retry_policy=policy)
+        >>> policy.stats.amplification
+        1.0
+    """
+
+    max_attempts: int = Field(default=3, ge=1)
+    backoff_base: float = Field(default=0.5, ge=0)
+    backoff_max: float = Field(default=10.0, ge=0)
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_on_status: Set[int] = Field(
+        default_factory=lambda: {408, 425, 429, 500, 502, 503, 504}
+    )
+    idempotent_methods: Set[str] = Field(
+        default_factory=lambda: {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+    idempotency_header: str = "Idempotency-Key"
+    budget_max_retries: int = Field(default=100, ge=0)
+    budget_window_seconds: float = Field(default=60.0, gt=0)
+    route_overrides: Dict[APIRoute, "RetryPolicy"] = Field(default_factory=dict)
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _retry_timestamps: Deque[float] = PrivateAttr(default_factory=deque)
+    _stats: RetryStats = PrivateAttr(default_factory=RetryStats)
+    _stats_by_route: Dict[str, RetryStats] = PrivateAttr(default_factory=dict)
+
+    _default: ClassVar[Optional["RetryPolicy"]] = None
+
+    @classmethod
+    def default(cls) -> "RetryPolicy":
+        """
+        Return the process-wide policy used when a configuration sets none.
+
+        Returns:
+            RetryPolicy: The shared default policy.
+        """
+        if RetryPolicy._default is None:
+            RetryPolicy._default = RetryPolicy()
+        return RetryPolicy._default
+
+    def for_route(self, route: Optional[APIRoute]) -> "RetryPolicy":
+        """
+        Return the policy governing retry decisions for a route.
+
+        Args:
+            route (Optional[APIRoute]): Route of the request, if known.
+
+        Returns:
+            RetryPolicy: The route override, or this policy.
+        """
+        if route is not None and route in self.route_overrides:
+            return self.route_overrides[route]
+        return self
+
+    def is_idempotent(self, method: str, headers: Optional[Mapping[str, str]] = None) -> bool:
+        """
+        Check whether a request may be sent more than once.
+
+        Args:
+            method (str): HTTP method.
+            headers (Optional[Mapping[str, str]]): Request headers.
+
+        Returns:
+            bool: True for idempotent methods or requests with an idempotency key.
+        """
+        if method.upper() in self.idempotent_methods:
+            return True
+        header = self.idempotency_header.lower()
+        return any(key.lower() == header for key in (headers or {}))
+
+    def is_transient(
+        self,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Check whether an attempt failed in a way worth retrying.
+
+        Args:
+            response (Optional[httpx.Response]): Response of the attempt, if any.
+            error (Optional[Exception]): Transport error of the attempt, if any.
+
+        Returns:
+            bool: True for transport errors and statuses in `retry_on_status`.
+        """
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.retry_on_status
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        headers: Optional[Mapping[str, str]] = None,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Decide whether a failed attempt should be retried.
+
+        Args:
+            method (str): HTTP method.
+            attempt (int): Number of the attempt that just finished (1-based).
+            headers (Optional[Mapping[str, str]]): Request headers.
+            response (Optional[httpx.Response]): Response of the attempt, if any.
+            error (Optional[Exception]): Transport error of the attempt, if any.
+
+        Returns:
+            bool: True if another attempt should be made.
+        """
+        if attempt >= self.max_attempts or not self.is_transient(response, error):
+            return False
+        if isinstance(error, _CONNECTION_ERRORS):
+            return True
+        return self.is_idempotent(method, headers)
+
+    def get_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Compute the backoff before the next attempt.
+
+        Args:
+            attempt (int): Number of the attempt that just finished (1-based).
+            response (Optional[httpx.Response]): Response of the attempt, if any.
+
+        Returns:
+            float: Seconds to wait before retrying.
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+
+        delay = min(self.backoff_base * (2 ** (attempt - 1)), self.backoff_max)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def acquire_retry(self, route: Optional[APIRoute] = None) -> bool:
+        """
+        Take one retry from the budget and record it.
+
+        Args:
+            route (Optional[APIRoute]): Route of the request, if known.
+
+        Returns:
+            bool: False if the budget of the current window is spent.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._retry_timestamps and now - self._retry_timestamps[0] > self.budget_window_seconds:
+                self._retry_timestamps.popleft()
+            if len(self._retry_timestamps) >= self.budget_max_retries:
+                self._increment(route, "budget_rejections")
+                return False
+            self._retry_timestamps.append(now)
+            self._increment(route, "retries")
+            return True
+
+    def record(self, event: str, route: Optional[APIRoute] = None) -> None:
+        """
+        Increment a counter of this policy.
+
+        Args:
+            event (str): One of "requests", "attempts" or "exhausted".
+            route (Optional[APIRoute]): Route of the request, if known.
+        """
+        with self._lock:
+            self._increment(route, event)
+
+    @property
+    def stats(self) -> RetryStats:
+        """
+        Snapshot of the counters across all routes.
+
+        Returns:
+            RetryStats: Current counters.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    @property
+    def stats_by_route(self) -> Dict[str, RetryStats]:
+        """
+        Snapshot of the counters per route template.
+
+        Requests to paths not matching any `APIRoute` are reported under "other".
+
+        Returns:
+            Dict[str, RetryStats]: Current counters keyed by route template.
+        """
+        with self._lock:
+            return {route: stats.model_copy() for route, stats in self._stats_by_route.items()}
+
+    def reset_stats(self) -> None:
+        """Reset all counters and the retry budget."""
+        with self._lock:
+            self._stats = RetryStats()
+            self._stats_by_route.clear()
+            self._retry_timestamps.clear()
+
+    def _increment(self, route: Optional[APIRoute], event: str) -> None:
+        route_stats = self._stats_by_route.setdefault(
+            route.value if route else "other", RetryStats()
+        )
+        for stats in (self._stats, route_stats):
+            setattr(stats, event, getattr(stats, event) + 1)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
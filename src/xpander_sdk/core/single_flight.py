@@ -0,0 +1,137 @@
+"""
+Request coalescing (single-flight) for the xpander.ai SDK.
+
+This module collapses concurrent identical calls into one: the first caller
+performs the call, and every caller arriving while it is in flight awaits the
+same result instead of issuing its own network request.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from pydantic import BaseModel
+
+from xpander_sdk.core.timeouts import DeadlineExceededError, remaining_time, without_deadline
+
+
+class SingleFlightStats(BaseModel):
+    """
+    Snapshot of single-flight counters.
+
+    Attributes:
+        leaders (int): Calls actually performed.
+        coalesced (int): Calls saved by joining an identical in-flight call.
+    """
+
+    leaders: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into a single execution.
+
+    Calls are grouped by key and by event loop. The shared call runs in its own
+    task, so cancelling one of the callers does not cancel it for the others.
+    It runs without a deadline; instead every caller waits for it only until
+    its own deadline passes, so callers with different deadlines can share it.
+    When the last caller stops waiting (deadline or cancellation), the shared
+    call is cancelled, as nobody would read its result.
+    Once it completes, the next call with the same key executes again; nothing
+    is cached.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(10)))
+        >>> flight.stats.coalesced
+        9
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self._lock = threading.Lock()
+        self._stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fn`, or join the identical call already in flight.
+
+        Args:
+            key (Hashable): Identity of the call.
+            fn (Callable[[], Awaitable[Any]]): Factory of the coroutine performing the call.
+
+        Returns:
+            Any: The result of the shared call. Exceptions are propagated to every caller.
+
+        Raises:
+            DeadlineExceededError: When the caller's deadline passes before the shared call completes.
+        """
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceededError("Deadline exceeded before the coalesced call")
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            with self._lock:
+                self._stats.coalesced += 1
+            return await self._wait(flight_key, future)
+
+        # the shared call must not inherit the deadline of whichever caller started it
+        with without_deadline():
+            future = loop.create_task(fn())
+        self._inflight[flight_key] = future
+        future.add_done_callback(lambda done: self._release(flight_key, done))
+        with self._lock:
+            self._stats.leaders += 1
+        return await self._wait(flight_key, future)
+
+    async def _wait(self, flight_key: Tuple[int, Hashable], future: asyncio.Future) -> Any:
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            remaining = remaining_time()
+            if remaining is None:
+                return await asyncio.shield(future)
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout=remaining)
+            except asyncio.TimeoutError:
+                if future.done():
+                    raise  # raised by the shared call itself
+                raise DeadlineExceededError("Deadline exceeded during the coalesced call")
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+                if not future.done():
+                    # the last caller left: stop the call and let the next one start afresh
+                    self._drop(flight_key, future)
+                    future.cancel()
+
+    def _drop(self, flight_key: Tuple[int, Hashable], future: asyncio.Future) -> None:
+        if self._inflight.get(flight_key) is future:
+            del self._inflight[flight_key]
+
+    def _release(self, flight_key: Tuple[int, Hashable], future: asyncio.Future) -> None:
+        self._drop(flight_key, future)
+        if not future.cancelled():
+            future.exception()  # mark as retrieved in case every caller was cancelled
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            SingleFlightStats: Current counters.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        """Reset the counters."""
+        with self._lock:
+            self._stats = SingleFlightStats()
@@ -0,0 +1,178 @@
+"""
+Request timeouts and deadline propagation for xpander.ai API requests.
+
+This module provides the per-route timeout table used by `APIClient`, and a
+context-local deadline that caps every API call made within its scope, so a
+task-level deadline bounds all nested requests.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+
+from xpander_sdk.consts.api_routes import APIRoute
+
+# Absolute deadline (time.monotonic based) of the current context
+_deadline: ContextVar[Optional[float]] = ContextVar("xpander_deadline", default=None)
+
+
+class DeadlineExceededError(httpx.TimeoutException):
+    """Raised when an API request is attempted after the context deadline passed."""
+
+
+class RouteTimeout(BaseModel):
+    """
+    Timeouts of a single route, in seconds.
+
+    Attributes:
+        connect (float): Time to establish a connection.
+        read (float): Time to wait for a chunk of the response.
+        write (float): Time to send a chunk of the request.
+        pool (float): Time to wait for a free connection from the pool.
+    """
+
+    connect: float = 10.0
+    read: float = 300.0
+    write: float = 60.0
+    pool: float = 30.0
+
+    def to_httpx(self, cap: Optional[float] = None) -> httpx.Timeout:
+        """
+        Convert to an `httpx.Timeout`, optionally capping every phase.
+
+        Args:
+            cap (Optional[float]): Upper bound for each phase, e.g. the remaining deadline.
+
+        Returns:
+            httpx.Timeout: The timeout to pass to httpx.
+        """
+        values = (self.connect, self.read, self.write, self.pool)
+        if cap is not None:
+            values = tuple(min(value, cap) for value in values)
+        connect, read, write, pool = values
+        return httpx.Timeout(connect=connect, read=read, write=write, pool=pool)
+
+
+_FAST = RouteTimeout(connect=5.0, read=15.0, write=15.0, pool=10.0)
+_LONG = RouteTimeout(connect=10.0, read=1200.0, write=60.0, pool=30.0)
+
+DEFAULT_ROUTE_TIMEOUTS: Dict[APIRoute, RouteTimeout] = {
+    # metadata & status lookups
+    APIRoute.ListAgent: _FAST,
+    APIRoute.GetAgent: _FAST,
+    APIRoute.CheckAgentLLMEligibility: _FAST,
+    APIRoute.GetAgentConnectionString: _FAST,
+    APIRoute.GetTask: _FAST,
+    APIRoute.UpdateTask: _FAST,
+    APIRoute.ReportExecutionMetrics: _FAST,
+    APIRoute.PushExecutionEventToQueue: _FAST,
+    APIRoute.GetKnowledgeBaseDetails: _FAST,
+    APIRoute.GetUserMCPAuthToken: _FAST,
+    APIRoute.HITLApprove: _FAST,
+    APIRoute.HITLReject: _FAST,
+    APIRoute.GetOrgDefaultLLMExtraHeaders: _FAST,
+    APIRoute.GetOrSetAgenticContext: _FAST,
+    # tool invocation & execution
+    APIRoute.InvokeTool: _LONG,
+    APIRoute.GetOrInvokeToolById: _LONG,
+    APIRoute.GetOrInvokeToolByUUID: _LONG,
+    APIRoute.ExecuteCodeInSandbox: _LONG,
+    APIRoute.TaskCrud: _LONG,
+    APIRoute.HITLRequest: _LONG,
+}
+
+
+class TimeoutSettings(BaseModel):
+    """
+    Timeout table for API requests keyed by `APIRoute`.
+
+    Metadata and status routes default to short timeouts so a hung call fails
+    fast, while tool invocation and execution routes keep long ones. Routes
+    missing from the table, and paths not matching any route, use `default`.
+
+    Attributes:
+        default (RouteTimeout): Timeouts of routes not listed in `routes`.
+        routes (Dict[APIRoute, RouteTimeout]): Per-route timeouts, merged over the defaults.
+
+    Example:
+        >>> config = Configuration(
+        ...     timeouts=TimeoutSettings(routes={APIRoute.GetTask: RouteTimeout(read=5)})
+        ... )
+    """
+
+    default: RouteTimeout = Field(default_factory=RouteTimeout)
+    routes: Dict[APIRoute, RouteTimeout] = Field(default_factory=dict)
+
+    def for_route(self, route: Optional[APIRoute]) -> RouteTimeout:
+        """
+        Return the timeouts of a route.
+
+        Args:
+            route (Optional[APIRoute]): Route of the request, if known.
+
+        Returns:
+            RouteTimeout: The configured, built-in or default timeouts.
+        """
+        if route is None:
+            return self.default
+        return self.routes.get(route) or DEFAULT_ROUTE_TIMEOUTS.get(route) or self.default
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Cap all API requests made within the block to a deadline.
+
+    Nested deadlines can only shorten the enclosing one. The deadline lives in
+    a context variable, so it follows asyncio tasks created within the block;
+    code running in threads must copy the context (`contextvars.copy_context`).
+
+    Args:
+        seconds (Optional[float]): Time budget from now; None keeps the enclosing deadline.
+
+    Yields:
+        Optional[float]: The effective absolute deadline (`time.monotonic` based).
+
+    Example:
+        >>> with deadline(30):
+        ...     await task.areload()  # fails with DeadlineExceededError after 30s
+    """
+    current = _deadline.get()
+    if seconds is not None:
+        candidate = time.monotonic() + seconds
+        current = candidate if current is None else min(current, candidate)
+    token = _deadline.set(current)
+    try:
+        yield current
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def without_deadline() -> Iterator[None]:
+    """
+    Lift the current deadline within the block.
+
+    Use it for work that must complete even after the deadline passed, such as
+    persisting the final state of a task.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Return the seconds left until the current deadline.
+
+    Returns:
+        Optional[float]: Remaining seconds (may be negative), or None without a deadline.
+    """
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
@@ -5,16 +5,41 @@ This module provides the core HTTP client functionality for making authenticated
 requests to the xpander.ai Backend-as-a-Service platform.
 """
 
+import asyncio
 from abc import ABC
-from typing import Optional, Any, Literal, Dict
+from typing import Optional, Any, AsyncIterator, ClassVar, Literal, Dict, Type, Union
 import httpx
-from pydantic import BaseModel
+from loguru import logger
+from pydantic import BaseModel, TypeAdapter
 
+from xpander_sdk.consts.api_routes import APIRoute
+from xpander_sdk.core.http_client_pool import HTTPClientPool
+from xpander_sdk.core.retry_policy import RetryPolicy, RetryStats
+from xpander_sdk.core.single_flight import SingleFlight, SingleFlightStats
+from xpander_sdk.core.timeouts import DeadlineExceededError, remaining_time
 from xpander_sdk.models.configuration import Configuration
+from xpander_sdk.utils.json_stream import aiter_json_array, loads
 
 # Type alias for supported HTTP methods
 HTTPMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
 
+# Type alias for response validators
+JSONModel = Union[Type[BaseModel], TypeAdapter]
+
+
+def _parse_json(content: bytes, model: Optional[JSONModel] = None) -> Any:
+    """Decode JSON bytes in a single pass, validating them with `model` if given."""
+    if model is None:
+        return loads(content)
+    if isinstance(model, TypeAdapter):
+        return model.validate_json(content)
+    return model.model_validate_json(content)
+
+
+def _freeze(values: Optional[Dict[str, Any]]) -> tuple:
+    """Hashable, order-independent representation of query parameters or headers."""
+    return tuple(sorted((str(key).lower(), str(value)) for key, value in (values or {}).items()))
+
 
 class APIClient(ABC):
     """
@@ -26,12 +51,17 @@ class APIClient(ABC):
     This client handles:
     - API key authentication via x-api-key header
     - URL construction
-    - JSON serialization/deserialization
-    - Extended timeouts
+    - JSON serialization/deserialization (single pass from bytes, orjson when installed)
+    - Incremental decoding of large list responses
+    - Per-route timeouts, capped by the deadline of the current context
     - HTTP error handling
+    - Retries of transient failures according to the configured `RetryPolicy`
+    - Connection reuse through a shared, per-event-loop keep-alive pool
+    - Coalescing of concurrent identical GET requests into a single call
     """
 
     _shared_instances: Dict[type, 'APIClient'] = {}
+    _single_flight: ClassVar[SingleFlight] = SingleFlight()
 
     def __new__(cls, configuration: Optional[Configuration] = None):
         """
@@ -68,7 +98,8 @@ class APIClient(ABC):
         query: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
         configuration: Optional[Configuration] = None,
-        model: Optional[BaseModel] = None,
+        model: Optional[JSONModel] = None,
+        route: Optional[APIRoute] = None,
     ) -> Any:
         """
         Make an authenticated HTTP request to the xpander.ai API.
@@ -80,7 +111,10 @@ class APIClient(ABC):
             query (Optional[Dict[str, Any]]): Query string parameters.
             headers (Optional[Dict[str, Any]]): Extra headers.
             configuration (Optional[Configuration]): Overrides self.configuration.
-            model (Optional[BaseModel]): pydantic model to use when constructing the result.
+            model (Optional[JSONModel]): pydantic model (or TypeAdapter) validating the result
+                directly from the response bytes.
+            route (Optional[APIRoute]): Route template of the path, used to select per-route
+                timeouts and retry overrides. Resolved from the path when omitted.
         
         Returns:
             Any: Parsed response body (JSON or text).
@@ -88,9 +122,116 @@ class APIClient(ABC):
         Raises:
             httpx.HTTPStatusError: For 4xx/5xx responses.
             httpx.RequestError: For connection/network errors.
+            DeadlineExceededError: When the deadline of the current context passes.
+        """
+        config = configuration or self.configuration
+
+        def send():
+            return self._asend(
+                config=config,
+                path=path,
+                method=method,
+                payload=payload,
+                query=query,
+                headers=headers,
+                route=route,
+            )
+
+        if method == "GET" and config.coalesce_requests:
+            # identical in-flight GETs (same URL, query, auth and headers) share one call;
+            # every caller parses its own copy of the body below and waits until its own deadline
+            key = (
+                config.get_full_url(),
+                path,
+                _freeze(query),
+                _freeze({**(headers or {}), "x-api-key": config.api_key}),
+            )
+            response = await self._single_flight.do(key, send)
+        else:
+            response = await send()
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "")
+        if "application/json" in content_type:
+            try:
+                return _parse_json(response.content, model)
+            except Exception:
+                return response.text
+        return response.text
+
+    async def astream_list(
+        self,
+        path: str,
+        method: HTTPMethod = "GET",
+        payload: Optional[Any] = None,
+        query: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        configuration: Optional[Configuration] = None,
+        model: Optional[JSONModel] = None,
+        route: Optional[APIRoute] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the items of a JSON list response as they are received.
+
+        Unlike `make_request`, the body is never held in memory as a whole, which
+        keeps memory flat for very large lists (tasks history, knowledge base documents).
+        Retries apply until the response headers are received.
+
+        Args:
+            path (str): Endpoint path (e.g., "/agents").
+            method (HTTPMethod): HTTP verb.
+            payload (Optional[Any]): JSON body for POST/PUT/PATCH.
+            query (Optional[Dict[str, Any]]): Query string parameters.
+            headers (Optional[Dict[str, Any]]): Extra headers.
+            configuration (Optional[Configuration]): Overrides self.configuration.
+            model (Optional[JSONModel]): pydantic model (or TypeAdapter) validating each item.
+            route (Optional[APIRoute]): Route template of the path. Resolved from the path when omitted.
+
+        Yields:
+            Any: Each item of the list, validated with `model` if provided.
+
+        Raises:
+            httpx.HTTPStatusError: For 4xx/5xx responses.
+            httpx.RequestError: For connection/network errors.
+            ValueError: If the response body is not a JSON array.
+
+        Example:
+            >>> async for item in APIClient().astream_list(path=path, model=TasksListItem):
+            ...     print(item.id)
         """
         config = configuration or self.configuration
+        response = await self._asend(
+            config=config,
+            path=path,
+            method=method,
+            payload=payload,
+            query=query,
+            headers=headers,
+            route=route,
+            stream=True,
+        )
+        try:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            async for item in aiter_json_array(
+                response.aiter_bytes(), parse=lambda raw: _parse_json(raw, model)
+            ):
+                yield item
+        finally:
+            await response.aclose()
 
+    async def _asend(
+        self,
+        config: Configuration,
+        path: str,
+        method: HTTPMethod,
+        payload: Optional[Any],
+        query: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, Any]],
+        route: Optional[APIRoute],
+        stream: bool = False,
+    ) -> httpx.Response:
         # Construct full URL
         url = f"{config.get_full_url().rstrip('/')}/{path.lstrip('/')}"
 
@@ -98,22 +239,99 @@ class APIClient(ABC):
         headers = headers.copy() if headers else {}
         headers["x-api-key"] = config.api_key
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+        policy = config.retry_policy or RetryPolicy.default()
+        route = route or APIRoute.match(path)
+        route_policy = policy.for_route(route)
+        route_timeout = config.timeouts.for_route(route)
+        policy.record("requests", route)
+
+        client = HTTPClientPool.get_client(configuration=config)
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = remaining_time()
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceededError(f"Deadline exceeded before {method} {path}")
+
+            policy.record("attempts", route)
+            response, error = None, None
+            request = client.build_request(
                 method=method,
                 url=url,
                 json=payload if method in {"POST", "PUT", "PATCH"} else None,
                 params=query,
                 headers=headers,
-                timeout=1200,  # 20 minutes
+                timeout=route_timeout.to_httpx(cap=remaining),
+            )
+            try:
+                response = await asyncio.wait_for(
+                    client.send(request, stream=stream), timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError(f"Deadline exceeded during {method} {path}")
+            except httpx.TransportError as e:
+                error = e
+
+            if not route_policy.is_transient(response=response, error=error):
+                break
+            if not route_policy.should_retry(
+                method=method, attempt=attempt, headers=headers, response=response, error=error
+            ):
+                if attempt >= route_policy.max_attempts:
+                    policy.record("exhausted", route)
+                break
+            if not policy.acquire_retry(route):
+                logger.warning(f"Retry budget exhausted, not retrying {method} {path}")
+                break
+
+            delay = route_policy.get_delay(attempt=attempt, response=response)
+            remaining = remaining_time()
+            if remaining is not None and delay >= remaining:
+                break
+            logger.debug(
+                f"Retrying {method} {path} in {delay:.2f}s (attempt {attempt}/{route_policy.max_attempts}): "
+                f"{error or response.status_code}"
             )
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(delay)
 
-            response.raise_for_status()
+        if error is not None:
+            raise error
+        return response
 
-            content_type = response.headers.get("Content-Type", "")
-            if "application/json" in content_type:
-                try:
-                    return response.json() if not model else model(**response.json())
-                except Exception:
-                    return response.text
-            return response.text
+    @classmethod
+    async def aclose_connections(cls) -> None:
+        """
+        Close the pooled HTTP connections bound to the running event loop.
+
+        Call this on shutdown to release keep-alive sockets. Subsequent requests
+        transparently open a new pool.
+        """
+        await HTTPClientPool.aclose()
+
+    @staticmethod
+    def get_retry_stats(configuration: Optional[Configuration] = None) -> RetryStats:
+        """
+        Return the retry counters of the policy used by a configuration.
+
+        Args:
+            configuration (Optional[Configuration]): Configuration whose policy to inspect.
+                Defaults to the shared default policy.
+
+        Returns:
+            RetryStats: Counters snapshot; `amplification` shows attempts per request.
+        """
+        policy = configuration.retry_policy if configuration else None
+        return (policy or RetryPolicy.default()).stats
+
+    @classmethod
+    def get_coalescing_stats(cls) -> SingleFlightStats:
+        """
+        Return the request coalescing counters.
+
+        Returns:
+            SingleFlightStats: `leaders` are GETs sent over the network, `coalesced`
+                are GETs served by joining an identical in-flight request.
+        """
+        return cls._single_flight.stats
@@ -9,10 +9,59 @@ from typing import Optional
 from os import getenv
 from pydantic import BaseModel, Field
 
+from xpander_sdk.core.retry_policy import RetryPolicy
 from xpander_sdk.core.state import State
+from xpander_sdk.core.timeouts import TimeoutSettings
 from xpander_sdk.utils.env import get_base_url
 
 
+class ConnectionPoolSettings(BaseModel):
+    """
+    Connection pool settings for the shared HTTP transport used by the SDK.
+
+    Clients are pooled per event loop and per distinct settings, so every
+    configuration with identical settings reuses the same keep-alive connections.
+
+    Attributes:
+        http2 (bool): Negotiate HTTP/2 when the server supports it. Requires the
+            optional `h2` package (`pip install xpander-sdk[http2]`).
+        max_connections (int): Maximum number of concurrent connections per pool.
+        max_keepalive_connections (int): Maximum number of idle connections kept alive.
+        keepalive_expiry (float): Seconds an idle connection is kept before closing.
+    """
+
+    http2: bool = Field(
+        default_factory=lambda: getenv("XPANDER_HTTP2", "false") == "true",
+        description="Enable HTTP/2 for pooled connections",
+    )
+    max_connections: int = Field(
+        default_factory=lambda: int(getenv("XPANDER_HTTP_MAX_CONNECTIONS", "100")),
+        description="Maximum concurrent connections per pool",
+    )
+    max_keepalive_connections: int = Field(
+        default_factory=lambda: int(getenv("XPANDER_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+        description="Maximum idle keep-alive connections per pool",
+    )
+    keepalive_expiry: float = Field(
+        default_factory=lambda: float(getenv("XPANDER_HTTP_KEEPALIVE_EXPIRY", "30")),
+        description="Idle keep-alive connection expiry in seconds",
+    )
+
+    def pool_key(self) -> tuple:
+        """
+        Return a hashable key identifying a pool with these settings.
+
+        Returns:
+            tuple: The settings as a hashable tuple.
+        """
+        return (
+            self.http2,
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.keepalive_expiry,
+        )
+
+
 class Configuration(BaseModel):
     """
     Configuration settings for the xpander.ai SDK.
@@ -24,6 +73,16 @@ class Configuration(BaseModel):
         api_key (Optional[str]): Your xpander.ai API key. Defaults to XPANDER_API_KEY environment variable.
         base_url (Optional[str]): The base URL for xpander.ai API endpoints. Auto-detected from environment.
         organization_id (Optional[str]): Your organization ID. Defaults to XPANDER_ORGANIZATION_ID environment variable.
+        connection_pool (ConnectionPoolSettings): Limits and protocol settings of the shared HTTP connection pool.
+        retry_policy (Optional[RetryPolicy]): Retry policy for API requests. Defaults to the shared `RetryPolicy.default()`.
+        timeouts (TimeoutSettings): Per-route connect/read/write/pool timeouts of API requests.
+        coalesce_requests (bool): Collapse concurrent identical GET requests into a single call.
+            Defaults to XPANDER_COALESCE_REQUESTS (enabled unless set to "false").
+        agent_cache_ttl (float): Seconds loaded agent definitions are cached in-process, 0 disables
+            caching. Defaults to XPANDER_AGENT_CACHE_TTL or 0.
+        async_preflight (bool): Send graph preflight reports of local tools in the background
+            when the agent graph does not enforce the tool's ordering. Defaults to
+            XPANDER_ASYNC_PREFLIGHT (disabled unless set to "true").
     
     Environment Variables:
         XPANDER_API_KEY: Your API key for authentication
@@ -63,6 +122,42 @@ class Configuration(BaseModel):
         exclude=True,  # This ensures it's excluded by default
     )
 
+    connection_pool: ConnectionPoolSettings = Field(
+        default_factory=ConnectionPoolSettings,
+        description="Shared HTTP connection pool settings",
+        exclude=True,
+    )
+
+    retry_policy: Optional[RetryPolicy] = Field(
+        default=None,
+        description="Retry policy for API requests, defaults to the shared policy",
+        exclude=True,
+    )
+
+    timeouts: TimeoutSettings = Field(
+        default_factory=TimeoutSettings,
+        description="Per-route API request timeouts",
+        exclude=True,
+    )
+
+    coalesce_requests: bool = Field(
+        default_factory=lambda: getenv("XPANDER_COALESCE_REQUESTS", "true") != "false",
+        description="Collapse concurrent identical GET requests into one call",
+        exclude=True,
+    )
+
+    agent_cache_ttl: float = Field(
+        default_factory=lambda: float(getenv("XPANDER_AGENT_CACHE_TTL", "0") or 0),
+        description="In-process agent definition cache TTL in seconds, 0 disables it",
+        exclude=True,
+    )
+
+    async_preflight: bool = Field(
+        default_factory=lambda: getenv("XPANDER_ASYNC_PREFLIGHT", "false") == "true",
+        description="Send unordered local tool preflight reports in the background",
+        exclude=True,
+    )
+
     def get_full_url(self) -> str:
         """
         Construct the complete API URL including organization ID when required.
@@ -162,3 +162,22 @@ class Agents(ModuleBase):
             version=version
             )
         )
+
+    def invalidate_cache(self, agent_id: Optional[str] = None) -> int:
+        """
+        Drop cached agent definitions so the next aget() reloads them.
+
+        Only relevant when agent caching is enabled (`Configuration.agent_cache_ttl`
+        or XPANDER_AGENT_CACHE_TTL).
+
+        Args:
+            agent_id (Optional[str]): Drop all cached versions of this agent, or all agents if None.
+
+        Returns:
+            int: Number of cache entries dropped.
+
+        Example:
+            >>> agents = Agents()
+            >>> agents.invalidate_cache("agent-123")
+        """
+        return Agent.invalidate_cache(agent_id=agent_id)
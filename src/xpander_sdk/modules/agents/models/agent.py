@@ -314,6 +314,19 @@ class AgentGraphItemCodingAgentSettings(BaseModel):
     type: Optional[Literal["codex"]] = "codex"
 
 
+class AgentGraphItemResultCacheSettings(BaseModel):
+    """
+    Result cache settings of a tool graph item.
+
+    Attributes:
+        ttl (float): Seconds a successful result is reused for identical calls.
+        per_user (bool): Whether results are cached separately for each user.
+    """
+
+    ttl: float
+    per_user: bool = False
+
+
 class AgentGraphItemSettings(BaseModel):
     """
     Comprehensive settings model for agent graph items.
@@ -330,6 +343,7 @@ class AgentGraphItemSettings(BaseModel):
         a2a_options (Optional[AgentGraphItemA2ASettings]): Agent-to-agent communication settings.
         coding_agent_settings (Optional[AgentGraphItemCodingAgentSettings]): Coding agent specific settings.
         mcp_settings (Optional[MCPServerDetails]): Model Context Protocol settings.
+        result_cache (Optional[AgentGraphItemResultCacheSettings]): Result cache settings of tool items.
     """
     
     instructions: Optional[str] = None
@@ -340,6 +354,7 @@ class AgentGraphItemSettings(BaseModel):
     a2a_options: Optional[AgentGraphItemA2ASettings] = None
     coding_agent_settings: Optional[AgentGraphItemCodingAgentSettings] = None
     mcp_settings: Optional[MCPServerDetails] = None
+    result_cache: Optional[AgentGraphItemResultCacheSettings] = None
 
 
 class AgentGraphItemLLMSettings(BaseModel):
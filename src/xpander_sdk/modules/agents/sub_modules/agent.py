@@ -9,10 +9,10 @@ import asyncio
 from datetime import datetime
 import heapq
 import re
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Type, TypeVar, Union
 from httpx import HTTPStatusError
 from loguru import logger
-from pydantic import ConfigDict, computed_field
+from pydantic import ConfigDict, PrivateAttr, computed_field
 from strands import tool as strands_tool
 from xpander_sdk.consts.api_routes import APIRoute
 from xpander_sdk.core.xpander_api_client import APIClient
@@ -21,6 +21,11 @@ from xpander_sdk.models.configuration import Configuration
 from xpander_sdk.models.frameworks import AgnoSettings, Framework
 from xpander_sdk.models.notifications import NotificationSettings
 from xpander_sdk.models.orchestrations import OrchestrationNode
+from xpander_sdk.modules.agents.utils.cache import (
+    cache_agent_definition,
+    get_cached_agent_definition,
+    invalidate_agent_definition,
+)
 from xpander_sdk.modules.agents.utils.generic import get_db_schema_name
 from xpander_sdk.modules.knowledge_bases.models.knowledge_bases import (
     KnowledgeBaseSearchResult,
@@ -64,16 +69,32 @@ class AgentGraph(XPanderSharedModel):
     """
     Model representing the graph structure of an agent's execution flow.
 
+    Items are indexed by `id`, `item_id`, `type` and MCP server URL when the
+    graph is built; the indexes are rebuilt if `items` is replaced or resized,
+    so lookups are O(1).
+
     Attributes:
         items (List[AgentGraphItem]): List of all items in the agent's execution graph.
 
     Methods:
         __init__: Initialize with a list of graph items.
         get_graph_item: Retrieve a specific graph item by attribute.
+        get_item_by_id: Retrieve a graph item by its ID.
+        get_item_by_item_id: Retrieve a graph item by the ID of its underlying item.
+        get_items_by_type: Retrieve all graph items of a type.
+        get_mcp_item_by_url: Retrieve the MCP graph item of a server URL.
+        enforces_ordering: Check whether an item is part of an execution edge.
     """
 
     items: List[AgentGraphItem] = []
 
+    _by_id: Dict[str, AgentGraphItem] = PrivateAttr(default_factory=dict)
+    _by_item_id: Dict[str, AgentGraphItem] = PrivateAttr(default_factory=dict)
+    _by_type: Dict[AgentGraphItemType, List[AgentGraphItem]] = PrivateAttr(default_factory=dict)
+    _by_mcp_url: Dict[str, AgentGraphItem] = PrivateAttr(default_factory=dict)
+    _ordered_item_ids: Set[str] = PrivateAttr(default_factory=set)
+    _indexed_items: Optional[tuple] = PrivateAttr(default=None)
+
     def __init__(self, graph: list[AgentGraphItem]):
         """
         Initialize the agent graph with provided graph items.
@@ -83,11 +104,39 @@ class AgentGraph(XPanderSharedModel):
         """
         super().__init__()
         self.items = [AgentGraphItem(**item) for item in graph]
+        self._ensure_index()
+
+    def _ensure_index(self) -> None:
+        indexed = self._indexed_items
+        if indexed and indexed[0] is self.items and indexed[1] == len(self.items):
+            return
+
+        by_id, by_item_id, by_type, by_mcp_url = {}, {}, {}, {}
+        for gi in self.items:
+            if gi.id is not None:
+                by_id.setdefault(gi.id, gi)
+            by_item_id.setdefault(gi.item_id, gi)
+            by_type.setdefault(gi.type, []).append(gi)
+            if gi.type == AgentGraphItemType.MCP and gi.settings and gi.settings.mcp_settings:
+                mcp_settings = gi.settings.mcp_settings
+                url = mcp_settings.get("url") if isinstance(mcp_settings, dict) else mcp_settings.url
+                if url:
+                    by_mcp_url.setdefault(url, gi)
+
+        targeted = {target for gi in self.items for target in (gi.targets or [])}
+        self._ordered_item_ids = {
+            gi.item_id for gi in self.items if gi.targets or (gi.id is not None and gi.id in targeted)
+        }
+
+        self._by_id, self._by_item_id, self._by_type, self._by_mcp_url = by_id, by_item_id, by_type, by_mcp_url
+        self._indexed_items = (self.items, len(self.items))
 
     def get_graph_item(self, attr: str, value: str):
         """
         Retrieve a specific item from the agent's graph based on a matching attribute.
 
+        Lookups by `id` and `item_id` use the indexes, other attributes are scanned.
+
         Args:
             attr (str): Attribute name to match.
             value (str): Value of the attribute to find.
@@ -95,10 +144,83 @@ class AgentGraph(XPanderSharedModel):
         Returns:
             Optional[AgentGraphItem]: The graph item if found, otherwise None.
         """
+        if attr == "id":
+            return self.get_item_by_id(value)
+        if attr == "item_id":
+            return self.get_item_by_item_id(value)
         for gi in self.items:
             if getattr(gi, attr, None) == value:
                 return gi
         return None
+
+    def get_item_by_id(self, id: str) -> Optional[AgentGraphItem]:
+        """
+        Retrieve a graph item by its ID.
+
+        Args:
+            id (str): Graph item ID.
+
+        Returns:
+            Optional[AgentGraphItem]: The graph item if found, otherwise None.
+        """
+        self._ensure_index()
+        return self._by_id.get(id)
+
+    def get_item_by_item_id(self, item_id: str) -> Optional[AgentGraphItem]:
+        """
+        Retrieve a graph item by the ID of its underlying item (tool, agent, ...).
+
+        Args:
+            item_id (str): ID of the underlying item.
+
+        Returns:
+            Optional[AgentGraphItem]: The first matching graph item, otherwise None.
+        """
+        self._ensure_index()
+        return self._by_item_id.get(item_id)
+
+    def get_items_by_type(self, type: AgentGraphItemType) -> List[AgentGraphItem]:
+        """
+        Retrieve all graph items of a type, in graph order.
+
+        Args:
+            type (AgentGraphItemType): Graph item type.
+
+        Returns:
+            List[AgentGraphItem]: Matching graph items.
+        """
+        self._ensure_index()
+        return list(self._by_type.get(type, []))
+
+    def get_mcp_item_by_url(self, url: str) -> Optional[AgentGraphItem]:
+        """
+        Retrieve the MCP graph item configured with a server URL.
+
+        Args:
+            url (str): MCP server URL.
+
+        Returns:
+            Optional[AgentGraphItem]: The first matching MCP graph item, otherwise None.
+        """
+        self._ensure_index()
+        return self._by_mcp_url.get(url)
+
+    def enforces_ordering(self, item_id: str) -> bool:
+        """
+        Check whether the graph constrains when an item may run.
+
+        An item is ordered when it has targets or is the target of another
+        item; calls to it must pass the graph preflight check before the
+        result is used.
+
+        Args:
+            item_id (str): ID of the underlying item (tool, agent, ...).
+
+        Returns:
+            bool: True if the item is part of an execution edge.
+        """
+        self._ensure_index()
+        return item_id in self._ordered_item_ids
     
     @computed_field
     @property
@@ -113,11 +235,8 @@ class AgentGraph(XPanderSharedModel):
             List[str]:  
                 A list of unique string IDs representing the agents nested under this agent.
         """
-        return [
-            gi.item_id
-            for gi in self.items
-            if gi.type == AgentGraphItemType.AGENT
-        ]
+        self._ensure_index()
+        return [gi.item_id for gi in self._by_type.get(AgentGraphItemType.AGENT, [])]
 
 
 
@@ -269,8 +388,7 @@ class Agent(XPanderSharedModel):
         """
         return [
             MCPServerDetails(**gi.settings.mcp_settings) if isinstance(gi.settings.mcp_settings, dict) else gi.settings.mcp_settings
-            for gi in self.graph.items
-            if gi.type == AgentGraphItemType.MCP
+            for gi in self.graph.get_items_by_type(AgentGraphItemType.MCP)
         ]
 
     @computed_field
@@ -304,6 +422,10 @@ class Agent(XPanderSharedModel):
         """
         Asynchronously load an agent's configuration and settings by ID.
 
+        When `configuration.agent_cache_ttl` (or XPANDER_AGENT_CACHE_TTL) is set, the
+        agent definition is cached in-process per agent, version and credentials.
+        Every call still returns a new Agent, so per-task state is never shared.
+
         Args:
             agent_id (str): Unique identifier of the agent.
             configuration (Optional[Configuration]): SDK configuration to use.
@@ -316,24 +438,35 @@ class Agent(XPanderSharedModel):
             >>> agent = await Agent.aload(agent_id="agent123")
         """
         try:
-            client = APIClient(configuration=configuration)
-            headers = {}
-            if version:
-                headers["x-agent-version"] = str(version)
-
-            response_data: dict = await client.make_request(
-                path=APIRoute.GetAgent.format(agent_id=agent_id), headers=headers
+            configuration = configuration or Configuration()
+            response_data = get_cached_agent_definition(
+                configuration=configuration, agent_id=agent_id, version=version
             )
-            agent = cls.model_validate({**response_data, "graph": None, "tools": None, "configuration": configuration or Configuration()})
+            if response_data is None:
+                client = APIClient(configuration=configuration)
+                headers = {}
+                if version:
+                    headers["x-agent-version"] = str(version)
+
+                response_data: dict = await client.make_request(
+                    path=APIRoute.GetAgent.format(agent_id=agent_id), headers=headers
+                )
+                cache_agent_definition(
+                    configuration=configuration,
+                    agent_id=agent_id,
+                    version=version,
+                    definition=response_data,
+                )
+
+            agent = cls.model_validate({**response_data, "graph": None, "tools": None, "configuration": configuration})
             agent.graph = AgentGraph(response_data.get("graph", []))
             agent.tools = ToolsRepository(
                 configuration=agent.configuration, tools=response_data.get("tools", []), agent_graph=agent.graph
             )
 
-            if agent.tools.should_sync_local_tools():
-                asyncio.create_task(
-                    agent.sync_local_tools(tools=agent.tools.get_local_tools_for_sync())
-                )
+            local_tools = agent.tools.get_local_tools_for_sync(agent_id=agent.id)
+            if local_tools:
+                asyncio.create_task(agent.sync_local_tools(tools=local_tools))
 
             return agent
         except HTTPStatusError as e:
@@ -345,6 +478,22 @@ class Agent(XPanderSharedModel):
                 status_code=500, description=f"Failed to load agent - {str(e)}"
             )
 
+    @classmethod
+    def invalidate_cache(cls, agent_id: Optional[str] = None) -> int:
+        """
+        Drop cached agent definitions, e.g. after the agent was updated.
+
+        Args:
+            agent_id (Optional[str]): Drop all cached versions of this agent, or all agents if None.
+
+        Returns:
+            int: Number of cache entries dropped.
+
+        Example:
+            >>> Agent.invalidate_cache(agent_id="agent123")
+        """
+        return invalidate_agent_definition(agent_id=agent_id)
+
     @classmethod
     def load(
         cls: Type[T],
@@ -616,11 +765,16 @@ class Agent(XPanderSharedModel):
                     for tool in tools
                 ],
             )
-            self.graph = AgentGraph(response_data.get("graph", []))
-
-            # set all local tools as synced
-            for tool in tools:
-                tool.is_synced = True
+            graph = AgentGraph(response_data.get("graph", []))
+            if self.graph is None or graph.items != self.graph.items:
+                self.graph = graph
+                if self.tools:
+                    self.tools.agent_graph = self.graph  # re-applies schema overrides
+                # cached definitions hold the previous graph
+                invalidate_agent_definition(agent_id=self.id)
+
+            # set all local tools as synced, also for agents loaded later
+            ToolsRepository.mark_local_tools_synced(agent_id=self.id, tools=tools)
         except Exception as e:
             logger.warning(f"Failed to sync local tools - {str(e)}")
 
@@ -0,0 +1,109 @@
+"""
+In-process cache of agent definitions.
+
+Entries hold the agent definition as returned by the API, serialized to JSON
+bytes, so every load builds a fresh `Agent` and no per-task state can leak
+between concurrent tasks.
+"""
+
+import json
+from os import getenv
+from typing import Any, Dict, Optional, Tuple
+
+from xpander_sdk.models.configuration import Configuration
+from xpander_sdk.utils.cache import TTLCache
+from xpander_sdk.utils.json_stream import loads
+
+AgentCacheKey = Tuple[str, Optional[str], Optional[str], str, Optional[int]]
+
+# entries expire according to Configuration.agent_cache_ttl
+agent_cache: TTLCache[bytes] = TTLCache(maxsize=int(getenv("XPANDER_AGENT_CACHE_SIZE", "128")))
+
+
+def get_agent_cache_key(
+    configuration: Configuration, agent_id: str, version: Optional[int] = None
+) -> AgentCacheKey:
+    """
+    Build the cache key of an agent definition.
+
+    The key includes the endpoint, organization and API key, so definitions are
+    never shared across credentials.
+
+    Args:
+        configuration (Configuration): Configuration used to load the agent.
+        agent_id (str): Agent identifier.
+        version (Optional[int]): Agent version, None for the latest one.
+
+    Returns:
+        AgentCacheKey: The cache key.
+    """
+    return (
+        configuration.get_full_url(),
+        configuration.organization_id,
+        configuration.api_key,
+        agent_id,
+        int(version) if version else None,
+    )
+
+
+def get_cached_agent_definition(
+    configuration: Configuration, agent_id: str, version: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Return a private copy of a cached agent definition.
+
+    Args:
+        configuration (Configuration): Configuration used to load the agent.
+        agent_id (str): Agent identifier.
+        version (Optional[int]): Agent version, None for the latest one.
+
+    Returns:
+        Optional[Dict[str, Any]]: The definition, or None if not cached or caching is disabled.
+    """
+    if configuration.agent_cache_ttl <= 0:
+        return None
+    payload = agent_cache.get(get_agent_cache_key(configuration, agent_id, version))
+    return loads(payload) if payload is not None else None
+
+
+def cache_agent_definition(
+    configuration: Configuration,
+    agent_id: str,
+    version: Optional[int],
+    definition: Dict[str, Any],
+) -> None:
+    """
+    Store an agent definition, under the requested version and its actual version.
+
+    Args:
+        configuration (Configuration): Configuration used to load the agent.
+        agent_id (str): Agent identifier.
+        version (Optional[int]): Requested agent version, None for the latest one.
+        definition (Dict[str, Any]): Agent definition returned by the API.
+    """
+    if configuration.agent_cache_ttl <= 0:
+        return
+    payload = json.dumps(definition, default=str).encode()
+    ttl = configuration.agent_cache_ttl
+    agent_cache.set(get_agent_cache_key(configuration, agent_id, version), payload, ttl=ttl)
+    if not version and definition.get("version"):
+        agent_cache.set(
+            get_agent_cache_key(configuration, agent_id, definition["version"]), payload, ttl=ttl
+        )
+
+
+def invalidate_agent_definition(agent_id: Optional[str] = None) -> int:
+    """
+    Drop cached agent definitions.
+
+    Args:
+        agent_id (Optional[str]): Drop all versions of this agent, or everything if None.
+
+    Returns:
+        int: Number of entries dropped.
+    """
+    if agent_id is None:
+        dropped = len(agent_cache)
+        agent_cache.clear()
+        return dropped
+    return agent_cache.invalidate_where(lambda key: key[3] == agent_id)
@@ -232,6 +232,7 @@ class Backend(ModuleBase):
         tools: Optional[List[Callable]] = None,
         is_async: Optional[bool] = True,
         auth_events_callback: Optional[Callable] = None,
+        timings: Optional[Dict[str, float]] = None,
     ) -> Dict[str, Any]:
         """
         Asynchronously resolve runtime arguments for the specified agent.
@@ -265,6 +266,8 @@ class Backend(ModuleBase):
                         print(f"Auth required: {event.data}")
                     
                     args = await backend.aget_args(agent_id="...", auth_events_callback=handle_auth)
+            timings (Optional[Dict[str, float]]): If provided, filled with the duration in seconds
+                of every argument-building stage, for profiling.
 
         Returns:
             Dict[str, Any]: Resolved argument dictionary to use with the agent.
@@ -289,7 +292,7 @@ class Backend(ModuleBase):
                 "or set via the 'XPANDER_AGENT_ID' environment variable."
             )
 
-        return await dispatch_get_args(agent=xpander_agent, task=task, override=override, tools=tools, is_async=is_async, auth_events_callback=auth_events_callback)
+        return await dispatch_get_args(agent=xpander_agent, task=task, override=override, tools=tools, is_async=is_async, auth_events_callback=auth_events_callback, timings=timings)
 
     def get_args(
         self,
@@ -300,6 +303,7 @@ class Backend(ModuleBase):
         override: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Callable]] = None,
         auth_events_callback: Optional[Callable] = None,
+        timings: Optional[Dict[str, float]] = None,
     ) -> Dict[str, Any]:
         """
         Synchronously resolve runtime arguments for the specified agent.
@@ -335,6 +339,8 @@ class Backend(ModuleBase):
                         print(f"Auth required: {event.data}")
                     
                     args = backend.get_args(agent_id="...", auth_events_callback=handle_auth)
+            timings (Optional[Dict[str, float]]): If provided, filled with the duration in seconds
+                of every argument-building stage, for profiling.
 
         Returns:
             Dict[str, Any]: Resolved argument dictionary to use with the agent.
@@ -351,7 +357,8 @@ class Backend(ModuleBase):
                 override=override,
                 tools=tools,
                 is_async=False,
-                auth_events_callback=auth_events_callback
+                auth_events_callback=auth_events_callback,
+                timings=timings,
             )
         )
     
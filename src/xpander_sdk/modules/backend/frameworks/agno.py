@@ -1,19 +1,22 @@
 import asyncio
 import json
 import shlex
+import time
+from contextlib import contextmanager
+from functools import partial
 from os import getenv, environ
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
 
 from loguru import logger
 from toon import encode as toon_encode
 from xpander_sdk import Configuration
-from xpander_sdk.consts.api_routes import APIRoute
-from xpander_sdk.core.xpander_api_client import APIClient
+from xpander_sdk.core.background_reporter import telemetry_reporter
 from xpander_sdk.models.generic import LLMCredentials
 from xpander_sdk.models.shared import OutputFormat, ThinkMode
 from xpander_sdk.modules.agents.agents_module import Agents
-from xpander_sdk.modules.agents.models.agent import AgentGraphItemType, LLMReasoningEffort
+from xpander_sdk.modules.agents.models.agent import LLMReasoningEffort
 from xpander_sdk.modules.agents.sub_modules.agent import Agent
+from xpander_sdk.modules.backend.utils.llm_headers import aget_org_default_llm_headers
 from xpander_sdk.modules.backend.utils.mcp_oauth import authenticate_mcp_server
 from xpander_sdk.modules.tasks.sub_modules.task import Task
 from xpander_sdk.modules.tools_repository.models.mcp import (
@@ -35,7 +38,6 @@ from agno.guardrails import PIIDetectionGuardrail
 from agno.guardrails import PromptInjectionGuardrail
 from agno.guardrails import OpenAIModerationGuardrail
 
-from xpander_sdk.utils.event_loop import run_sync
 
 async def build_agent_args(
     xpander_agent: Agent,
@@ -44,8 +46,33 @@ async def build_agent_args(
     tools: Optional[List[Callable]] = None,
     is_async: Optional[bool] = True,
     auth_events_callback: Optional[Callable] = None,
+    timings: Optional[Dict[str, float]] = None,
 ) -> Dict[str, Any]:
-    model = _load_llm_model(agent=xpander_agent, override=override, task=task)
+    """
+    Build the Agno Agent/Team arguments of an xpander agent.
+
+    Independent fetches (organization LLM headers, session DB, MCP tools and
+    authentication, sub-agents) run concurrently. The task reload needed by
+    deep planning replaces the task's fields, so it runs after every step
+    reading the task.
+
+    Args:
+        xpander_agent (Agent): The agent to build arguments for.
+        task (Optional[Task]): Optional runtime task.
+        override (Optional[Dict[str, Any]]): Dict of override values.
+        tools (Optional[List[Callable]]): Additional tools to add to the agent.
+        is_async (Optional[bool]): Is in Async Context?.
+        auth_events_callback (Optional[Callable]): Callback for authentication events.
+        timings (Optional[Dict[str, float]]): If provided, filled with the duration in
+            seconds of every stage ("llm_headers", "db", "tools", "task_reload",
+            "members", "model") and of the whole build ("total").
+
+    Returns:
+        Dict[str, Any]: Arguments for instantiating the Agno Agent or Team.
+    """
+    timings = timings if timings is not None else {}
+    started_at = time.perf_counter()
+
     args: Dict[str, Any] = {
         "id": xpander_agent.id,
         "store_events": True
@@ -55,15 +82,40 @@ async def build_agent_args(
     _configure_session_storage(args=args, agent=xpander_agent, task=task)
     _configure_agentic_memory(args=args, agent=xpander_agent, task=task)
     _configure_tool_calls_compression(args=args, agent=xpander_agent)
-    await _attach_async_dependencies(
-        args=args, agent=xpander_agent, task=task, model=model, is_async=is_async
-    )
     _configure_knowledge_bases(args=args, agent=xpander_agent)
     _configure_additional_context(args=args, agent=xpander_agent, task=task)
+
+    should_load_headers = not (override and "model" in override)
+    should_reload_task = bool(task and xpander_agent.deep_planning and task.deep_planning.enabled == True)
+    is_a_team = xpander_agent.is_a_team
+
+    stages: Dict[str, Awaitable[Any]] = {
+        "db": _attach_async_dependencies(args=args, agent=xpander_agent, task=task, is_async=is_async),
+        "tools": _resolve_agent_tools(agent=xpander_agent, task=task, auth_events_callback=auth_events_callback),
+    }
+    if should_load_headers:
+        stages["llm_headers"] = aget_org_default_llm_headers(configuration=xpander_agent.configuration)
+    if is_a_team:
+        stages["members"] = _build_team_members(
+            xpander_agent=xpander_agent,
+            task=task,
+            override=override,
+            is_async=is_async,
+            auth_events_callback=auth_events_callback,
+        )
+    results = await _run_stages(stages=stages, timings=timings)
+
+    with _stage_timer(timings=timings, stage="model"):
+        model = _load_llm_model(
+            agent=xpander_agent,
+            override=override,
+            task=task,
+            org_default_llm_headers=results.get("llm_headers"),
+        )
     # Configure pre-hooks (guardrails, etc.)
     _configure_pre_hooks(args=args, agent=xpander_agent, model=model)
 
-    args["tools"] = await _resolve_agent_tools(agent=xpander_agent, task=task, auth_events_callback=auth_events_callback)
+    args["tools"] = results["tools"]
 
     
     if tools and len(tools) != 0:
@@ -71,7 +123,7 @@ async def build_agent_args(
 
     should_use_reasoning_tools = True if xpander_agent.agno_settings.reasoning_tools_enabled else False
 
-    if not xpander_agent.is_a_team and should_use_reasoning_tools:
+    if not is_a_team and should_use_reasoning_tools:
         from agno.tools.reasoning import ReasoningTools
         args["tools"].append(
             ReasoningTools(
@@ -84,33 +136,8 @@ async def build_agent_args(
         )
         
     # team
-    if xpander_agent.is_a_team:
-        sub_agents = xpander_agent.graph.sub_agents
-
-        # load sub agents
-        sub_agents = await asyncio.gather(
-            *[
-                Agents(
-                    configuration=Configuration(
-                        api_key=xpander_agent.configuration.api_key,
-                        organization_id=xpander_agent.configuration.organization_id,
-                        base_url=xpander_agent.configuration.base_url
-                    )
-                ).aget(agent_id=sub_agent_id)
-                for sub_agent_id in sub_agents
-            ]
-        )
-        if sub_agents and len(sub_agents):
-            base_state = xpander_agent.configuration.state.model_copy()
-            for sub_agent in sub_agents:
-                sub_agent.configuration.state.task = base_state.task
-        # convert to members
-        members = await asyncio.gather(
-            *[
-                build_agent_args(xpander_agent=sub_agent, override=override, task=task, is_async=is_async, auth_events_callback=auth_events_callback)
-                for sub_agent in sub_agents
-            ]
-        )
+    if is_a_team:
+        members = results["members"]
         
         # set members to use parent agent model
         if members and len(members) != 0:
@@ -155,23 +182,27 @@ async def build_agent_args(
         args.update(override)
 
     # append tools hooks
+    monitoring_tools: Dict[str, Tool] = {}
+
     async def on_tool_call_hook(
         function_name: str, function_call: Callable, arguments: Dict[str, Any]
     ):
         # preflight and monitoring + metrics
+        matched_tool = None
         try:
             matched_tool = (
                 (
                     xpander_agent.tools.get_tool_by_id(tool_id=function_name)
                     or xpander_agent.tools.get_tool_by_name(tool_name=function_name)
                 )
-                if xpander_agent.tools and len(xpander_agent.tools.list) != 0
+                if xpander_agent.tools
                 else None
             )
         except Exception:
             pass
         
         error = None
+        result = None
         try:
             # Call the function
             if asyncio.iscoroutinefunction(function_call):
@@ -185,28 +216,34 @@ async def build_agent_args(
         finally:
             try:
                 if not matched_tool and task:  # agent / mcp tool
-                    tool_instance = Tool(
-                        configuration=xpander_agent.configuration,
-                        id=function_name,
-                        name=function_name,
-                        method="GET",
-                        path=f"/tools/{function_name}",
-                        should_add_to_graph=False,
-                        is_local=True,
-                        is_synced=True,
-                        description=function_name,
-                    )
+                    tool_instance = monitoring_tools.get(function_name)
+                    if tool_instance is None:
+                        tool_instance = monitoring_tools[function_name] = Tool(
+                            configuration=xpander_agent.configuration,
+                            id=function_name,
+                            name=function_name,
+                            method="GET",
+                            path=f"/tools/{function_name}",
+                            should_add_to_graph=False,
+                            is_local=True,
+                            is_synced=True,
+                            description=function_name,
+                        )
                     parsed_result = None
                     try:
                         parsed_result = dict(result)
                     except Exception:
                         parsed_result = result
-                        
-                    await tool_instance.agraph_preflight_check(
-                        agent_id=xpander_agent.id,
-                        configuration=tool_instance.configuration,
-                        task_id=task.id,
-                        payload={"input": arguments, "output": error or parsed_result} if isinstance(arguments, dict) else None
+
+                    # monitoring only, report without delaying the tool result
+                    await telemetry_reporter.asubmit(
+                        partial(
+                            tool_instance.agraph_preflight_check,
+                            agent_id=xpander_agent.id,
+                            configuration=tool_instance.configuration,
+                            task_id=task.id,
+                            payload={"input": arguments, "output": error or parsed_result} if isinstance(arguments, dict) else None
+                        )
                     )
             except Exception:
                 pass
@@ -239,12 +276,91 @@ async def build_agent_args(
         del args["model"].temperature
     
     # configure deep planning guidance
+    if should_reload_task:
+        with _stage_timer(timings=timings, stage="task_reload"):
+            await task.areload()  # get latest version of the plan
     _configure_deep_planning_guidance(args=args, agent=xpander_agent, task=task)
+
+    timings["total"] = time.perf_counter() - started_at
+    logger.debug(
+        f"Built args of agent {xpander_agent.id} - "
+        + ", ".join(f"{stage}={duration * 1000:.1f}ms" for stage, duration in timings.items())
+    )
     return args
 
+
+async def _build_team_members(
+    xpander_agent: Agent,
+    task: Optional[Task],
+    override: Optional[Dict[str, Any]],
+    is_async: Optional[bool],
+    auth_events_callback: Optional[Callable],
+) -> List[Dict[str, Any]]:
+    # load sub agents
+    sub_agents = await asyncio.gather(
+        *[
+            Agents(
+                configuration=Configuration(
+                    api_key=xpander_agent.configuration.api_key,
+                    organization_id=xpander_agent.configuration.organization_id,
+                    base_url=xpander_agent.configuration.base_url
+                )
+            ).aget(agent_id=sub_agent_id)
+            for sub_agent_id in xpander_agent.graph.sub_agents
+        ]
+    )
+    if sub_agents and len(sub_agents):
+        base_state = xpander_agent.configuration.state.model_copy()
+        for sub_agent in sub_agents:
+            sub_agent.configuration.state.task = base_state.task
+    # convert to members
+    return await asyncio.gather(
+        *[
+            build_agent_args(xpander_agent=sub_agent, override=override, task=task, is_async=is_async, auth_events_callback=auth_events_callback)
+            for sub_agent in sub_agents
+        ]
+    )
+
+
+@contextmanager
+def _stage_timer(timings: Dict[str, float], stage: str) -> Iterator[None]:
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = time.perf_counter() - started_at
+
+
+async def _run_stages(stages: Dict[str, Awaitable[Any]], timings: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Run independent build stages concurrently and time each of them.
+
+    If a stage fails, the stages still running are cancelled and the error is raised.
+
+    Args:
+        stages (Dict[str, Awaitable[Any]]): Stage name to awaitable.
+        timings (Dict[str, float]): Filled with the duration of every stage in seconds.
+
+    Returns:
+        Dict[str, Any]: Stage name to result.
+    """
+
+    async def timed(stage: str, awaitable: Awaitable[Any]) -> Any:
+        with _stage_timer(timings=timings, stage=stage):
+            return await awaitable
+
+    tasks = {stage: asyncio.ensure_future(timed(stage, awaitable)) for stage, awaitable in stages.items()}
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for pending in tasks.values():
+            pending.cancel()
+        raise
+    return {stage: stage_task.result() for stage, stage_task in tasks.items()}
+
 def _configure_deep_planning_guidance(args: Dict[str, Any], agent: Agent, task: Optional[Task]) -> None:
+    # the task is reloaded by build_agent_args, after the steps reading it
     if args and agent and task and agent.deep_planning and task.deep_planning.enabled == True:
-        task.reload() # reload the task - get latest version
         # add instructions guidance
         if not "instructions" in args:
             args["instructions"] = ""
@@ -580,7 +696,12 @@ def _configure_deep_planning_guidance(args: Dict[str, Any], agent: Agent, task:
         plan_str = task.deep_planning.model_dump_json() if task.deep_planning and task.deep_planning.enabled and len(task.deep_planning.tasks) != 0 else "No execution plan, please generate"
         args["additional_context"] += f" \n Current execution plan: {plan_str}"
 
-def _load_llm_model(agent: Agent, override: Optional[Dict[str, Any]] = {}, task: Optional[Task] = None) -> Any:
+def _load_llm_model(
+    agent: Agent,
+    override: Optional[Dict[str, Any]] = {},
+    task: Optional[Task] = None,
+    org_default_llm_headers: Optional[Dict[str, str]] = None,
+) -> Any:
     """
     Load and configure the appropriate LLM model based on the agent's provider configuration.
 
@@ -592,6 +713,9 @@ def _load_llm_model(agent: Agent, override: Optional[Dict[str, Any]] = {}, task:
         agent (Agent): The agent instance containing model configuration.
         override (Optional[Dict[str, Any]]): Optional override parameters that can
             include a pre-configured "model" to bypass the loading logic.
+        task (Optional[Task]): The task the model is built for.
+        org_default_llm_headers (Optional[Dict[str, str]]): Organization default LLM extra
+            headers, prefetched by the caller (see `aget_org_default_llm_headers`).
 
     Returns:
         Any: A configured LLM model instance (OpenAIChat, Nvidia, or Claude).
@@ -663,14 +787,6 @@ def _load_llm_model(agent: Agent, override: Optional[Dict[str, Any]] = {}, task:
     if oidc_llm_token:
         llm_extra_headers["x-oidc-token"] = oidc_llm_token
     
-    # Get organization default LLM extra headers
-    api_client = APIClient(configuration=agent.configuration)
-    org_default_llm_headers = run_sync(
-        api_client.make_request(
-            path=APIRoute.GetOrgDefaultLLMExtraHeaders,
-        )
-    )
-    
     # set default headers
     if org_default_llm_headers:
         llm_extra_headers = {**llm_extra_headers,**org_default_llm_headers}
@@ -940,7 +1056,7 @@ def _configure_agentic_memory(
 
 
 async def _attach_async_dependencies(
-    args: Dict[str, Any], agent: Agent, task: Optional[Task], model: Any, is_async: Optional[bool] = True
+    args: Dict[str, Any], agent: Agent, task: Optional[Task], is_async: Optional[bool] = True
 ) -> None:
     user = task.input.user if task and task.input and task.input.user else None
     should_use_db = True if (agent.agno_settings.user_memories and user and user.id) or agent.agno_settings.agent_memories else False
@@ -1094,7 +1210,7 @@ async def _resolve_agent_tools(agent: Agent, task: Optional[Task] = None, auth_e
                         raise ValueError("MCP server with OAuth authentication detected but task not sent")
                     
                     # check if we have user tokens for this mcp
-                    graph_item = next((gi for gi in agent.graph.items if gi.type == AgentGraphItemType.MCP and gi.settings and gi.settings.mcp_settings and gi.settings.mcp_settings.url and gi.settings.mcp_settings.url == mcp.url), None)
+                    graph_item = agent.graph.get_mcp_item_by_url(mcp.url)
                     if graph_item and task.user_tokens and isinstance(task.user_tokens, dict) and graph_item.id in task.user_tokens:
                         if isinstance(task.user_tokens[graph_item.id], dict):
                             graph_item_headers = task.user_tokens[graph_item.id]
@@ -1117,7 +1233,7 @@ async def _resolve_agent_tools(agent: Agent, task: Optional[Task] = None, auth_e
                         mcp.api_key = auth_result.data.access_token
             
             # check if we have user tokens for this mcp
-            graph_item = next((gi for gi in agent.graph.items if gi.type == AgentGraphItemType.MCP and gi.settings and gi.settings.mcp_settings and gi.settings.mcp_settings.url and gi.settings.mcp_settings.url == mcp.url), None)
+            graph_item = agent.graph.get_mcp_item_by_url(mcp.url)
             if graph_item and task.user_tokens and isinstance(task.user_tokens, dict) and graph_item.id in task.user_tokens:
                 if isinstance(task.user_tokens[graph_item.id], dict):
                     graph_item_headers = task.user_tokens[graph_item.id]
@@ -11,6 +11,7 @@ async def dispatch_get_args(
     tools: Optional[List[Callable]] = None,
     is_async: Optional[bool] = True,
     auth_events_callback: Optional[Callable] = None,
+    timings: Optional[Dict[str, float]] = None,
 ) -> Dict[str, Any]:
     """
     Dispatch to the correct framework-specific argument resolver.
@@ -22,6 +23,7 @@ async def dispatch_get_args(
         tools (Optional[List[Callable]]): Optional additional tools to be added to the agent arguments.
         is_async (Optional[bool]): Is in Async Context?.
         auth_events_callback (Optional[Callable]): Optional callback function (async or sync) that receives (agent, task, event) for authentication events only.
+        timings (Optional[Dict[str, float]]): If provided, filled with the duration in seconds of every build stage.
 
     Returns:
         Dict[str, Any]: Arguments for instantiating the framework agent.
@@ -30,7 +32,7 @@ async def dispatch_get_args(
     match agent.framework:
         case Framework.Agno:
             from .agno import build_agent_args
-            return await build_agent_args(xpander_agent=agent, task=task, override=override, tools=tools, is_async=is_async, auth_events_callback=auth_events_callback)
+            return await build_agent_args(xpander_agent=agent, task=task, override=override, tools=tools, is_async=is_async, auth_events_callback=auth_events_callback, timings=timings)
         # case Framework.Langchain: # PLACEHOLDER
         #     from .langchain import build_agent_args
         #     return await build_agent_args(xpander_agent=agent, task=task, override=override)
@@ -0,0 +1,83 @@
+"""
+Organization default LLM extra headers, cached per organization.
+
+The headers are org-wide and rarely change, so they are cached with a TTL.
+Once an entry is older than the TTL it is still served while a single
+background refresh fetches the new value (stale-while-revalidate); only
+entries older than TTL + stale window are fetched in the foreground.
+"""
+
+import asyncio
+import time
+from os import getenv
+from typing import Dict, Optional, Set, Tuple
+
+from loguru import logger
+
+from xpander_sdk.consts.api_routes import APIRoute
+from xpander_sdk.core.xpander_api_client import APIClient
+from xpander_sdk.models.configuration import Configuration
+from xpander_sdk.utils.cache import TTLCache
+
+LLM_HEADERS_TTL = float(getenv("XPANDER_LLM_HEADERS_CACHE_TTL", "300"))
+LLM_HEADERS_STALE_WINDOW = float(getenv("XPANDER_LLM_HEADERS_STALE_WINDOW", "3600"))
+
+# key -> (fetched_at, headers); entries are dropped once past TTL + stale window
+_headers_cache: TTLCache[Tuple[float, Dict[str, str]]] = TTLCache(
+    maxsize=256, ttl=LLM_HEADERS_TTL + LLM_HEADERS_STALE_WINDOW
+)
+_refreshing: Set[Tuple] = set()
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _cache_key(configuration: Configuration) -> Tuple:
+    return (configuration.get_full_url(), configuration.organization_id, configuration.api_key)
+
+
+async def _afetch(configuration: Configuration, key: Tuple) -> Dict[str, str]:
+    client = APIClient(configuration=configuration)
+    headers = await client.make_request(path=APIRoute.GetOrgDefaultLLMExtraHeaders)
+    headers = headers if isinstance(headers, dict) else {}
+    _headers_cache.set(key, (time.monotonic(), headers))
+    _refreshing.discard(key)
+    return headers
+
+
+async def _arefresh(configuration: Configuration, key: Tuple) -> None:
+    try:
+        await _afetch(configuration, key)
+    except Exception as e:
+        _refreshing.discard(key)
+        logger.warning(f"Failed to refresh organization default LLM headers - {str(e)}")
+
+
+async def aget_org_default_llm_headers(configuration: Configuration) -> Dict[str, str]:
+    """
+    Return the organization default LLM extra headers.
+
+    Args:
+        configuration (Configuration): Configuration of the organization.
+
+    Returns:
+        Dict[str, str]: The headers (a private copy), empty if the organization has none.
+
+    Raises:
+        httpx.HTTPStatusError: If the headers are not cached and fetching them fails.
+    """
+    key = _cache_key(configuration)
+    entry: Optional[Tuple[float, Dict[str, str]]] = _headers_cache.get(key)
+    if entry is None:
+        return dict(await _afetch(configuration, key))
+
+    fetched_at, headers = entry
+    if time.monotonic() - fetched_at >= LLM_HEADERS_TTL and key not in _refreshing:
+        _refreshing.add(key)
+        task = asyncio.get_running_loop().create_task(_arefresh(configuration, key))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    return dict(headers)
+
+
+def invalidate_org_default_llm_headers() -> None:
+    """Drop all cached organization default LLM headers."""
+    _headers_cache.clear()
@@ -50,7 +50,8 @@ def on_task(
     _func: Optional[Callable] = None,
     *,
     configuration: Optional[Configuration] = None,
-    test_task: Optional[LocalTaskTest] = None
+    test_task: Optional[LocalTaskTest] = None,
+    processes: Optional[int] = None,
 ):
     """
     Decorator to register a handler as an event-driven task executor.
@@ -71,6 +72,8 @@ def on_task(
             An optional configuration object used to initialize the Events module.
         test_task (Optional[LocalTaskTest]):
             Optional simulated task used for local development or testing.
+        processes (Optional[int]):
+            Number of worker processes handling tasks. Defaults to XPANDER_WORKER_PROCESSES or 1.
 
     Raises:
         TypeError: If the decorated function does not accept a `task` parameter.
@@ -193,7 +196,7 @@ def on_task(
                     print(f"Using output schema: {output_schema}")
         
         events_module = Events(configuration=configuration)
-        events_module.register(on_task=wrapped, test_task=effective_test_task)
+        events_module.register(on_task=wrapped, test_task=effective_test_task, processes=processes)
         
         return wrapped
 
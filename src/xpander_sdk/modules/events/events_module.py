@@ -8,11 +8,14 @@ based on events within the xpander.ai platform. It supports asynchronous executi
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import json
 import json as py_json
 import os
 import signal
 import sys
+import time
 from os import getenv
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Awaitable, Callable, Optional, Set, Union, List
@@ -22,14 +25,23 @@ from httpx_sse import aconnect_sse
 from loguru import logger
 from pydantic import BaseModel
 
+from xpander_sdk.core.background_reporter import telemetry_reporter
+from xpander_sdk.core.http_client_pool import HTTPClientPool
 from xpander_sdk.core.module_base import ModuleBase
+from xpander_sdk.core.timeouts import deadline, without_deadline
+from xpander_sdk.core.xpander_api_client import APIClient
 from xpander_sdk.exceptions.module_exception import ModuleException
 from xpander_sdk.models.configuration import Configuration
 from xpander_sdk.models.shared import OutputFormat
 from xpander_sdk.modules.agents.models.agent import SourceNodeType
 from xpander_sdk.modules.tasks.tasks_module import Tasks
 
+from .utils.admission_queue import AdmissionQueue, AdmissionStats
+from .utils.capacity_notifier import CapacityNotifier, CapacityNotifierStats
+from .utils.concurrency_controller import AdaptiveConcurrencyController, CapacityReport
+from .utils.continuations import ContinuationPolicy, ContinuationStats, PlanContinuation
 from .utils.git_init import configure_git_credentials
+from .utils.worker_supervisor import WORKER_PROCESS_COUNT_ENV, WORKER_PROCESS_INDEX_ENV, WorkerSupervisor
 from .utils.generic import backoff_delay, get_events_base, get_events_headers
 from .models.deployments import DeployedAsset
 from .models.events import (
@@ -44,6 +56,7 @@ from ..tasks.models.task import AgentExecutionStatus, LocalTaskTest
 
 
 _MAX_RETRIES = 5  # total attempts (1 initial + 4 retries)
+_REPORTER_DRAIN_TIMEOUT = float(getenv("XPANDER_REPORTER_DRAIN_TIMEOUT", "10"))
 
 ExecutionRequestHandler = Union[
     Callable[[Task], Task],
@@ -93,6 +106,12 @@ class Events(ModuleBase):
         configuration: Optional[Configuration] = None,
         max_sync_workers: Optional[int] = 6,
         max_retries: Optional[int] = _MAX_RETRIES,
+        task_timeout: Optional[float] = None,
+        max_queued_tasks: Optional[int] = None,
+        max_async_tasks: Optional[int] = None,
+        adaptive_concurrency: Optional[bool] = None,
+        continuation_policy: Optional[ContinuationPolicy] = None,
+        drain_timeout: Optional[float] = None,
     ):
         """
         Initialize the Events module with configuration and worker settings.
@@ -103,6 +122,22 @@ class Events(ModuleBase):
             configuration (Optional[Configuration]): SDK configuration with credentials and endpoints. Defaults to environment configuration.
             max_sync_workers (Optional[int]): Maximum number of synchronous worker threads. Defaults to 6.
             max_retries (Optional[int]): Maximum retry attempts for network calls. Defaults to 5.
+            task_timeout (Optional[float]): Deadline in seconds for handling a task. All API calls made
+                while handling it are capped by this deadline. Defaults to XPANDER_TASK_TIMEOUT, if set.
+            max_queued_tasks (Optional[int]): Maximum tasks waiting for an execution slot; further tasks
+                are rejected. Defaults to XPANDER_MAX_QUEUED_TASKS or 100.
+            max_async_tasks (Optional[int]): Maximum concurrent tasks for async handlers (sync
+                handlers are bound by `max_sync_workers`). Defaults to XPANDER_MAX_ASYNC_TASKS or 64.
+            adaptive_concurrency (Optional[bool]): Adjust the number of concurrent tasks to task latency,
+                event loop lag and memory (XPANDER_WORKER_MAX_RSS_MB). Defaults to
+                XPANDER_ADAPTIVE_CONCURRENCY (disabled unless set to "true"). When disabled, up to
+                `max_sync_workers` (sync handlers) or `max_async_tasks` (async handlers) tasks run at once;
+                when enabled, the limit starts at `max_sync_workers` and adapts up to that maximum.
+            continuation_policy (Optional[ContinuationPolicy]): Budget, backoff and requeueing of
+                handler re-runs for tasks whose deep plan is not complete. Defaults to environment settings.
+            drain_timeout (Optional[float]): On SIGTERM/SIGINT, stop receiving tasks and give queued and
+                running ones this many seconds to finish before stopping. Defaults to XPANDER_DRAIN_TIMEOUT,
+                if set; without it tasks are cancelled right away.
 
         Raises:
             ModuleException: When required environment variables are missing or configuration is incorrect.
@@ -129,6 +164,20 @@ class Events(ModuleBase):
 
         self.max_retries = max_retries
         self.max_sync_workers = max_sync_workers
+        self.max_queued_tasks = max_queued_tasks or int(getenv("XPANDER_MAX_QUEUED_TASKS", "100"))
+        self.max_async_tasks = max_async_tasks or int(getenv("XPANDER_MAX_ASYNC_TASKS", "64"))
+        self.adaptive_concurrency = (
+            adaptive_concurrency
+            if adaptive_concurrency is not None
+            else getenv("XPANDER_ADAPTIVE_CONCURRENCY", "false") == "true"
+        )
+        self.continuation_policy = continuation_policy or ContinuationPolicy()
+        self.drain_timeout = drain_timeout or (
+            float(getenv("XPANDER_DRAIN_TIMEOUT")) if getenv("XPANDER_DRAIN_TIMEOUT") else None
+        )
+        self.task_timeout = task_timeout or (
+            float(getenv("XPANDER_TASK_TIMEOUT")) if getenv("XPANDER_TASK_TIMEOUT") else None
+        )
 
         # Internal resources
         self._pool: ThreadPoolExecutor = ThreadPoolExecutor(
@@ -136,7 +185,18 @@ class Events(ModuleBase):
             thread_name_prefix="xpander-handler",
         )
         self._bg: Set[asyncio.Task] = set()
-        self._execution_semaphore: Optional[asyncio.Semaphore] = None
+        self._admission: Optional[AdmissionQueue] = None
+        self._concurrency: Optional[AdaptiveConcurrencyController] = None
+        self._handler_kind = "sync"
+        self._continuation_stats = ContinuationStats()
+        self._pending_continuations = 0
+        self._reader: Optional[asyncio.Task] = None
+        self._shutdown: Optional[asyncio.Task] = None
+        self._draining: Optional[asyncio.Task] = None
+        self._capacity_notifier = CapacityNotifier(
+            send=lambda is_busy: self._notify_capacity_status(self.worker.id, is_busy=is_busy),
+            window=float(getenv("XPANDER_CAPACITY_NOTIFY_WINDOW", "1")),
+        )
 
         logger.debug(
             f"Events initialised (base_url={self.configuration.base_url}, "
@@ -153,7 +213,9 @@ class Events(ModuleBase):
 
         This method sets up signal handling for graceful shutdown, registers the
         agent worker directly, and begins listening to task execution requests over SSE.
-        Use the @on_task decorator instead of calling this method directly.
+        It returns when the event stream ends, e.g. on an environment conflict, or
+        once a shutdown completes. Use the @on_task decorator instead of calling this
+        method directly.
 
         Args:
             on_execution_request (ExecutionRequestHandler): Callback handler
@@ -162,24 +224,97 @@ class Events(ModuleBase):
         # Execute boot handlers first, before any event listeners are set up
         await self._execute_boot_handlers()
         
-        # Initialize semaphore for capacity tracking
-        self._execution_semaphore = asyncio.Semaphore(self.max_sync_workers)
+        # sync handlers are bound by the handler thread pool, async ones by the loop
+        is_async_handler = asyncio.iscoroutinefunction(on_execution_request)
+        max_limit = self.max_async_tasks if is_async_handler else self.max_sync_workers
+        self._concurrency = AdaptiveConcurrencyController(
+            initial_limit=self.max_sync_workers if self.adaptive_concurrency else max_limit,
+            min_limit=1,
+            max_limit=max_limit,
+            max_rss_mb=float(getenv("XPANDER_WORKER_MAX_RSS_MB")) if getenv("XPANDER_WORKER_MAX_RSS_MB") else None,
+        )
+        # Tasks wait here for an execution slot, so the SSE reader never blocks
+        self._admission = AdmissionQueue(
+            concurrency=self._concurrency.limit, max_size=self.max_queued_tasks
+        )
+        self._handler_kind = "async" if is_async_handler else "sync"
+        # admission loops, running for as long as the event stream is read
+        admission = [asyncio.create_task(self._dispatch_admitted_tasks(on_execution_request))]
+        if self.adaptive_concurrency:
+            admission.append(asyncio.create_task(self._concurrency.arun(self._admission)))
+        for admission_task in admission:
+            self.track(admission_task)
         
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(
-                sig, lambda s=sig: asyncio.create_task(self.stop(s))
-            )
+            loop.add_signal_handler(sig, self._on_signal, sig)
 
         # Register agent worker directly
-        self.track(
-            asyncio.create_task(
-                self.register_agent_worker(self.agent_id, on_execution_request)
-            )
+        self._reader = asyncio.create_task(
+            self.register_agent_worker(self.agent_id, on_execution_request)
         )
+        self.track(self._reader)
 
         logger.info("Listener started; waiting for events…")
-        await asyncio.gather(*self._bg)
+        try:
+            await self._reader
+        except asyncio.CancelledError:
+            # draining cancels the event stream reader
+            if not self._shutdown:
+                raise
+        finally:
+            if not self._shutdown:
+                # the event stream ended (e.g. on an environment conflict), no tasks will arrive
+                for admission_task in admission:
+                    admission_task.cancel()
+                await asyncio.gather(*admission, return_exceptions=True)
+        if self._shutdown:
+            await self._shutdown
+
+    def _on_signal(self, sig: signal.Signals) -> None:
+        if not self._shutdown:
+            self._shutdown = asyncio.create_task(self._ashutdown(sig))
+        elif self._draining and not self._draining.done():
+            logger.warning(f"Received {sig.name} again – skipping the drain")
+            self._draining.cancel()
+
+    async def _ashutdown(self, sig: signal.Signals) -> None:
+        """Drain (if `drain_timeout` is set), then stop."""
+        if self.drain_timeout:
+            logger.info(f"Received {sig.name} – draining tasks for up to {self.drain_timeout:.0f}s…")
+            self._draining = asyncio.create_task(self.adrain(timeout=self.drain_timeout))
+            await asyncio.wait([self._draining])
+        await self.stop(sig)
+
+    async def adrain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop receiving tasks and wait for queued and running ones to finish.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait, None to wait indefinitely.
+
+        Returns:
+            bool: True if all tasks finished, False if the timeout expired first.
+
+        Example:
+            >>> if not await events.adrain(timeout=30):
+            ...     logger.warning("Stopping with unfinished tasks")
+            >>> await events.stop()
+        """
+        if self._reader:
+            self._reader.cancel()
+        started_at = time.monotonic()
+        while self._admission and (
+            self._admission.depth or self._admission.stats.in_flight or self._pending_continuations
+        ):
+            if timeout is not None and time.monotonic() - started_at >= timeout:
+                logger.warning(
+                    f"Drain timed out with {self._admission.stats.in_flight} running and "
+                    f"{self._admission.depth + self._pending_continuations} queued tasks"
+                )
+                return False
+            await asyncio.sleep(0.1)
+        return True
 
     async def stop(self, sig: signal.Signals | None = None) -> None:
         """
@@ -199,11 +334,21 @@ class Events(ModuleBase):
         if self._bg:
             await asyncio.gather(*self._bg, return_exceptions=True)
 
+        self._capacity_notifier.close()
         self._pool.shutdown(wait=False, cancel_futures=True)
         self._bg.clear()
         
         # Execute shutdown handlers after stopping event listeners but before final cleanup
         await self._execute_shutdown_handlers()
+
+        # Send queued monitoring reports while connections are still open
+        try:
+            await telemetry_reporter.adrain(timeout=_REPORTER_DRAIN_TIMEOUT)
+        except Exception:
+            logger.warning(f"Dropped {telemetry_reporter.stats.pending} unsent monitoring reports on shutdown")
+
+        # Release pooled keep-alive connections
+        await APIClient.aclose_connections()
         
         logger.info("Listener stopped.")
 
@@ -244,14 +389,15 @@ class Events(ModuleBase):
         last_exc: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.request(
-                        method,
-                        url,
-                        headers=headers,
-                        json=json,
-                        follow_redirects=True,
-                    )
+                client = HTTPClientPool.get_client(configuration=self.configuration)
+                response = await client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=json,
+                    follow_redirects=True,
+                    timeout=timeout,
+                )
                 return response
             except Exception as exc:  # noqa: BLE001 broad (includes timeouts)
                 last_exc = exc
@@ -274,12 +420,15 @@ class Events(ModuleBase):
             worker_id (str): The unique identifier of the worker.
             is_busy (bool): Whether the worker is at max capacity.
         """
+        data = {"is_busy": is_busy}
+        if capacity := self.capacity:
+            data["capacity"] = capacity.model_dump()
         url = f"{get_events_base(configuration=self.configuration)}/{worker_id}?type=worker&agent_id={self.agent_id}"
         await self._request_with_retries(
             "POST",
             url,
             headers=get_events_headers(configuration=self.configuration),
-            json=WorkerCapacityUpdateEvent(data={"is_busy": is_busy}).model_dump_safe(),
+            json=WorkerCapacityUpdateEvent(data=data).model_dump_safe(),
         )
 
     async def _release_worker(self, worker_id: str) -> None:
@@ -348,31 +497,122 @@ class Events(ModuleBase):
                 await asyncio.sleep(backoff_delay(attempt))
                 attempt += 1
 
-    async def _handle_task_with_semaphore(
+    @property
+    def admission_stats(self) -> Optional[AdmissionStats]:
+        """
+        Queue depth, wait time and rejection counters of incoming tasks.
+
+        Returns:
+            Optional[AdmissionStats]: The counters, None before `start`.
+        """
+        return self._admission.stats if self._admission else None
+
+    @property
+    def continuation_stats(self) -> ContinuationStats:
+        """
+        Counters of plan continuations.
+
+        Returns:
+            ContinuationStats: Current counters.
+        """
+        return self._continuation_stats.model_copy()
+
+    @property
+    def capacity_notifier_stats(self) -> CapacityNotifierStats:
+        """
+        Counters of busy state transitions and of capacity notifications sent.
+
+        Returns:
+            CapacityNotifierStats: Current counters.
+        """
+        return self._capacity_notifier.stats
+
+    @property
+    def capacity(self) -> Optional[CapacityReport]:
+        """
+        Current concurrency limit, load and overload signals of the worker.
+
+        Returns:
+            Optional[CapacityReport]: The report, None before `start`.
+        """
+        if not (self._admission and self._concurrency):
+            return None
+        stats = self._admission.stats
+        controller = self._concurrency
+        return CapacityReport(
+            handler_kind=self._handler_kind,
+            limit=self._admission.concurrency,
+            max_limit=controller.max_limit,
+            in_flight=stats.in_flight,
+            queued=stats.depth,
+            free_slots=self._admission.free_slots,
+            latency_ms=controller.latency * 1000 if controller.latency is not None else None,
+            loop_lag_ms=controller.loop_lag * 1000 if controller.loop_lag is not None else None,
+            rss_mb=controller.rss_mb,
+            process_index=int(getenv(WORKER_PROCESS_INDEX_ENV)) if getenv(WORKER_PROCESS_INDEX_ENV) else None,
+            process_count=int(getenv(WORKER_PROCESS_COUNT_ENV, "1")),
+        )
+
+    def _update_capacity(self) -> None:
+        """Report the worker busy while no slot is free or tasks are waiting (debounced)."""
+        if self._admission and self.worker:
+            self._capacity_notifier.update(
+                is_busy=self._admission.free_slots == 0 or self._admission.depth > 0
+            )
+
+    async def _dispatch_admitted_tasks(self, on_execution_request: ExecutionRequestHandler) -> None:
+        """Start queued tasks as execution slots free up."""
+        while True:
+            agent_worker, task, continuation = await self._admission.admit()
+
+            self._update_capacity()
+            self.track(
+                asyncio.create_task(
+                    self._handle_admitted_task(agent_worker, task, on_execution_request, continuation)
+                )
+            )
+
+    async def _handle_admitted_task(
         self,
         agent_worker: DeployedAsset,
         task: Task,
         on_execution_request: ExecutionRequestHandler,
+        continuation: Optional[PlanContinuation] = None,
     ) -> None:
         """
-        Wrapper that releases semaphore after task execution.
-        Semaphore is already acquired before calling this method.
+        Wrapper that releases the execution slot after task execution.
+        The slot is already taken before calling this method.
         """
+        started_at = time.monotonic()
         try:
-            await self.handle_task_execution_request(
-                agent_worker, task, on_execution_request
-            )
+            if continuation:
+                # a requeued continuation keeps the deadline of its task
+                expires_at = continuation.expires_at
+                with deadline(expires_at - time.monotonic() if expires_at is not None else None):
+                    await self.handle_task_execution_request(
+                        agent_worker, task, on_execution_request, retry_count=continuation.attempt
+                    )
+            else:
+                await self.handle_task_execution_request(
+                    agent_worker, task, on_execution_request
+                )
         finally:
             # Release execution slot
-            self._execution_semaphore.release()
-            
-            # Check if we now have available capacity and notify backend
-            if self._execution_semaphore._value > 0:
-                try:
-                    await self._notify_capacity_status(agent_worker.id, is_busy=False)
-                except Exception as e:
-                    logger.warning(f"Failed to notify available status: {e}")
-    
+            self._admission.release()
+            if self._concurrency:
+                self._concurrency.observe(time.monotonic() - started_at)
+
+            self._update_capacity()
+
+    async def _reject_task(self, task: Task) -> None:
+        """Fail a task that could not be queued."""
+        try:
+            task.status = AgentExecutionStatus.Error
+            task.result = "Worker is at capacity and its task queue is full"
+            await task.asave()
+        except Exception as e:
+            logger.warning(f"Failed to reject task {task.id}: {e}")
+
     async def handle_task_execution_request(
         self,
         agent_worker: DeployedAsset,
@@ -383,47 +623,88 @@ class Events(ModuleBase):
         """
         Handle an incoming task execution request.
 
+        While the task's deep plan is not complete, the handler is run again
+        (see `continuation_policy`), up to the task's continuation budget.
+
         Args:
             agent_worker (DeployedAsset): The deployed asset (agent) to handle the task.
             task (Task): The task object containing execution details.
             on_execution_request (ExecutionRequestHandler): The handler function to process the task.
-            retry_count (Optional[int]): Current retry attempt count. Defaults to 0.
+            retry_count (Optional[int]): Continuations already run for the task. Defaults to 0.
         """
+        policy = self.continuation_policy
+        attempt = retry_count or 0
         error = None
+        requeued = False
         try:
-            logger.info(f"Handling task {task.id}")
-            await task.aset_status(status=AgentExecutionStatus.Executing)
-            if asyncio.iscoroutinefunction(on_execution_request):
-                task = await on_execution_request(task)
-            else:
-                task = await asyncio.get_running_loop().run_in_executor(
-                    self._pool,
-                    on_execution_request,
-                    task,
-                )
-            
-            # Check if plan is complete, retry if not
-            plan_following_status = await task.aget_plan_following_status()
-            if not plan_following_status.can_finish:
-                # Check if we've exceeded max retries
-                if retry_count >= 50:  # 0, 1, 2 = 50 total attempts
-                    logger.warning(f"Failed to complete plan after {retry_count + 1} attempts. Remaining incomplete tasks.")
-                    return
-                
-                # Recursively call with incremented retry count
-                logger.info(f"Plan not complete, retrying (attempt {retry_count + 2})")
-                await self.handle_task_execution_request(
-                    agent_worker,
-                    task,
-                    on_execution_request,
-                    retry_count=retry_count + 1
-                )
-                return
-            
+            # the task deadline (if any) caps every API call made while handling the task,
+            # including plan continuations
+            with deadline(self.task_timeout if not attempt else None) as expires_at:
+                logger.info(f"Handling task {task.id}")
+                while True:
+                    started_at = time.monotonic()
+                    await task.aset_status(status=AgentExecutionStatus.Executing)
+                    if asyncio.iscoroutinefunction(on_execution_request):
+                        task = await on_execution_request(task)
+                    else:
+                        # copy the context so the task deadline applies to the handler's API calls
+                        task = await asyncio.get_running_loop().run_in_executor(
+                            self._pool,
+                            functools.partial(contextvars.copy_context().run, on_execution_request, task),
+                        )
+
+                    # Check if plan is complete, continue if not
+                    plan_following_status = await task.aget_plan_following_status()
+                    if attempt:
+                        self._continuation_stats.total_seconds += time.monotonic() - started_at
+                    if plan_following_status.can_finish:
+                        break
+                    if attempt >= policy.max_continuations:
+                        logger.warning(f"Failed to complete plan after {attempt + 1} attempts. Remaining incomplete tasks.")
+                        self._continuation_stats.exhausted += 1
+                        break
+
+                    attempt += 1
+                    self._continuation_stats.continuations += 1
+                    if policy.requeue and self._admission:
+                        logger.info(f"Plan not complete, queueing continuation (attempt {attempt + 1})")
+                        self._continuation_stats.requeued += 1
+                        self.track(
+                            asyncio.create_task(
+                                self._requeue_continuation(
+                                    (agent_worker, task, PlanContinuation(attempt, expires_at)),
+                                    delay=policy.delay(attempt),
+                                )
+                            )
+                        )
+                        requeued = True
+                        return
+
+                    logger.info(f"Plan not complete, continuing (attempt {attempt + 1})")
+                    await asyncio.sleep(policy.delay(attempt))
+
         except Exception as e:
             logger.exception(f"Execution handler failed - {str(e)}")
             error = str(e)
         finally:
+            if not requeued:
+                await self._finish_task(task, error)
+
+    async def _requeue_continuation(self, item: tuple, delay: float) -> None:
+        """Queue a continuation for admission after its backoff, without holding a slot."""
+        self._pending_continuations += 1
+        try:
+            await asyncio.sleep(delay)
+            # the task was accepted already, so its continuation is queued even if the queue is full
+            self._admission.offer(item, priority=0, force=True)
+        finally:
+            self._pending_continuations -= 1
+        self._update_capacity()
+
+    async def _finish_task(self, task: Task, error: Optional[str]) -> None:
+        """Persist the outcome of a handled task."""
+        # persist the outcome even if the task deadline has passed
+        with without_deadline():
             task_used_tokens = task.tokens
             task_used_tools = task.used_tools
 
@@ -444,38 +725,38 @@ class Events(ModuleBase):
                         task.result = py_json.dumps(task.result)
             except Exception:
                 pass
-            
+        
             await task.asave()
             task.tokens = task_used_tokens
             task.used_tools = task_used_tools
-            
+        
             if task.tokens:
                 await task.areport_metrics()
 
-            logger.info(f"Finished handling task {task.id}")
+        logger.info(f"Finished handling task {task.id}")
 
-            # local test task, finish? kill the worker
-            if self.test_task:
-                logger.info("Local task handled, exiting")
-                
-                # Print the task result for CLI
-                if task.result:
-                    logger.info("\n" + "="*50)
-                    logger.info("TASK RESULT:")
-                    logger.info("="*50)
-                    if isinstance(task.result, (dict, list)):
-                        import json
-                        logger.info(json.dumps(task.result, indent=2))
-                    else:
-                        logger.info(task.result)
-                    logger.info("="*50 + "\n")
+        # local test task, finish? kill the worker
+        if self.test_task:
+            logger.info("Local task handled, exiting")
+            
+            # Print the task result for CLI
+            if task.result:
+                logger.info("\n" + "="*50)
+                logger.info("TASK RESULT:")
+                logger.info("="*50)
+                if isinstance(task.result, (dict, list)):
+                    import json
+                    logger.info(json.dumps(task.result, indent=2))
                 else:
-                    logger.info("\n" + "="*50)
-                    logger.info("TASK COMPLETED (No result set)")
-                    logger.info("="*50 + "\n")
-                
-                # Use os._exit to avoid exception traceback from asyncio
-                os._exit(0)
+                    logger.info(task.result)
+                logger.info("="*50 + "\n")
+            else:
+                logger.info("\n" + "="*50)
+                logger.info("TASK COMPLETED (No result set)")
+                logger.info("="*50 + "\n")
+            
+            # Use os._exit to avoid exception traceback from asyncio
+            os._exit(0)
 
     async def register_agent_worker(
         self,
@@ -556,24 +837,15 @@ class Events(ModuleBase):
 
             elif event.event == EventType.AgentExecution:
                 task = Task(**json.loads(event.data), configuration=self.configuration)
-                
-                # Acquire execution slot immediately (blocks here if at max capacity)
-                await self._execution_semaphore.acquire()
-                
-                # Check if we're now at max capacity and notify backend
-                if self._execution_semaphore._value == 0:
-                    try:
-                        await self._notify_capacity_status(agent_worker.id, is_busy=True)
-                    except Exception as e:
-                        logger.warning(f"Failed to notify busy status: {e}")
-                
-                self.track(
-                    asyncio.create_task(
-                        self._handle_task_with_semaphore(
-                            agent_worker, task, on_execution_request
-                        )
+
+                # sub-tasks first: their parent execution holds a slot while waiting on them
+                priority = 0 if task.parent_execution else 1
+                if not self._admission.offer((agent_worker, task, None), priority=priority):
+                    logger.warning(
+                        f"Rejecting task {task.id} - {self.max_queued_tasks} tasks already waiting for a slot"
                     )
-                )
+                    self.track(asyncio.create_task(self._reject_task(task)))
+                self._update_capacity()
 
 
     # --------------------------------------------------------------------- #
@@ -609,13 +881,22 @@ class Events(ModuleBase):
         self,
         on_task: ExecutionRequestHandler,
         test_task: Optional[LocalTaskTest] = None,
+        processes: Optional[int] = None,
     ) -> None:
         """
         Register the event listener with optional test task in synchronous or asynchronous environments.
 
+        With more than one process, a supervisor forks that many worker processes,
+        each with its own event loop, handler pool and event stream subscription, so
+        CPU-bound handlers are not limited to one core. Each process registers as a
+        separate worker and reports its own capacity. On SIGTERM/SIGINT the workers
+        drain their tasks for `drain_timeout` seconds (30 unless set) before stopping.
+        Multiple processes require `os.fork` and a caller without a running event loop.
+
         Args:
             on_task (ExecutionRequestHandler): Callback handler for task execution.
             test_task (Optional[LocalTaskTest]): Optional local test task for diagnostics and testing.
+            processes (Optional[int]): Number of worker processes. Defaults to XPANDER_WORKER_PROCESSES or 1.
 
         Example:
             >>> def handle_task(task):
@@ -624,8 +905,21 @@ class Events(ModuleBase):
             >>> events = Events()
             >>> events.register(on_task=handle_task)
         """
+        self.test_task = test_task
+        processes = processes or int(getenv("XPANDER_WORKER_PROCESSES", "1"))
+        if processes > 1 and not test_task:
+            if self._can_fork_workers():
+                self.drain_timeout = self.drain_timeout or 30.0
+                WorkerSupervisor(
+                    processes=processes,
+                    run_worker=lambda index: asyncio.run(self.start(on_task)),
+                    # leave the workers time to stop after draining
+                    drain_timeout=self.drain_timeout + 10,
+                ).run()
+                return
+            logger.warning("Multiple worker processes need os.fork and no running event loop, using one process")
+
         try:
-            self.test_task = test_task
             loop = asyncio.get_running_loop()
             if loop.is_running():
                 loop.create_task(self.start(on_task))
@@ -635,6 +929,16 @@ class Events(ModuleBase):
             # No running loop, safe to run
             asyncio.run(self.start(on_task))
     
+    @staticmethod
+    def _can_fork_workers() -> bool:
+        if not hasattr(os, "fork"):
+            return False
+        try:
+            asyncio.get_running_loop()
+            return False
+        except RuntimeError:
+            return True
+
     # --------------------------------------------------------------------- #
     # Boot and Shutdown Handler Management                                  #
     # --------------------------------------------------------------------- #
@@ -0,0 +1,160 @@
+"""
+Admission control for task execution requests received by the Events worker.
+
+Requests are queued by priority as they arrive, so the SSE reader never
+blocks, and admitted one by one as execution slots free up.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Generic, List, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class AdmissionStats(BaseModel):
+    """
+    Snapshot of admission queue counters.
+
+    Attributes:
+        depth (int): Requests waiting for a slot.
+        in_flight (int): Admitted requests holding a slot.
+        admitted (int): Requests admitted so far.
+        rejected (int): Requests rejected because the queue was full.
+        total_wait_seconds (float): Total time admitted requests waited in the queue.
+        max_wait_seconds (float): Longest time a request waited in the queue.
+    """
+
+    depth: int = 0
+    in_flight: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """
+        Average time admitted requests waited in the queue.
+
+        Returns:
+            float: Seconds, 0 if nothing was admitted.
+        """
+        return self.total_wait_seconds / self.admitted if self.admitted else 0.0
+
+
+class AdmissionQueue(Generic[T]):
+    """
+    Bounded priority queue of requests admitted up to a concurrency limit.
+
+    `offer` never blocks: it queues the request or rejects it when the queue
+    is full. `admit` waits until a slot is free and a request is queued, and
+    returns the request with the lowest priority value (FIFO among equals).
+    Every admitted request must be followed by a `release` of its slot.
+
+    Args:
+        concurrency (int): Maximum requests in flight.
+        max_size (int): Maximum queued requests.
+
+    Example:
+        >>> queue = AdmissionQueue(concurrency=4, max_size=100)
+        >>> queue.offer(task, priority=1)
+        >>> task = await queue.admit()
+        >>> try:
+        ...     await handle(task)
+        ... finally:
+        ...     queue.release()
+    """
+
+    def __init__(self, concurrency: int, max_size: int):
+        self.concurrency = concurrency
+        self.max_size = max_size
+        self._heap: List[Tuple[int, int, float, T]] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._changed = asyncio.Event()
+        self._stats = AdmissionStats()
+
+    def offer(self, item: T, priority: int = 0, force: bool = False) -> bool:
+        """
+        Queue a request without blocking.
+
+        Args:
+            item (T): The request.
+            priority (int): Lower values are admitted first.
+            force (bool): Queue the request even when the queue is full, for
+                work accepted earlier.
+
+        Returns:
+            bool: False if the queue is full and the request was rejected.
+        """
+        if len(self._heap) >= self.max_size and not force:
+            self._stats.rejected += 1
+            return False
+        heapq.heappush(self._heap, (priority, next(self._sequence), time.monotonic(), item))
+        self._changed.set()
+        return True
+
+    async def admit(self) -> T:
+        """
+        Wait for a free slot and a queued request, and take both.
+
+        Returns:
+            T: The next request by priority.
+        """
+        while not (self._heap and self._in_flight < self.concurrency):
+            self._changed.clear()
+            await self._changed.wait()
+
+        _, _, queued_at, item = heapq.heappop(self._heap)
+        waited = time.monotonic() - queued_at
+        self._in_flight += 1
+        self._stats.admitted += 1
+        self._stats.total_wait_seconds += waited
+        self._stats.max_wait_seconds = max(self._stats.max_wait_seconds, waited)
+        return item
+
+    def set_concurrency(self, concurrency: int) -> None:
+        """
+        Change the number of slots. Requests in flight above a lowered limit
+        finish normally; no new request is admitted until they do.
+
+        Args:
+            concurrency (int): New maximum of requests in flight.
+        """
+        self.concurrency = concurrency
+        self._changed.set()
+
+    def release(self) -> None:
+        """Free the slot of a finished request."""
+        self._in_flight -= 1
+        self._changed.set()
+
+    @property
+    def is_full(self) -> bool:
+        """Whether every slot is taken."""
+        return self._in_flight >= self.concurrency
+
+    @property
+    def free_slots(self) -> int:
+        """Number of requests that can be admitted right away."""
+        return max(0, self.concurrency - self._in_flight)
+
+    @property
+    def depth(self) -> int:
+        """Number of queued requests."""
+        return len(self._heap)
+
+    @property
+    def stats(self) -> AdmissionStats:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            AdmissionStats: Current counters.
+        """
+        return self._stats.model_copy(update={"depth": len(self._heap), "in_flight": self._in_flight})
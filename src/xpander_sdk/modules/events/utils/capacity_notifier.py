@@ -0,0 +1,120 @@
+"""
+Debounced worker capacity notifications.
+
+The worker's busy state can flip on every task start and finish when it runs
+near capacity. `CapacityNotifier` tracks the desired state and only reports it
+once it has held for a settle window, so a burst of transitions costs at most
+one request.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+
+
+class CapacityNotifierStats(BaseModel):
+    """
+    Snapshot of notifier counters.
+
+    Attributes:
+        transitions (int): Busy state changes observed.
+        sent (int): Notifications sent.
+        failed (int): Notifications that could not be sent.
+    """
+
+    transitions: int = 0
+    sent: int = 0
+    failed: int = 0
+
+
+class CapacityNotifier:
+    """
+    State machine coalescing busy/available transitions into sustained changes.
+
+    A change is sent once the state has not changed for `window` seconds, or
+    at the latest `max_delay` seconds after the first unsent change, so a
+    worker flapping continuously still reports its current state. Changes
+    that revert before being sent are dropped.
+
+    Args:
+        send (Callable[[bool], Awaitable[None]]): Sends the busy state to the backend.
+        window (float): Seconds a state must hold before it is sent.
+        max_delay (Optional[float]): Maximum seconds a change waits, defaults to 5 windows.
+
+    Example:
+        >>> notifier = CapacityNotifier(send=notify_backend, window=1.0)
+        >>> notifier.update(is_busy=True)
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bool], Awaitable[None]],
+        window: float = 1.0,
+        max_delay: Optional[float] = None,
+    ):
+        self.send = send
+        self.window = window
+        self.max_delay = max_delay if max_delay is not None else window * 5
+        self.is_busy = False
+        self.reported_is_busy = False  # a newly registered worker is available
+        self._changed_at = 0.0
+        self._pending_since: Optional[float] = None
+        self._flush: Optional[asyncio.Task] = None
+        self._stats = CapacityNotifierStats()
+
+    def update(self, is_busy: bool) -> None:
+        """
+        Record the current busy state; it is sent once it settles.
+
+        Args:
+            is_busy (bool): Whether the worker cannot take more tasks.
+        """
+        if is_busy == self.is_busy:
+            return
+        now = time.monotonic()
+        self.is_busy = is_busy
+        self._changed_at = now
+        self._stats.transitions += 1
+        if self._pending_since is None:
+            self._pending_since = now
+        if self._flush is None or self._flush.done():
+            self._flush = asyncio.get_running_loop().create_task(self._flush_when_settled())
+
+    async def _flush_when_settled(self) -> None:
+        while self.is_busy != self.reported_is_busy:
+            now = time.monotonic()
+            due = min(self._changed_at + self.window, self._pending_since + self.max_delay)
+            if now < due:
+                await asyncio.sleep(due - now)
+                continue
+
+            is_busy = self.is_busy
+            try:
+                await self.send(is_busy)
+            except Exception as e:
+                self._stats.failed += 1
+                logger.warning(f"Failed to notify capacity status: {e}")
+                await asyncio.sleep(self.window)  # retry with the state current by then
+                continue
+            self.reported_is_busy = is_busy
+            self._stats.sent += 1
+            self._pending_since = time.monotonic()  # for a change made while sending
+        self._pending_since = None
+
+    def close(self) -> None:
+        """Cancel an unsent notification."""
+        if self._flush and not self._flush.done():
+            self._flush.cancel()
+
+    @property
+    def stats(self) -> CapacityNotifierStats:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            CapacityNotifierStats: Current counters.
+        """
+        return self._stats.model_copy()
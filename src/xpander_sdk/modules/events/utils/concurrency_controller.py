@@ -0,0 +1,179 @@
+"""
+Adaptive concurrency for the Events worker.
+
+The number of tasks the worker runs at once is adjusted with AIMD (additive
+increase, multiplicative decrease): the limit grows by one slot while every
+slot is busy and the worker is healthy, and shrinks by a factor when it shows
+signs of overload - task latency well above its recent median, event loop
+lag, or resident memory above a configured ceiling. After a decrease, the
+limit is not cut again before a cooldown of at least one task latency, so
+the effect of a cut is observed before the next one.
+"""
+
+import asyncio
+import os
+import statistics
+import time
+from collections import deque
+from typing import Deque, Literal, Optional
+
+from pydantic import BaseModel
+
+from .admission_queue import AdmissionQueue
+
+
+class CapacityReport(BaseModel):
+    """
+    Snapshot of the worker's capacity, reported to the backend.
+
+    Attributes:
+        handler_kind (Literal["sync", "async"]): Kind of the task handler.
+        limit (int): Tasks currently allowed to run at once.
+        max_limit (int): Upper bound of the limit.
+        in_flight (int): Tasks running.
+        queued (int): Tasks waiting for a slot.
+        free_slots (int): Tasks that can start right away.
+        latency_ms (Optional[float]): Moving average of task handling time.
+        loop_lag_ms (Optional[float]): Last measured event loop lag.
+        rss_mb (Optional[float]): Resident memory of the process, where available.
+        process_index (Optional[int]): Index of the worker process when the worker runs
+            in several processes.
+        process_count (int): Number of worker processes of the deployment.
+    """
+
+    handler_kind: Literal["sync", "async"]
+    limit: int
+    max_limit: int
+    in_flight: int = 0
+    queued: int = 0
+    free_slots: int = 0
+    latency_ms: Optional[float] = None
+    loop_lag_ms: Optional[float] = None
+    rss_mb: Optional[float] = None
+    process_index: Optional[int] = None
+    process_count: int = 1
+
+
+def _read_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None  # not Linux
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD controller of an `AdmissionQueue`'s concurrency.
+
+    Args:
+        initial_limit (int): Starting limit.
+        min_limit (int): Lowest limit.
+        max_limit (int): Highest limit.
+        latency_tolerance (float): Overload when the latency average exceeds the
+            median latency of the last `latency_window` tasks by this factor.
+        max_loop_lag (float): Overload when the event loop lags by more seconds.
+        max_rss_mb (Optional[float]): Overload when resident memory exceeds this, None to ignore.
+        decrease_factor (float): Factor applied to the limit on overload.
+        interval (float): Seconds between adjustments.
+        latency_window (int): Number of recent task latencies forming the baseline.
+        min_samples (int): Latencies needed before latency counts as an overload signal.
+        cooldown (Optional[float]): Minimum seconds between two decreases, defaults to the
+            larger of `interval` and the latency average.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_tolerance: float = 2.0,
+        max_loop_lag: float = 0.25,
+        max_rss_mb: Optional[float] = None,
+        decrease_factor: float = 0.7,
+        interval: float = 1.0,
+        latency_window: int = 100,
+        min_samples: int = 20,
+        cooldown: Optional[float] = None,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = max(min_limit, min(initial_limit, max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.max_loop_lag = max_loop_lag
+        self.max_rss_mb = max_rss_mb
+        self.decrease_factor = decrease_factor
+        self.interval = interval
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.latency: Optional[float] = None
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._decreased_at: Optional[float] = None
+        self.loop_lag: Optional[float] = None
+        self.rss_mb: Optional[float] = None
+
+    def observe(self, latency: float) -> None:
+        """
+        Record the handling time of a finished task.
+
+        Args:
+            latency (float): Seconds the task took.
+        """
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        self._latencies.append(latency)
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """Median of the recent task latencies, None until `min_samples` were observed."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        return statistics.median(self._latencies)
+
+    @property
+    def is_overloaded(self) -> bool:
+        """Whether any overload signal is over its threshold."""
+        return bool(
+            (self.loop_lag is not None and self.loop_lag > self.max_loop_lag)
+            or (self.max_rss_mb and self.rss_mb and self.rss_mb > self.max_rss_mb)
+            or (
+                self.latency is not None
+                and self.baseline_latency
+                and self.latency > self.baseline_latency * self.latency_tolerance
+            )
+        )
+
+    def adjust(self, in_flight: int) -> int:
+        """
+        Apply one AIMD step. While overloaded, the limit is decreased at most
+        once per cooldown and never increased.
+
+        Args:
+            in_flight (int): Tasks running.
+
+        Returns:
+            int: The new limit.
+        """
+        if self.is_overloaded:
+            now = time.monotonic()
+            cooldown = self.cooldown if self.cooldown is not None else max(self.interval, self.latency or 0.0)
+            if self._decreased_at is None or now - self._decreased_at >= cooldown:
+                self.limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+                self._decreased_at = now
+        elif in_flight >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1)
+        return self.limit
+
+    async def arun(self, queue: AdmissionQueue) -> None:
+        """
+        Measure the overload signals and adjust the queue's concurrency every `interval`.
+
+        Args:
+            queue (AdmissionQueue): The queue to control.
+        """
+        queue.set_concurrency(self.limit)
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.loop_lag = max(0.0, time.monotonic() - started - self.interval)
+            self.rss_mb = _read_rss_mb()
+            queue.set_concurrency(self.adjust(in_flight=queue.stats.in_flight))
@@ -0,0 +1,75 @@
+"""
+Plan continuations of tasks handled by the Events worker.
+
+When a task's enforced deep plan still has uncompleted items after the
+handler returns, the handler is run again - a continuation - until the plan
+can finish or the task's continuation budget is spent.
+"""
+
+from os import getenv
+from typing import NamedTuple, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ContinuationPolicy(BaseModel):
+    """
+    How unfinished plans are continued.
+
+    Attributes:
+        max_continuations (int): Continuations allowed per task. Defaults to
+            XPANDER_PLAN_MAX_CONTINUATIONS or 50.
+        backoff_base (float): Delay in seconds before the first continuation, doubled for
+            each further one. Defaults to XPANDER_PLAN_CONTINUATION_BACKOFF or 0.5.
+        backoff_max (float): Maximum delay in seconds between continuations.
+        requeue (bool): Release the execution slot and queue each continuation for
+            admission again, instead of running it in the same slot. Defaults to
+            XPANDER_REQUEUE_PLAN_CONTINUATIONS ("true" to enable).
+    """
+
+    max_continuations: int = Field(
+        default_factory=lambda: int(getenv("XPANDER_PLAN_MAX_CONTINUATIONS", "50")), ge=0
+    )
+    backoff_base: float = Field(
+        default_factory=lambda: float(getenv("XPANDER_PLAN_CONTINUATION_BACKOFF", "0.5")), ge=0
+    )
+    backoff_max: float = Field(default=10.0, ge=0)
+    requeue: bool = Field(
+        default_factory=lambda: getenv("XPANDER_REQUEUE_PLAN_CONTINUATIONS", "false") == "true"
+    )
+
+    def delay(self, continuation: int) -> float:
+        """
+        Delay before a continuation.
+
+        Args:
+            continuation (int): Number of the continuation, starting at 1.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        return min(self.backoff_max, self.backoff_base * 2 ** (continuation - 1))
+
+
+class ContinuationStats(BaseModel):
+    """
+    Snapshot of plan continuation counters.
+
+    Attributes:
+        continuations (int): Continuations run or queued.
+        requeued (int): Continuations queued for admission again.
+        exhausted (int): Tasks finished with an incomplete plan after spending their budget.
+        total_seconds (float): Time spent running continuations.
+    """
+
+    continuations: int = 0
+    requeued: int = 0
+    exhausted: int = 0
+    total_seconds: float = 0.0
+
+
+class PlanContinuation(NamedTuple):
+    """A continuation waiting in the admission queue."""
+
+    attempt: int
+    expires_at: Optional[float]  # absolute task deadline (`time.monotonic` based)
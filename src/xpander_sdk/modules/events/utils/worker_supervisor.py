@@ -0,0 +1,160 @@
+"""
+Pre-fork supervisor for running the Events worker in several processes.
+
+Each worker process runs its own event loop and its own event stream
+subscription, so it registers as a separate worker and reports its own
+capacity. The supervisor restarts crashed workers and, on SIGTERM or SIGINT,
+lets every worker drain its tasks before stopping it.
+"""
+
+import os
+import signal
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+WORKER_PROCESS_INDEX_ENV = "XPANDER_WORKER_PROCESS_INDEX"
+WORKER_PROCESS_COUNT_ENV = "XPANDER_WORKER_PROCESS_COUNT"
+
+_POLL_INTERVAL = 0.1
+
+
+class WorkerSupervisor:
+    """
+    Fork `processes` workers and keep them running until asked to stop.
+
+    Workers are forked after the application was imported, so its modules are
+    shared copy-on-write. A worker exiting with a non-zero code is restarted
+    after `restart_delay` seconds (doubling while it keeps crashing, up to a
+    minute); a worker exiting cleanly is not. On SIGTERM or SIGINT every worker
+    receives SIGTERM and is killed if it has not exited within `drain_timeout`
+    seconds; a second signal kills the workers right away.
+
+    Args:
+        processes (int): Number of worker processes.
+        run_worker (Callable[[int], None]): Runs a worker; called in the child with its index.
+        drain_timeout (float): Seconds workers get to finish their tasks on shutdown.
+        restart_delay (float): Seconds before restarting a crashed worker.
+
+    Example:
+        >>> supervisor = WorkerSupervisor(processes=4, run_worker=lambda index: asyncio.run(serve()))
+        >>> supervisor.run()
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        run_worker: Callable[[int], None],
+        drain_timeout: float = 30.0,
+        restart_delay: float = 1.0,
+    ):
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        self.processes = processes
+        self.run_worker = run_worker
+        self.drain_timeout = drain_timeout
+        self.restart_delay = restart_delay
+        self._children: Dict[int, int] = {}  # pid -> worker index
+        self._crashes: Dict[int, int] = {}  # worker index -> consecutive crashes
+        self._restarts: Dict[int, float] = {}  # worker index -> restart time
+        self._stopping = False
+        self._kill_at: Optional[float] = None
+        self._received: List[int] = []  # signals not handled yet
+
+    def run(self) -> None:
+        """Start the workers and supervise them until they have all exited."""
+        previous = {sig: signal.signal(sig, self._on_signal) for sig in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            for index in range(self.processes):
+                self._spawn(index)
+            logger.info(f"Supervising {self.processes} worker processes")
+
+            # poll rather than block in waitpid, so signal handlers run promptly
+            while self._children or self._restarts:
+                while self._received:
+                    self._handle_signal(self._received.pop(0))
+                self._reap()
+                now = time.monotonic()
+                for index, restart_at in list(self._restarts.items()):
+                    if now >= restart_at:
+                        del self._restarts[index]
+                        self._spawn(index)
+                if self._kill_at and now >= self._kill_at:
+                    logger.warning(f"Killing {len(self._children)} worker processes that did not drain in time")
+                    self._signal_children(signal.SIGKILL)
+                    self._kill_at = None
+                time.sleep(_POLL_INTERVAL)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+        logger.info("All worker processes stopped")
+
+    def _reap(self) -> None:
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if not pid:
+                return
+            index = self._children.pop(pid, None)
+            if index is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if self._stopping or code == 0:
+                logger.info(f"Worker {index} (pid {pid}) exited with code {code}")
+                continue
+
+            crashes = self._crashes.get(index, 0) + 1
+            self._crashes[index] = crashes
+            delay = min(60.0, self.restart_delay * 2 ** (crashes - 1))
+            logger.warning(f"Worker {index} (pid {pid}) exited with code {code}, restarting in {delay:.0f}s")
+            self._restarts[index] = time.monotonic() + delay
+
+    def _spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid:
+            self._children[pid] = index
+            return
+
+        # worker process
+        code = 0
+        try:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            os.environ[WORKER_PROCESS_INDEX_ENV] = str(index)
+            os.environ[WORKER_PROCESS_COUNT_ENV] = str(self.processes)
+            self.run_worker(index)
+        except BaseException:
+            logger.exception(f"Worker {index} failed")
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)  # never return into the supervisor's code
+
+    def _on_signal(self, signum: int, frame) -> None:
+        # handled by the supervision loop: the interrupted code may hold the logger's lock
+        self._received.append(signum)
+
+    def _handle_signal(self, signum: int) -> None:
+        if self._stopping:
+            logger.warning("Stopping worker processes now")
+            self._signal_children(signal.SIGKILL)
+            return
+
+        logger.info(f"Received {signal.Signals(signum).name} – draining {len(self._children)} worker processes…")
+        self._stopping = True
+        self._restarts.clear()
+        self._signal_children(signal.SIGTERM)
+        self._kill_at = time.monotonic() + self.drain_timeout
+
+    def _signal_children(self, signum: int) -> None:
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
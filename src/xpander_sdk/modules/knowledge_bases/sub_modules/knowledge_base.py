@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from httpx import HTTPStatusError
 from pydantic import BaseModel, Field
@@ -51,6 +51,24 @@ class KnowledgeBase(BaseModel):
     def list_documents(self) -> List[KnowledgeBaseDocumentItem]:
         return run_sync(self.alist_documents())
 
+    async def astream_documents(self) -> AsyncIterator[KnowledgeBaseDocumentItem]:
+        """
+        Stream the documents of the knowledge base as they are received,
+        without loading the whole list in memory.
+        """
+        try:
+            client = APIClient(configuration=self.configuration)
+            async for doc in client.astream_list(
+                path=APIRoute.ListKnowledgeBaseDocuments.format(knowledge_base_id=self.id),
+                method="GET",
+                model=KnowledgeBaseDocumentItem,
+            ):
+                yield doc
+        except Exception as e:
+            if isinstance(e, HTTPStatusError):
+                raise ModuleException(e.response.status_code, e.response.text)
+            raise ModuleException(500, f"Failed to list knowledge documents - {str(e)}")
+
     async def adelete_multiple_documents(self, document_ids: List[str]):
         try:
             client = APIClient(configuration=self.configuration)
@@ -5,7 +5,7 @@ This module provides functionality to create, list, retrieve, update,
 and stop tasks within the xpander.ai Backend-as-a-Service platform.
 """
 
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 from httpx import HTTPStatusError
 
@@ -124,6 +124,79 @@ class Tasks(ModuleBase):
                 raise ModuleException(e.response.status_code, e.response.text)
             raise ModuleException(500, f"Failed to list user tasks - {str(e)}")
     
+    async def astream(self, agent_id: str, filters: Optional[Dict] = None) -> AsyncIterator[TasksListItem]:
+        """
+        Asynchronously stream the tasks of a specific agent.
+
+        Same as alist(), but yields tasks while the response is being received
+        instead of loading the whole history in memory. Prefer it for agents with
+        a very large task history.
+
+        Args:
+            agent_id (str): The unique identifier of the agent whose tasks should be listed.
+            filters (Optional[Dict]): Optional filters to be used on the query. supported filters: user_id, parent_task_id, triggering_agent_id, status, internal_status
+
+        Yields:
+            TasksListItem: Task summary objects related to the agent.
+
+        Raises:
+            ModuleException: If the API request fails or returns an error.
+
+        Example:
+            >>> async for task in Tasks().astream(agent_id="agent123"):
+            ...     print(f"Task: {task.id} - Status: {task.status}")
+        """
+        async for task in self._astream_tasks(
+            path=APIRoute.ListTasks.format(agent_id=agent_id),
+            filters=filters,
+            error_message="Failed to list tasks",
+        ):
+            yield task
+
+    async def astream_user_tasks(self, user_id: str, filters: Optional[Dict] = None) -> AsyncIterator[TasksListItem]:
+        """
+        Asynchronously stream the tasks of a specific user.
+
+        Same as alist_user_tasks(), but yields tasks while the response is being
+        received instead of loading the whole history in memory.
+
+        Args:
+            user_id (str): The unique identifier of the user whose tasks should be listed.
+            filters (Optional[Dict]): Optional filters to be used on the query. supported filters: parent_task_id, triggering_agent_id, status, internal_status
+
+        Yields:
+            TasksListItem: Task summary objects related to the user.
+
+        Raises:
+            ModuleException: If the API request fails or returns an error.
+
+        Example:
+            >>> async for task in Tasks().astream_user_tasks(user_id="user123"):
+            ...     print(f"Task: {task.id} - Status: {task.status}")
+        """
+        async for task in self._astream_tasks(
+            path=APIRoute.ListUserTasks.format(user_id=user_id),
+            filters=filters,
+            error_message="Failed to list user tasks",
+        ):
+            yield task
+
+    async def _astream_tasks(
+        self, path: str, filters: Optional[Dict], error_message: str
+    ) -> AsyncIterator[TasksListItem]:
+        try:
+            client = APIClient(configuration=self.configuration)
+            async for task in client.astream_list(
+                path=path,
+                query=filters or {},
+                model=TasksListItem,
+            ):
+                yield task
+        except Exception as e:
+            if isinstance(e, HTTPStatusError):
+                raise ModuleException(e.response.status_code, e.response.text)
+            raise ModuleException(500, f"{error_message} - {str(e)}")
+    
     def list(self, agent_id: str, filters: Optional[Dict] = None) -> List[TasksListItem]:
         """
         Synchronously list all tasks for a specific agent.
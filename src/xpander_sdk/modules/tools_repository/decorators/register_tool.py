@@ -9,6 +9,7 @@ xpander.ai platform.
 import inspect
 from typing import Callable, Any, Optional, get_type_hints, Union
 from pydantic import create_model
+from xpander_sdk.modules.tools_repository.models.tool_execution import ToolExecutionClass
 from xpander_sdk.modules.tools_repository.sub_modules.tool import Tool
 from xpander_sdk.modules.tools_repository.tools_repository_module import ToolsRepository
 
@@ -16,7 +17,10 @@ from xpander_sdk.modules.tools_repository.tools_repository_module import ToolsRe
 def register_tool(
     func: Optional[Callable] = None, 
     *, 
-    add_to_graph: Optional[bool] = False
+    add_to_graph: Optional[bool] = False,
+    execution_class: Optional[ToolExecutionClass] = None,
+    cache_ttl: Optional[float] = None,
+    cache_per_user: Optional[bool] = False,
 ) -> Union[Callable, Tool]:
     """
     Decorator to register a Python function as a tool for xpander.ai agents.
@@ -30,6 +34,13 @@ def register_tool(
         func (Optional[Callable]): The function to register (used for @register_tool syntax).
         add_to_graph (Optional[bool]): Whether to automatically add this tool to
             agent execution graphs. Defaults to False.
+        execution_class (Optional[ToolExecutionClass]): Where the function runs when invoked:
+            `ASYNC` on the event loop, `THREAD` on the local tools thread pool or
+            `PROCESS` on the process pool for CPU-heavy work. Defaults to the event
+            loop for coroutine functions and the thread pool otherwise.
+        cache_ttl (Optional[float]): Seconds successful results are reused for calls with
+            the same arguments. Only for read-only tools. Defaults to None (no caching).
+        cache_per_user (Optional[bool]): Cache results separately for each task user.
             
     Returns:
         Union[Callable, Tool]: The original function (preserves functionality) or
@@ -37,6 +48,7 @@ def register_tool(
             
     Raises:
         TypeError: If the decorated object is not a callable function.
+        ValueError: If a coroutine function is given a thread or process execution class.
         
     Example:
         >>> @register_tool
@@ -48,6 +60,11 @@ def register_tool(
         ...     # Implementation here
         ...     return f"Weather for {city}, {country}"
         
+        >>> @register_tool(execution_class=ToolExecutionClass.PROCESS)
+        ... def render_report(rows: int) -> str:
+        ...     # CPU-heavy work, runs in a separate process
+        ...     return "report"
+        
         >>> # The functions remain callable as normal
         >>> result = calculate_sum(5, 3)  # Returns 8
         
@@ -66,6 +83,15 @@ def register_tool(
         Returns:
             Callable: The original function, unchanged in functionality.
         """
+        if inspect.iscoroutinefunction(inner_func) and execution_class in (
+            ToolExecutionClass.THREAD,
+            ToolExecutionClass.PROCESS,
+        ):
+            raise ValueError(
+                f"Coroutine function '{inner_func.__name__}' runs on the event loop, "
+                f"it cannot use the '{execution_class.value}' execution class."
+            )
+
         # Extract function signature and type hints
         sig = inspect.signature(inner_func)
         hints = get_type_hints(inner_func)
@@ -90,7 +116,10 @@ def register_tool(
             parameters=ArgsModel.model_json_schema(mode="serialization"),
             fn=inner_func,
             is_local=True,
-            should_add_to_graph=add_to_graph
+            should_add_to_graph=add_to_graph,
+            execution_class=execution_class,
+            cache_ttl=cache_ttl,
+            cache_per_user=cache_per_user,
         )
 
         # Register the tool in the global repository
@@ -0,0 +1,57 @@
+from enum import Enum
+from typing import Optional
+from xpander_sdk.models.shared import XPanderSharedModel
+
+
+class ToolExecutionClass(str, Enum):
+    """
+    Where a local tool function runs when it is invoked.
+
+    Values:
+        ASYNC: On the event loop. Coroutine functions are awaited, plain
+            functions are called inline, so use it only for non-blocking work.
+        THREAD: On the shared local tools thread pool (default for plain functions).
+        PROCESS: On the local tools process pool, for CPU-heavy or GIL-bound
+            work. The function, its arguments and result must be picklable.
+    """
+
+    ASYNC = "async"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ToolExecutorStats(XPanderSharedModel):
+    """
+    Queue metrics of a local tools execution pool.
+
+    Attributes:
+        execution_class (ToolExecutionClass): The execution class served by the pool.
+        max_workers (int): Pool size.
+        in_flight (int): Calls submitted and not completed yet.
+        queued (int): Calls waiting for a free worker.
+        completed (int): Calls completed successfully.
+        failed (int): Calls that raised.
+    """
+
+    execution_class: ToolExecutionClass
+    max_workers: int
+    in_flight: int = 0
+    queued: int = 0
+    completed: int = 0
+    failed: int = 0
+
+
+class ToolLimits(XPanderSharedModel):
+    """
+    Client-side limits applied to invocations of a tool or of all tools of a connector.
+
+    Attributes:
+        max_concurrency (Optional[int]): Maximum concurrent invocations, None for unlimited.
+        rate (Optional[float]): Sustained invocations per second, None for unlimited.
+        burst (Optional[int]): Invocations allowed at once before the rate applies.
+            Defaults to `max(1, rate)`.
+    """
+
+    max_concurrency: Optional[int] = None
+    rate: Optional[float] = None
+    burst: Optional[int] = None
@@ -0,0 +1,19 @@
+from typing import Any, Dict, Optional
+from xpander_sdk.models.shared import XPanderSharedModel
+
+
+class ToolInvocationRequest(XPanderSharedModel):
+    """
+    A single tool call of a batch passed to `ToolsRepository.ainvoke_many`.
+
+    Attributes:
+        tool_id (str): ID (or name) of the tool to invoke.
+        payload (Optional[Any]): The input payload to the tool.
+        tool_call_id (Optional[str]): Unique ID of the tool call.
+        payload_extension (Optional[Dict[str, Any]]): Additional payload data.
+    """
+
+    tool_id: str
+    payload: Optional[Any] = None
+    tool_call_id: Optional[str] = None
+    payload_extension: Optional[Dict[str, Any]] = {}
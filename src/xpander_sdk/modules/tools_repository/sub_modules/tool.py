@@ -20,20 +20,31 @@ Key Features:
 - Comprehensive error handling and reporting
 """
 
+import json
 from copy import deepcopy
+from functools import lru_cache, partial
+from os import getenv
 from typing import Dict, Any, Literal, Optional, Callable
 from httpx import HTTPStatusError
 from pydantic import BaseModel, computed_field, create_model, model_validator, Field
 from xpander_sdk.consts.api_routes import APIRoute
+from xpander_sdk.core.background_reporter import telemetry_reporter
 from xpander_sdk.core.xpander_api_client import APIClient
 from xpander_sdk.models.configuration import Configuration
 from xpander_sdk.models.shared import XPanderSharedModel
 from xpander_sdk.modules.agents.models.agent import AgentGraphItemSchema
+from xpander_sdk.modules.tools_repository.models.tool_execution import ToolExecutionClass
 from xpander_sdk.modules.tools_repository.models.tool_invocation_result import (
     ToolInvocationResult,
 )
 from xpander_sdk.modules.tools_repository.utils.generic import deep_merge, pascal_case
+from xpander_sdk.modules.tools_repository.utils.limits import limit_invocation
 from xpander_sdk.modules.tools_repository.utils.local_tools import invoke_local_fn
+from xpander_sdk.modules.tools_repository.utils.result_cache import (
+    get_cached_result,
+    result_cache_key,
+    set_cached_result,
+)
 from xpander_sdk.modules.tools_repository.utils.schemas import (
     apply_permanent_values_to_payload,
     build_model_from_schema,
@@ -43,6 +54,31 @@ from xpander_sdk.modules.tools_repository.utils.schemas import (
 from xpander_sdk.utils.event_loop import run_sync
 from xpander_sdk.modules.events.decorators.on_tool import ToolHooksRegistry
 
+_CACHE_MISS = object()
+
+@lru_cache(maxsize=int(getenv("XPANDER_TOOL_SCHEMA_CACHE_SIZE", "2048")))
+def _build_tool_schema(
+    model_name: str, parameters: str, input_override: Optional[str], with_defaults: bool
+) -> type[BaseModel]:
+    """
+    Build a tool payload model, memoized on the JSON of its inputs.
+
+    Keying on content means a model is reused by every Tool instance with the same
+    definition (e.g. agents rebuilt per task) and rebuilt as soon as the
+    parameters, the input schema override or `is_local` change.
+    """
+    schema = json.loads(parameters)
+
+    # apply input schema enforcement
+    if input_override is not None:
+        schema = schema_enforcement_block_and_descriptions(
+            target_schema=schema, reference_schema=json.loads(input_override)
+        )
+
+    return build_model_from_schema(
+        model_name=model_name, schema=schema, with_defaults=with_defaults
+    )
+
 
 class Tool(XPanderSharedModel):
     """
@@ -63,6 +99,14 @@ class Tool(XPanderSharedModel):
         parameters (Dict[str, Any]): Parameter schema for the tool.
         configuration (Optional[Configuration]): Configuration for the tool.
         fn (Optional[Callable]): Callable function for local tools.
+        execution_class (Optional[ToolExecutionClass]): Where the local function runs, defaults to
+            the event loop for coroutine functions and the thread pool otherwise.
+        cache_ttl (Optional[float]): Seconds successful results are reused for identical calls,
+            None disables result caching (the default). Only enable it for read-only tools:
+            cache hits skip the call, including its graph checks.
+        cache_per_user (Optional[bool]): Whether cached results are kept separately per task user.
+        graph_enforces_ordering (Optional[bool]): Whether the agent graph constrains when the tool
+            may run; local tools that are not ordered may report their preflight in the background.
     """
 
     configuration: Optional[Configuration] = Configuration()
@@ -82,6 +126,10 @@ class Tool(XPanderSharedModel):
     operation_id: Optional[str] = None
 
     fn: Optional[Callable] = Field(default=None, exclude=True)
+    execution_class: Optional[ToolExecutionClass] = Field(default=None, exclude=True)
+    cache_ttl: Optional[float] = Field(default=None, exclude=True)
+    cache_per_user: Optional[bool] = Field(default=False, exclude=True)
+    graph_enforces_ordering: Optional[bool] = Field(default=True, exclude=True)
 
     def set_configuration(self, configuration: Configuration):
         """
@@ -114,6 +162,20 @@ class Tool(XPanderSharedModel):
             ):
                 self.schema_overrides = gi.settings.schemas
 
+    def set_cache_settings(self, agent_graph: Any):
+        """
+        Apply the result cache settings of the agent graph item if available.
+
+        Settings from the graph take precedence over the ones the tool was
+        registered with.
+
+        Args:
+            agent_graph (AgentGraph): The agent graph containing graph items.
+        """
+        if (gi := agent_graph.get_graph_item("item_id", self.id)) and gi.settings and gi.settings.result_cache:
+            self.cache_ttl = gi.settings.result_cache.ttl
+            self.cache_per_user = gi.settings.result_cache.per_user
+
     def has_schema_override(self, type: Literal["input", "output"]) -> bool:
         return (
             self.schema_overrides
@@ -127,21 +189,21 @@ class Tool(XPanderSharedModel):
         """
         Generate and return a Pydantic model schema based on the tool's parameters.
 
+        The model is cached per (id, parameters, input schema override, is_local), so
+        repeated accesses return the same class until one of those changes.
+
         Returns:
             type[BaseModel]: A dynamically constructed Pydantic model class.
         """
-        model_name = f"{pascal_case(self.id)}PayloadSchema"
-
-        schema = deepcopy(self.parameters)
-
-        # apply input schema enforcement
-        if self.has_schema_override(type="input"):
-            schema = schema_enforcement_block_and_descriptions(
-                target_schema=schema, reference_schema=self.schema_overrides.input
-            )
-
-        return build_model_from_schema(
-            model_name=model_name, schema=schema, with_defaults=self.is_local == False
+        return _build_tool_schema(
+            model_name=f"{pascal_case(self.id)}PayloadSchema",
+            parameters=json.dumps(self.parameters, default=str),
+            input_override=(
+                json.dumps(self.schema_overrides.input, default=str)
+                if self.has_schema_override(type="input")
+                else None
+            ),
+            with_defaults=self.is_local == False,
         )
 
     @model_validator(mode="before")
@@ -395,36 +457,67 @@ class Tool(XPanderSharedModel):
                         f"Invalid payload for tool '{self.name}': {validation_error}"
                     ) from validation_error
 
-            if self.is_local:
+            cache_key = (
+                result_cache_key(
+                    tool_id=self.id,
+                    agent_id=agent_id,
+                    payload=payload,
+                    payload_extension=payload_extension,
+                    agent_version=agent_version,
+                    configuration=configuration or self.configuration,
+                    per_user=self.cache_per_user,
+                )
+                if self.cache_ttl
+                else None
+            )
+            cached = get_cached_result(cache_key, _CACHE_MISS) if cache_key else _CACHE_MISS
+
+            if cached is not _CACHE_MISS:
+                tool_invocation_result.result = deepcopy(cached)
+                tool_invocation_result.is_success = True
+            elif self.is_local:
                 if self.fn is None:
                     raise RuntimeError(
                         f"No local function provided for this tool ({self.id})."
                     )
 
-                result = await invoke_local_fn(fn=self.fn, payload=payload)
-                
-                await self.agraph_preflight_check(
+                async with limit_invocation(self.id, self.connector_id):
+                    result = await invoke_local_fn(
+                        fn=self.fn, payload=payload, execution_class=self.execution_class
+                    )
+
+                preflight = partial(
+                    self.agraph_preflight_check,
                     agent_id=agent_id,
                     agent_version=agent_version,
                     configuration=configuration,
                     task_id=task_id,
                     payload={"input": payload, "output": result.model_dump() if isinstance(result, BaseModel) else result}
                 )
+                if self.graph_enforces_ordering or not (configuration or self.configuration).async_preflight:
+                    await preflight()
+                else:
+                    # the graph does not gate this tool, report without delaying the result
+                    await telemetry_reporter.asubmit(preflight)
                 
                 tool_invocation_result.result = result
                 tool_invocation_result.is_success = True
             else:
-                tool_invocation_result.result = await self.acall_remote_tool(
-                    agent_id=agent_id,
-                    agent_version=agent_version,
-                    payload=payload,
-                    payload_extension=payload_extension,
-                    configuration=configuration,
-                    task_id=task_id,
-                )
+                async with limit_invocation(self.id, self.connector_id):
+                    tool_invocation_result.result = await self.acall_remote_tool(
+                        agent_id=agent_id,
+                        agent_version=agent_version,
+                        payload=payload,
+                        payload_extension=payload_extension,
+                        configuration=configuration,
+                        task_id=task_id,
+                    )
                 tool_invocation_result.is_success = True
+
+            if cache_key and cached is _CACHE_MISS:
+                set_cached_result(cache_key, deepcopy(tool_invocation_result.result), ttl=self.cache_ttl)
             
-            # Execute after hooks on success
+            # Execute after hooks on success (cache hits included)
             await ToolHooksRegistry.execute_after_hooks(
                 tool=self,
                 payload=payload,
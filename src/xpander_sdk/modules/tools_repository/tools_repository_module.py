@@ -6,18 +6,100 @@ the xpander.ai Backend-as-a-Service platform, supporting tool syncronization and
 integration with AI agents.
 """
 
+import asyncio
+from functools import lru_cache
 from inspect import Parameter, Signature
-from typing import Any, Callable, ClassVar, List, Optional, Type
-from pydantic import BaseModel, computed_field
+from os import getenv
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Tuple, Type, Union
+from pydantic import BaseModel, PrivateAttr, computed_field
 from xpander_sdk.consts.api_routes import APIRoute
+from xpander_sdk.core.rate_limiter import RateLimiterStats
 from xpander_sdk.core.xpander_api_client import APIClient
 from xpander_sdk.exceptions.module_exception import ModuleException
 from xpander_sdk.models.configuration import Configuration
 from xpander_sdk.models.shared import XPanderSharedModel
+from xpander_sdk.modules.tools_repository.models.tool_execution import ToolExecutorStats, ToolLimits
+from xpander_sdk.modules.tools_repository.models.tool_invocation_request import ToolInvocationRequest
+from xpander_sdk.modules.tools_repository.models.tool_invocation_result import ToolInvocationResult
 from xpander_sdk.modules.tools_repository.sub_modules.tool import Tool
+from xpander_sdk.modules.tools_repository.utils.limits import get_limiter_stats, set_limits
+from xpander_sdk.modules.tools_repository.utils.result_cache import (
+    get_result_cache_stats,
+    invalidate_results,
+)
+from xpander_sdk.modules.tools_repository.utils.local_tools import (
+    get_argument_binder,
+    get_tool_executor_stats,
+)
+from xpander_sdk.utils.cache import CacheStats
 from xpander_sdk.utils.event_loop import run_sync
 import json
 
+
+@lru_cache(maxsize=int(getenv("XPANDER_TOOL_SCHEMA_CACHE_SIZE", "2048")))
+def _describe_tool_schema(schema_cls: Type[BaseModel]) -> Tuple[List[str], str]:
+    """
+    Document a tool payload model, once per model class.
+
+    Sets the model docstring to the payload-wrapping guidance and its full JSON
+    schema, and returns what the tool function docstring needs. Tool models are
+    memoized on the tool definition, so this runs again only when it changes.
+
+    Args:
+        schema_cls (Type[BaseModel]): The tool payload model (`Tool.schema`).
+
+    Returns:
+        Tuple[List[str], str]: The top-level parameter names and an example payload.
+    """
+    # add json schema to the model doc with enhanced guidance
+    schema_json = schema_cls.model_json_schema(mode="serialization")
+    
+    # Build example with actual schema structure
+    example_payload = {}
+    if 'properties' in schema_json:
+        for prop_name, prop_def in schema_json['properties'].items():
+            if prop_def.get('type') == 'object':
+                if prop_def.get('properties'):
+                    # Show one example nested field
+                    first_nested = list(prop_def['properties'].keys())[0]
+                    example_payload[prop_name] = {first_nested: "<value>"}
+                else:
+                    example_payload[prop_name] = {}
+            else:
+                example_payload[prop_name] = f"<{prop_def.get('type', 'value')}>"
+    
+    schema_cls.__doc__ = f"""CRITICAL: This entire schema must be wrapped in a 'payload' parameter.
+
+Call this function as: function_name(payload={{...}})
+DO NOT call as: function_name(body_params={{...}}, headers={{...}}, ...)
+
+Example correct call:
+{json.dumps({"payload": example_payload}, indent=2)}
+
+Full schema: {json.dumps(schema_json, indent=2)}
+"""
+
+    # Extract schema properties for examples
+    schema_props = schema_cls.model_json_schema().get('properties', {})
+    param_names = list(schema_props.keys())
+    
+    # Create example structure
+    example_parts = []
+    for prop_name in param_names:
+        prop_info = schema_props.get(prop_name, {})
+        if prop_info.get('type') == 'object' and prop_info.get('properties'):
+            # Show nested structure
+            nested_props = list(prop_info['properties'].keys())
+            if nested_props:
+                example_parts.append(f'"{prop_name}": {{"{nested_props[0]}": ...}}')
+            else:
+                example_parts.append(f'"{prop_name}": {{}}')
+        else:
+            example_parts.append(f'"{prop_name}": ...')
+    
+    return param_names, "{" + ", ".join(example_parts) + "}"
+
+
 class ToolsRepository(XPanderSharedModel):
     """
     Repository for managing tools in xpander.ai.
@@ -31,13 +113,23 @@ class ToolsRepository(XPanderSharedModel):
         tools (List[Tool]): List of tools managed by the backend.
         _local_tools (ClassVar[List[Tool]]): Registry of tools defined via decorators.
 
+    Tools are indexed by ID and by name. The indexes are rebuilt when `tools`,
+    `agent_graph` or `configuration` is replaced, and extended incrementally
+    when local tools are registered, so lookups are O(1).
+
     Methods:
         register_tool: Register a local tool.
+        executor_stats: Return queue metrics of the local tools execution pools.
+        set_tool_limits / set_connector_limits: Limit concurrency and rate of tool invocations.
+        limiter_stats: Return queue metrics of the tool and connector limiters.
+        result_cache_stats / invalidate_result_cache: Inspect or clear cached tool results.
         list: Return a list of all tools.
         get_tool_by_id: Retrieve a tool by its ID.
         should_sync_local_tools: Check if local tools need syncing.
         get_local_tools_for_sync: Retrieve local tools that require syncing.
+        mark_local_tools_synced: Record local tools as synced to an agent's graph.
         functions: Return normalized callable functions for each tool.
+        ainvoke_many: Invoke several tools concurrently.
 
     Example:
         >>> repo = ToolsRepository()
@@ -56,16 +148,157 @@ class ToolsRepository(XPanderSharedModel):
     # Immutable registry for tools defined via decorator
     _local_tools: ClassVar[List[Tool]] = []
 
+    # (agent ID, tool ID) of local tools synced to the agent's graph; repositories
+    # hold copies of the registered tools, so the sync state is kept here
+    _synced_local_tools: ClassVar[Set[Tuple[str, str]]] = set()
+
+    _tools_by_id: Dict[str, Tool] = PrivateAttr(default_factory=dict)
+    _tools_by_name: Dict[str, Tool] = PrivateAttr(default_factory=dict)
+    _indexed_sources: Optional[tuple] = PrivateAttr(default=None)
+    _indexed_local_tools: int = PrivateAttr(default=0)
+    _functions_cache: Dict[str, tuple] = PrivateAttr(default_factory=dict)
+
     @classmethod
     def register_tool(cls, tool: Tool):
         """
         Register a new local tool.
 
+        The argument binder of the tool function is compiled here, so
+        invocations only bind the payload.
+
         Args:
             tool (Tool): The tool to register.
         """
+        if tool.fn is not None:
+            try:
+                get_argument_binder(tool.fn)
+            except Exception:
+                pass  # compiled (and the error raised) on the first invocation
         cls._local_tools.append(tool)
-    
+
+    @staticmethod
+    def executor_stats() -> List[ToolExecutorStats]:
+        """
+        Return queue metrics of the pools running synchronous local tools.
+
+        Pools are sized by XPANDER_TOOL_THREAD_POOL_SIZE and
+        XPANDER_TOOL_PROCESS_POOL_SIZE.
+
+        Returns:
+            List[ToolExecutorStats]: Metrics of the thread and process pools.
+        """
+        return get_tool_executor_stats()
+
+    @staticmethod
+    def set_tool_limits(tool_id: str, limits: Optional[ToolLimits]) -> None:
+        """
+        Limit the concurrency and rate of invocations of a tool, process-wide.
+
+        Args:
+            tool_id (str): ID of the tool.
+            limits (Optional[ToolLimits]): The limits, None to remove them.
+
+        Example:
+            >>> ToolsRepository.set_tool_limits("search", ToolLimits(max_concurrency=4, rate=10))
+        """
+        set_limits("tool", tool_id, limits)
+
+    @staticmethod
+    def set_connector_limits(connector_id: str, limits: Optional[ToolLimits]) -> None:
+        """
+        Limit the concurrency and rate of invocations of all tools of a connector, process-wide.
+
+        Connector limits are shared by the connector's tools and apply on top of
+        the limits of each tool.
+
+        Args:
+            connector_id (str): ID of the connector.
+            limits (Optional[ToolLimits]): The limits, None to remove them.
+        """
+        set_limits("connector", connector_id, limits)
+
+    @staticmethod
+    def limiter_stats() -> Dict[str, RateLimiterStats]:
+        """
+        Return queue metrics of the configured tool and connector limiters.
+
+        Returns:
+            Dict[str, RateLimiterStats]: Counters keyed by "tool:<id>" or "connector:<id>".
+        """
+        return get_limiter_stats()
+
+    @staticmethod
+    def result_cache_stats() -> CacheStats:
+        """
+        Return hit/miss counters of the tool result cache.
+
+        Only tools with a `cache_ttl` (from `register_tool` or the agent graph
+        settings) are cached. The cache holds up to XPANDER_TOOL_RESULT_CACHE_SIZE
+        results.
+
+        Returns:
+            CacheStats: Current counters.
+        """
+        return get_result_cache_stats()
+
+    @staticmethod
+    def invalidate_result_cache(tool_id: Optional[str] = None) -> int:
+        """
+        Drop cached tool results.
+
+        Args:
+            tool_id (Optional[str]): Only drop the results of this tool.
+
+        Returns:
+            int: Number of results dropped.
+        """
+        return invalidate_results(tool_id=tool_id)
+
+    def _index_tools(self, tools: List[Tool], shared: bool = False) -> None:
+        for tool in tools:
+            if tool.id in self._tools_by_id:
+                continue  # backend tools take precedence over local tools
+            if shared:
+                # registered local tools are shared by all repositories; configure a copy of
+                # them, so graph settings of one agent do not leak into another
+                tool = tool.model_copy()
+            tool.set_configuration(configuration=self.configuration)
+            if self.agent_graph:
+                tool.set_schema_overrides(agent_graph=self.agent_graph)
+                tool.set_cache_settings(agent_graph=self.agent_graph)
+            tool.graph_enforces_ordering = (
+                self.agent_graph.enforces_ordering(tool.id) if self.agent_graph else True
+            )
+            self._tools_by_id[tool.id] = tool
+            self._tools_by_name.setdefault(tool.name, tool)
+
+    def _ensure_index(self) -> Dict[str, Tool]:
+        """
+        Return the ID index, rebuilding or extending it if its sources changed.
+
+        Returns:
+            Dict[str, Tool]: Tools by ID, backend tools first.
+        """
+        indexed = self._indexed_sources
+        if not (
+            indexed
+            and indexed[0] is self.tools
+            and indexed[1] == len(self.tools)
+            and indexed[2] is self.agent_graph
+            and indexed[3] is self.configuration
+            and self._indexed_local_tools <= len(self._local_tools)
+        ):
+            self._tools_by_id, self._tools_by_name = {}, {}
+            self._indexed_local_tools = 0
+            self._index_tools(self.tools)
+            self._indexed_sources = (self.tools, len(self.tools), self.agent_graph, self.configuration)
+
+        if self._indexed_local_tools < len(self._local_tools):
+            self._index_tools(self._local_tools[self._indexed_local_tools:], shared=True)
+            self._indexed_local_tools = len(self._local_tools)
+
+        return self._tools_by_id
+
     @computed_field
     @property
     def list(self) -> List[Tool]:
@@ -79,19 +312,7 @@ class ToolsRepository(XPanderSharedModel):
         Returns:
             List[Tool]: A list of all available tools.
         """
-        # Merge _local_tools and _tools, ensuring no duplicates by id
-        all_tools = {tool.id: tool for tool in self.tools}
-        for local_tool in self._local_tools:
-            all_tools.setdefault(local_tool.id, local_tool)
-
-        tools: List[Tool] = list(all_tools.values())
-
-        for tool in tools:
-            tool.set_configuration(configuration=self.configuration)
-            if self.agent_graph:
-                tool.set_schema_overrides(agent_graph=self.agent_graph)
-
-        return tools
+        return list(self._ensure_index().values())
 
     def get_tool_by_id(self, tool_id: str):
         """
@@ -103,45 +324,69 @@ class ToolsRepository(XPanderSharedModel):
         Returns:
             Tool: The tool corresponding to the given ID.
         """
-        return next((tool for tool in self.list if tool.id == tool_id), None)
+        return self._ensure_index().get(tool_id)
 
     def get_tool_by_name(self, tool_name: str):
         """
-        Retrieve a tool by its unique identifier.
+        Retrieve a tool by its name.
 
         Args:
-            tool_name (str): The ID of the tool to retrieve.
+            tool_name (str): The name of the tool to retrieve.
 
         Returns:
-            Tool: The tool corresponding to the given ID.
+            Tool: The first tool with the given name.
         """
-        return next((tool for tool in self.list if tool.name == tool_name), None)
+        self._ensure_index()
+        return self._tools_by_name.get(tool_name)
 
-    def should_sync_local_tools(self):
+    def should_sync_local_tools(self, agent_id: Optional[str] = None):
         """
         Determine if local tools need to be synchronized with the backend.
 
         Checks whether any local tool is marked for graph addition and
         has not been synced yet.
 
+        Args:
+            agent_id (Optional[str]): Agent whose graph the tools are synced to.
+
         Returns:
             bool: True if any local tools need syncing, False otherwise.
         """
-        return any(tool.is_local and tool.should_add_to_graph for tool in self.list)
+        return bool(self.get_local_tools_for_sync(agent_id=agent_id))
 
-    def get_local_tools_for_sync(self):
+    def get_local_tools_for_sync(self, agent_id: Optional[str] = None):
         """
         Retrieve local tools that require synchronization with the backend.
 
+        Args:
+            agent_id (Optional[str]): Agent whose graph the tools are synced to. Tools
+                already synced to it by any repository in this process are skipped.
+
         Returns:
             List[Tool]: List of local tools marked for graph addition that are not yet synced.
         """
         return [
             tool
             for tool in self.list
-            if tool.is_local and tool.should_add_to_graph and not tool.is_synced
+            if tool.is_local
+            and tool.should_add_to_graph
+            and not tool.is_synced
+            and (agent_id, tool.id) not in self._synced_local_tools
         ]
 
+    @classmethod
+    def mark_local_tools_synced(cls, agent_id: str, tools: List[Tool]) -> None:
+        """
+        Record local tools as synced to an agent's graph, for every repository.
+
+        Args:
+            agent_id (str): Agent whose graph the tools were synced to.
+            tools (List[Tool]): The synced tools.
+        """
+        for tool in tools:
+            tool.is_synced = True
+            cls._synced_local_tools.add((agent_id, tool.id))
+
     @computed_field
     @property
     def functions(self) -> List[Callable[..., Any]]:
@@ -152,112 +397,85 @@ class ToolsRepository(XPanderSharedModel):
         tool's expected schema, allowing for direct execution with
         schema-validated data.
 
+        Functions are cached per tool and rebuilt only when the tool definition,
+        `is_async` or the configuration object changes.
+
         Returns:
             List[Callable[..., Any]]: List of callable functions corresponding to tools.
         """
         fn_list = []
 
         for tool in self.list:
-            
-            # add json schema to the model doc with enhanced guidance
-            schema_json = tool.schema.model_json_schema(mode="serialization")
-            
-            # Build example with actual schema structure
-            example_payload = {}
-            if 'properties' in schema_json:
-                for prop_name, prop_def in schema_json['properties'].items():
-                    if prop_def.get('type') == 'object':
-                        if prop_def.get('properties'):
-                            # Show one example nested field
-                            first_nested = list(prop_def['properties'].keys())[0]
-                            example_payload[prop_name] = {first_nested: "<value>"}
-                        else:
-                            example_payload[prop_name] = {}
-                    else:
-                        example_payload[prop_name] = f"<{prop_def.get('type', 'value')}>"
-            
-            tool.schema.__doc__ = f"""CRITICAL: This entire schema must be wrapped in a 'payload' parameter.
+            schema_cls: Type[BaseModel] = tool.schema
+            # objects compared by identity, then the text used in the docstring
+            key = ((tool, schema_cls, self.configuration), (tool.description, tool.name, self.is_async))
+            cached = self._functions_cache.get(tool.id)
+            if (
+                cached is None
+                or any(current is not previous for current, previous in zip(key[0], cached[0][0]))
+                or key[1] != cached[0][1]
+            ):
+                cached = (key, self._make_tool_function(tool, schema_cls, bool(self.is_async)))
+                self._functions_cache[tool.id] = cached
+            fn_list.append(cached[1])
+
+        if len(self._functions_cache) > len(fn_list):
+            current_ids = {fn.__name__ for fn in fn_list}
+            self._functions_cache = {
+                tool_id: entry for tool_id, entry in self._functions_cache.items() if tool_id in current_ids
+            }
 
-Call this function as: function_name(payload={{...}})
-DO NOT call as: function_name(body_params={{...}}, headers={{...}}, ...)
+        return fn_list
 
-Example correct call:
-{json.dumps({"payload": example_payload}, indent=2)}
+    def _make_tool_function(self, tool_ref: Tool, schema_ref: Type[BaseModel], is_async: bool = False) -> Callable[..., Any]:
+        """
+        Factory that builds a normalized tool function.
+        - If is_async=True, returns an async function (awaitable).
+        - If is_async=False, returns a sync function (blocking, calls run_sync).
+        """
+        param_names, example_json = _describe_tool_schema(schema_ref)
+
+        async def _execute(payload_dict: dict) -> Any:
+            return await tool_ref.ainvoke(
+                agent_id=self.configuration.state.agent.id,
+                agent_version=self.configuration.state.agent.version,
+                payload=payload_dict,
+                configuration=self.configuration,
+                task_id=(
+                    self.configuration.state.task.id
+                    if self.configuration.state.task
+                    else None
+                ),
+            )
 
-Full schema: {json.dumps(schema_json, indent=2)}
-"""
-            
-            schema_cls: Type[BaseModel] = tool.schema
+        if is_async:
 
-            # Create closure to capture tool and schema_cls
-            def make_tool_function(tool_ref, schema_ref, is_async: bool = False):
+            async def tool_function(payload: schema_ref) -> Any:
                 """
-                Factory that builds a normalized tool function.
-                - If is_async=True, returns an async function (awaitable).
-                - If is_async=False, returns a sync function (blocking, calls run_sync).
+                Normalized async tool function that accepts a single Pydantic model payload.
                 """
+                payload_dict = payload.model_dump(exclude_none=True)
+                return await _execute(payload_dict)
 
-                async def _execute(payload_dict: dict) -> Any:
-                    return await tool_ref.ainvoke(
-                        agent_id=self.configuration.state.agent.id,
-                        agent_version=self.configuration.state.agent.version,
-                        payload=payload_dict,
-                        configuration=self.configuration,
-                        task_id=(
-                            self.configuration.state.task.id
-                            if self.configuration.state.task
-                            else None
-                        ),
-                    )
-
-                if is_async:
-
-                    async def tool_function(payload: schema_ref) -> Any:
-                        """
-                        Normalized async tool function that accepts a single Pydantic model payload.
-                        """
-                        payload_dict = payload.model_dump(exclude_none=True)
-                        return await _execute(payload_dict)
+        else:
 
+            def tool_function(payload: schema_ref) -> Any:
+                """
+                Normalized sync tool function that accepts a single Pydantic model payload.
+                """
+                if isinstance(payload, dict):
+                    payload_dict = payload
                 else:
+                    payload_dict = payload.model_dump(exclude_none=True)
+                return run_sync(_execute(payload_dict))
 
-                    def tool_function(payload: schema_ref) -> Any:
-                        """
-                        Normalized sync tool function that accepts a single Pydantic model payload.
-                        """
-                        if isinstance(payload, dict):
-                            payload_dict = payload
-                        else:
-                            payload_dict = payload.model_dump(exclude_none=True)
-                        return run_sync(_execute(payload_dict))
-
-                # --- Metadata ---
-                tool_function.__name__ = tool_ref.id
-                
-                # Build comprehensive docstring with parameter structure guidance
-                base_doc = tool_ref.description or tool_ref.name
-                
-                # Extract schema properties for examples
-                schema_props = schema_ref.model_json_schema().get('properties', {})
-                param_names = list(schema_props.keys())
-                
-                # Create example structure
-                example_parts = []
-                for prop_name in param_names:
-                    prop_info = schema_props.get(prop_name, {})
-                    if prop_info.get('type') == 'object' and prop_info.get('properties'):
-                        # Show nested structure
-                        nested_props = list(prop_info['properties'].keys())
-                        if nested_props:
-                            example_parts.append(f'"{prop_name}": {{"{nested_props[0]}": ...}}')
-                        else:
-                            example_parts.append(f'"{prop_name}": {{}}')
-                    else:
-                        example_parts.append(f'"{prop_name}": ...')
-                
-                example_json = "{" + ", ".join(example_parts) + "}"
-                
-                tool_function.__doc__ = f"""{base_doc}
+        # --- Metadata ---
+        tool_function.__name__ = tool_ref.id
+        
+        # Build comprehensive docstring with parameter structure guidance
+        base_doc = tool_ref.description or tool_ref.name
+        
+        tool_function.__doc__ = f"""{base_doc}
 
 IMPORTANT - Parameter Structure:
 All parameters must be passed as a single 'payload' object containing the required fields.
@@ -272,29 +490,143 @@ DO NOT use: {{"{param_names[0] if param_names else 'param'}": ..., "{param_names
 USE: {{"payload": {{"{param_names[0] if param_names else 'param'}": ..., "{param_names[1] if len(param_names) > 1 else 'param2'}": ..., ...}}}}
 """
 
-                # --- Signature ---
-                payload_param = Parameter(
-                    name="payload",
-                    kind=Parameter.POSITIONAL_OR_KEYWORD,
-                    annotation=schema_ref,
-                )
-                tool_function.__signature__ = Signature(
-                    [payload_param],
-                    return_annotation=Any,
-                )
+        # --- Signature ---
+        payload_param = Parameter(
+            name="payload",
+            kind=Parameter.POSITIONAL_OR_KEYWORD,
+            annotation=schema_ref,
+        )
+        tool_function.__signature__ = Signature(
+            [payload_param],
+            return_annotation=Any,
+        )
+
+        # --- Annotations (for libraries that read __annotations__) ---
+        ann = getattr(tool_function, "__annotations__", {})
+        ann["payload"] = schema_ref
+        ann["return"] = Any
+        tool_function.__annotations__ = ann
+
+        return tool_function
+
+    async def ainvoke_many(
+        self,
+        calls: List[Union[ToolInvocationRequest, Dict[str, Any]]],
+        agent_id: Optional[str] = None,
+        agent_version: Optional[str] = None,
+        task_id: Optional[str] = None,
+        configuration: Optional[Configuration] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[ToolInvocationResult]:
+        """
+        Invoke several tools concurrently, e.g. the parallel tool calls of one LLM turn.
 
-                # --- Annotations (for libraries that read __annotations__) ---
-                ann = getattr(tool_function, "__annotations__", {})
-                ann["payload"] = schema_ref
-                ann["return"] = Any
-                tool_function.__annotations__ = ann
+        Every call goes through `Tool.ainvoke` (validation, hooks, local or remote
+        execution); calls run concurrently up to `max_concurrency`, and a failing
+        call never affects the others.
 
-                return tool_function
+        Args:
+            calls (List[Union[ToolInvocationRequest, Dict[str, Any]]]): The tool calls.
+            agent_id (Optional[str]): ID of the calling agent, defaults to the agent in the configuration state.
+            agent_version (Optional[str]): Agent version, defaults to the agent in the configuration state.
+            task_id (Optional[str]): ID of the current task, defaults to the task in the configuration state.
+            configuration (Optional[Configuration]): Optional configuration override.
+            max_concurrency (Optional[int]): Maximum calls in flight, defaults to
+                `XPANDER_TOOL_INVOCATION_CONCURRENCY` (8).
 
-            fn = make_tool_function(tool, schema_cls, self.is_async)
-            fn_list.append(fn)
+        Returns:
+            List[ToolInvocationResult]: One result per call, in the order of `calls`.
 
-        return fn_list
+        Example:
+            >>> results = await agent.tools.ainvoke_many([
+            ...     {"tool_id": "search", "payload": {"query": "xpander"}, "tool_call_id": "call-1"},
+            ...     {"tool_id": "weather", "payload": {"city": "Tel Aviv"}, "tool_call_id": "call-2"},
+            ... ])
+        """
+        configuration = configuration or self.configuration
+        state = configuration.state
+        agent_id = agent_id or (state.agent.id if state.agent else None)
+        agent_version = agent_version or (state.agent.version if state.agent else None)
+        task_id = task_id or (state.task.id if state.task else None)
+        semaphore = asyncio.Semaphore(
+            max_concurrency or int(getenv("XPANDER_TOOL_INVOCATION_CONCURRENCY", "8"))
+        )
+
+        async def invoke(call: ToolInvocationRequest) -> ToolInvocationResult:
+            tool = self.get_tool_by_id(call.tool_id) or self.get_tool_by_name(call.tool_id)
+            if tool is None:
+                return ToolInvocationResult(
+                    tool_id=call.tool_id,
+                    tool_call_id=call.tool_call_id,
+                    task_id=task_id,
+                    payload=call.payload,
+                    status_code=404,
+                    result=f"Tool '{call.tool_id}' not found",
+                    is_error=True,
+                )
+            async with semaphore:
+                try:
+                    return await tool.ainvoke(
+                        agent_id=agent_id,
+                        agent_version=agent_version,
+                        payload=call.payload,
+                        payload_extension=call.payload_extension,
+                        configuration=configuration,
+                        task_id=task_id,
+                        tool_call_id=call.tool_call_id,
+                    )
+                except Exception as e:  # e.g. a failing before-hook
+                    return ToolInvocationResult(
+                        tool_id=tool.id,
+                        tool_call_id=call.tool_call_id,
+                        task_id=task_id,
+                        payload=call.payload,
+                        status_code=500,
+                        result=str(e),
+                        is_error=True,
+                        is_local=tool.is_local,
+                    )
+
+        return await asyncio.gather(
+            *(
+                invoke(call if isinstance(call, ToolInvocationRequest) else ToolInvocationRequest(**call))
+                for call in calls
+            )
+        )
+
+    def invoke_many(
+        self,
+        calls: List[Union[ToolInvocationRequest, Dict[str, Any]]],
+        agent_id: Optional[str] = None,
+        agent_version: Optional[str] = None,
+        task_id: Optional[str] = None,
+        configuration: Optional[Configuration] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[ToolInvocationResult]:
+        """
+        Synchronous wrapper for `ainvoke_many`.
+
+        Args:
+            calls (List[Union[ToolInvocationRequest, Dict[str, Any]]]): The tool calls.
+            agent_id (Optional[str]): ID of the calling agent.
+            agent_version (Optional[str]): Agent version.
+            task_id (Optional[str]): ID of the current task.
+            configuration (Optional[Configuration]): Optional configuration override.
+            max_concurrency (Optional[int]): Maximum calls in flight.
+
+        Returns:
+            List[ToolInvocationResult]: One result per call, in the order of `calls`.
+        """
+        return run_sync(
+            self.ainvoke_many(
+                calls=calls,
+                agent_id=agent_id,
+                agent_version=agent_version,
+                task_id=task_id,
+                configuration=configuration,
+                max_concurrency=max_concurrency,
+            )
+        )
 
     async def aload_tool_by_id(self, tool_id: str):
         try:
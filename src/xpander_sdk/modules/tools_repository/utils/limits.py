@@ -0,0 +1,71 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Literal, Optional, Tuple
+
+from xpander_sdk.core.rate_limiter import RateLimiter, RateLimiterStats
+from xpander_sdk.modules.tools_repository.models.tool_execution import ToolLimits
+
+LimitScope = Literal["tool", "connector"]
+
+# (scope, tool or connector id) -> limiter, shared by every repository in the process
+_limiters: Dict[Tuple[LimitScope, str], RateLimiter] = {}
+
+
+def set_limits(scope: LimitScope, key: str, limits: Optional[ToolLimits]) -> None:
+    """
+    Set or remove the limits of a tool or connector.
+
+    Replacing limits starts a new limiter; invocations holding a slot of the
+    previous one release it there.
+
+    Args:
+        scope (LimitScope): "tool" or "connector".
+        key (str): Tool ID or connector ID.
+        limits (Optional[ToolLimits]): The limits, None to remove them.
+    """
+    if limits is None or (limits.max_concurrency is None and limits.rate is None):
+        _limiters.pop((scope, key), None)
+        return
+    _limiters[(scope, key)] = RateLimiter(
+        max_concurrency=limits.max_concurrency, rate=limits.rate, burst=limits.burst
+    )
+
+
+def get_limiter_stats() -> Dict[str, RateLimiterStats]:
+    """
+    Return the counters of every configured limiter.
+
+    Returns:
+        Dict[str, RateLimiterStats]: Counters keyed by "tool:<id>" or "connector:<id>".
+    """
+    return {f"{scope}:{key}": limiter.stats for (scope, key), limiter in _limiters.items()}
+
+
+@asynccontextmanager
+async def limit_invocation(tool_id: str, connector_id: Optional[str]) -> AsyncIterator[None]:
+    """
+    Hold a slot of the connector's and the tool's limiters for the duration of a call.
+
+    The connector limiter is always acquired first, so calls never wait on
+    each other in opposite orders.
+
+    Args:
+        tool_id (str): ID of the invoked tool.
+        connector_id (Optional[str]): Connector of the tool, if any.
+    """
+    limiters = [
+        limiter
+        for limiter in (
+            _limiters.get(("connector", connector_id)) if connector_id else None,
+            _limiters.get(("tool", tool_id)),
+        )
+        if limiter is not None
+    ]
+    acquired = []
+    try:
+        for limiter in limiters:
+            await limiter.acquire()
+            acquired.append(limiter)
+        yield
+    finally:
+        for limiter in reversed(acquired):
+            limiter.release()
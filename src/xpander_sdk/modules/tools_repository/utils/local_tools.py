@@ -1,52 +1,214 @@
 import inspect
 import asyncio
+import contextvars
+import os
+import threading
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from inspect import Parameter
+from os import getenv
 from pydantic import BaseModel
-from typing import Any, get_type_hints
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, get_type_hints
 
+from xpander_sdk.modules.tools_repository.models.tool_execution import (
+    ToolExecutionClass,
+    ToolExecutorStats,
+)
 
-async def invoke_local_fn(fn, payload: Any):
-    sig = inspect.signature(fn)
-    params = sig.parameters
-    is_coroutine = inspect.iscoroutinefunction(fn)
-    type_hints = get_type_hints(fn)
 
-    args = []
-    kwargs = {}
+def _model_type(annotation: Any) -> Optional[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
 
-    def build_param_value(param_name, param_type):
-        if isinstance(payload, dict):
-            if issubclass(param_type, BaseModel):
-                return param_type(**payload.get(param_name, {}))
-            elif param_name in payload:
-                return payload[param_name]
+
+class ArgumentBinder:
+    """
+    Precompiled mapping of a tool payload to the arguments of a local function.
+
+    Inspecting the signature and type hints of a function is much slower than
+    calling it, so it is done once per function (see `get_argument_binder`) and
+    each invocation only binds the payload.
+
+    Args:
+        fn (Callable): The local tool function.
+
+    Raises:
+        NameError: If the type hints of the function cannot be resolved.
+    """
+
+    __slots__ = ("is_coroutine", "positional", "keyword", "var_positional", "var_keyword")
+
+    def __init__(self, fn: Callable):
+        params = inspect.signature(fn).parameters
+        type_hints = get_type_hints(fn)
+
+        self.is_coroutine = inspect.iscoroutinefunction(fn)
+        # (name, pydantic model of the parameter or None)
+        self.positional: List[Tuple[str, Optional[Type[BaseModel]]]] = []
+        self.keyword: List[Tuple[str, Optional[Type[BaseModel]]]] = []
+        self.var_positional = False
+        self.var_keyword = False
+
+        for name, param in params.items():
+            model = _model_type(type_hints.get(name, Any))
+            if param.kind in [Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD]:
+                self.positional.append((name, model))
+            elif param.kind == Parameter.KEYWORD_ONLY:
+                self.keyword.append((name, model))
+            elif param.kind == Parameter.VAR_POSITIONAL:
+                self.var_positional = True
+            elif param.kind == Parameter.VAR_KEYWORD:
+                self.var_keyword = True
+
+    @staticmethod
+    def _value(payload: Any, name: str, model: Optional[Type[BaseModel]]) -> Any:
+        if not isinstance(payload, dict):
+            return payload  # fallback for scalar values
+        if model is not None:
+            return model(**payload.get(name, {}))
+        if name in payload:
+            return payload[name]
+        raise TypeError(f"Missing required argument: {name}")
+
+    def bind(self, payload: Any) -> Tuple[list, Dict[str, Any]]:
+        """
+        Build the call arguments of the function from a tool payload.
+
+        Args:
+            payload (Any): Tool payload, a dict of arguments or a scalar value.
+
+        Returns:
+            Tuple[list, Dict[str, Any]]: Positional and keyword arguments.
+
+        Raises:
+            TypeError: If a required argument is missing from the payload.
+        """
+        args = [self._value(payload, name, model) for name, model in self.positional]
+        kwargs = {name: self._value(payload, name, model) for name, model in self.keyword}
+        if self.var_positional and isinstance(payload, (list, tuple)):
+            args.extend(payload)
+        if self.var_keyword and isinstance(payload, dict):
+            kwargs.update(payload)
+        return args, kwargs
+
+
+# bound methods are cached by their function, the binder does not keep the instance alive
+_binders: "weakref.WeakKeyDictionary[Callable, ArgumentBinder]" = weakref.WeakKeyDictionary()
+_method_binders: "weakref.WeakKeyDictionary[Callable, ArgumentBinder]" = weakref.WeakKeyDictionary()
+
+
+def get_argument_binder(fn: Callable) -> ArgumentBinder:
+    """
+    Return the argument binder of a local function, compiling it on first use.
+
+    Args:
+        fn (Callable): The local tool function.
+
+    Returns:
+        ArgumentBinder: The cached binder.
+    """
+    cache, key = (_method_binders, fn.__func__) if inspect.ismethod(fn) else (_binders, fn)
+    try:
+        binder = cache.get(key)
+    except TypeError:  # not weak-referenceable
+        return ArgumentBinder(fn)
+    if binder is None:
+        binder = cache[key] = ArgumentBinder(fn)
+    return binder
+
+
+class _ToolExecutor:
+    """Lazily created pool of one execution class, with queue metrics."""
+
+    def __init__(self, execution_class: ToolExecutionClass, max_workers: int):
+        self.execution_class = execution_class
+        self.max_workers = max_workers
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._stats = ToolExecutorStats(execution_class=execution_class, max_workers=max_workers)
+
+    def _ensure_pool(self) -> Executor:
+        if self._pool is None:
+            if self.execution_class == ToolExecutionClass.PROCESS:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
             else:
-                raise TypeError(f"Missing required argument: {param_name}")
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="xpander-local-tool"
+                )
+        return self._pool
+
+    async def arun(self, fn: Callable, args: list, kwargs: Dict[str, Any]) -> Any:
+        if self.execution_class == ToolExecutionClass.PROCESS:
+            call = partial(fn, *args, **kwargs)
         else:
-            if issubclass(param_type, BaseModel) and isinstance(payload, dict):
-                return param_type(**payload)
-            return payload  # fallback for scalar values
+            call = partial(contextvars.copy_context().run, fn, *args, **kwargs)
+
+        with self._lock:
+            pool = self._ensure_pool()
+            self._stats.in_flight += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(pool, call)
+        except BaseException as e:
+            with self._lock:
+                self._stats.failed += 1
+                if isinstance(e, BrokenProcessPool) and self._pool is pool:
+                    self._pool = None  # a worker died, the next call starts a new pool
+            raise
+        finally:
+            with self._lock:
+                self._stats.in_flight -= 1
+        with self._lock:
+            self._stats.completed += 1
+        return result
+
+    def stats(self) -> ToolExecutorStats:
+        with self._lock:
+            return self._stats.model_copy(
+                update={"queued": max(0, self._stats.in_flight - self.max_workers)}
+            )
+
+    def _reset_after_fork(self) -> None:
+        # pool workers do not survive fork
+        self._pool = None
+        self._lock = threading.Lock()
+        self._stats = ToolExecutorStats(execution_class=self.execution_class, max_workers=self.max_workers)
+
+
+_executors: Dict[ToolExecutionClass, _ToolExecutor] = {
+    ToolExecutionClass.THREAD: _ToolExecutor(
+        ToolExecutionClass.THREAD,
+        int(getenv("XPANDER_TOOL_THREAD_POOL_SIZE", str(min(32, (os.cpu_count() or 1) + 4)))),
+    ),
+    ToolExecutionClass.PROCESS: _ToolExecutor(
+        ToolExecutionClass.PROCESS,
+        int(getenv("XPANDER_TOOL_PROCESS_POOL_SIZE", str(os.cpu_count() or 1))),
+    ),
+}
+
+if hasattr(os, "register_at_fork"):
+    for _executor in _executors.values():
+        os.register_at_fork(after_in_child=_executor._reset_after_fork)
+
+
+def get_tool_executor_stats() -> List[ToolExecutorStats]:
+    """
+    Return the queue metrics of the local tools execution pools.
+
+    Returns:
+        List[ToolExecutorStats]: Metrics of the thread and process pools.
+    """
+    return [executor.stats() for executor in _executors.values()]
+
+
+async def invoke_local_fn(fn, payload: Any, execution_class: Optional[ToolExecutionClass] = None):
+    binder = get_argument_binder(fn)
+    args, kwargs = binder.bind(payload)
 
-    # Handle no parameters
-    if not params:
-        return await fn() if is_coroutine else await asyncio.to_thread(fn)
-
-    # Match each parameter
-    for name, param in params.items():
-        expected_type = type_hints.get(name, Any)
-        if param.kind in [Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD]:
-            val = build_param_value(name, expected_type)
-            args.append(val)
-        elif param.kind == Parameter.KEYWORD_ONLY:
-            val = build_param_value(name, expected_type)
-            kwargs[name] = val
-        elif param.kind == Parameter.VAR_POSITIONAL:
-            if isinstance(payload, (list, tuple)):
-                args.extend(payload)
-        elif param.kind == Parameter.VAR_KEYWORD:
-            if isinstance(payload, dict):
-                kwargs.update(payload)
-
-    if is_coroutine:
+    if binder.is_coroutine:
         return await fn(*args, **kwargs)
-    return await asyncio.to_thread(fn, *args, **kwargs)
+    if execution_class == ToolExecutionClass.ASYNC:
+        return fn(*args, **kwargs)
+    return await _executors[execution_class or ToolExecutionClass.THREAD].arun(fn, args, kwargs)
@@ -0,0 +1,98 @@
+import json
+from os import getenv
+from typing import Any, Hashable, Optional
+
+from pydantic import BaseModel
+
+from xpander_sdk.models.configuration import Configuration
+from xpander_sdk.utils.cache import CacheStats, TTLCache
+
+# shared by every repository in the process; entries carry the TTL of their tool
+_result_cache: TTLCache[Any] = TTLCache(
+    maxsize=int(getenv("XPANDER_TOOL_RESULT_CACHE_SIZE", "1024")), ttl=60.0
+)
+
+
+def _canonical(value: Any) -> str:
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def result_cache_key(
+    tool_id: str,
+    agent_id: str,
+    payload: Any,
+    payload_extension: Optional[Any],
+    agent_version: Optional[str],
+    configuration: Configuration,
+    per_user: bool = False,
+) -> Optional[Hashable]:
+    """
+    Build the cache key of a tool invocation.
+
+    Payloads are canonicalized (sorted keys), so equivalent calls share an
+    entry. With `per_user`, the user of the current task is part of the key.
+
+    Args:
+        tool_id (str): ID of the tool.
+        agent_id (str): ID of the invoking agent.
+        payload (Any): Tool payload.
+        payload_extension (Optional[Any]): Additional payload data.
+        agent_version (Optional[str]): Agent version.
+        configuration (Configuration): Configuration of the invocation.
+        per_user (bool): Whether results differ per user.
+
+    Returns:
+        Optional[Hashable]: The key, None if the payload is not JSON serializable.
+    """
+    user_id = None
+    if per_user:
+        task = configuration.state.task if configuration.state else None
+        user = getattr(getattr(task, "input", None), "user", None)
+        user_id = (user.id or user.email) if user else None
+    try:
+        return (
+            configuration.organization_id,
+            agent_id,
+            agent_version,
+            tool_id,
+            user_id,
+            _canonical(payload),
+            _canonical(payload_extension or {}),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def get_cached_result(key: Hashable, default: Any = None) -> Any:
+    """Return a cached result, or `default` on a miss."""
+    return _result_cache.get(key, default)
+
+
+def set_cached_result(key: Hashable, result: Any, ttl: float) -> None:
+    """Cache a successful result for `ttl` seconds."""
+    _result_cache.set(key, result, ttl=ttl)
+
+
+def invalidate_results(tool_id: Optional[str] = None) -> int:
+    """
+    Drop cached results.
+
+    Args:
+        tool_id (Optional[str]): Only drop the results of this tool.
+
+    Returns:
+        int: Number of entries dropped.
+    """
+    return _result_cache.invalidate_where(lambda key: tool_id is None or key[3] == tool_id)
+
+
+def get_result_cache_stats() -> CacheStats:
+    """
+    Return the hit/miss counters of the result cache.
+
+    Returns:
+        CacheStats: Current counters.
+    """
+    return _result_cache.stats
@@ -0,0 +1,145 @@
+"""
+In-process caching utilities for the xpander.ai SDK.
+
+This module provides a thread-safe cache with per-entry time-to-live and a
+least-recently-used size bound, shared by the SDK's caching layers.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+V = TypeVar("V")
+
+
+class CacheStats(BaseModel):
+    """
+    Snapshot of cache counters.
+
+    Attributes:
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups not found or expired.
+        evictions (int): Entries dropped to respect the size bound.
+        size (int): Entries currently stored.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe cache with time-to-live expiry and an LRU size bound.
+
+    Args:
+        maxsize (int): Maximum number of entries; the least recently used entry
+            is evicted first.
+        ttl (float): Default time-to-live of entries in seconds.
+
+    Example:
+        >>> cache = TTLCache(maxsize=128, ttl=60)
+        >>> cache.set("key", "value")
+        >>> cache.get("key")
+        'value'
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """
+        Return the value of a live entry.
+
+        Args:
+            key (Hashable): Entry key.
+            default (Optional[V]): Returned when the key is missing or expired.
+
+        Returns:
+            Optional[V]: The cached value or `default`.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key (Hashable): Entry key.
+            value (V): Value to store.
+            ttl (Optional[float]): Time-to-live in seconds, defaults to the cache TTL.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Drop an entry.
+
+        Args:
+            key (Hashable): Entry key.
+
+        Returns:
+            bool: True if the entry existed.
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Drop every entry whose key matches a predicate.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): Called with each key.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            CacheStats: Current counters.
+        """
+        with self._lock:
+            return self._stats.model_copy(update={"size": len(self._entries)})
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -4,10 +4,85 @@ Utilities for managing event loop execution in the xpander.ai SDK.
 This module provides utilities for handling asyncio event loops, enabling
 synchronous execution of coroutines in environments that may not natively
 support asynchronous operations.
+
+Synchronous calls are executed on a single long-lived event loop running in
+a background daemon thread, so connection pools and other loop-bound state
+survive across calls instead of being rebuilt per call.
 """
 
 import asyncio
-from typing import Any, Awaitable
+import atexit
+import concurrent.futures
+import contextvars
+import os
+import threading
+from typing import Any, Awaitable, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+async def _run_and_release_connections(coro: Awaitable[Any]) -> Any:
+    """
+    Await a coroutine on a short-lived event loop and close the HTTP
+    connection pools bound to that loop before it is torn down.
+    """
+    from xpander_sdk.core.http_client_pool import HTTPClientPool
+
+    try:
+        return await coro
+    finally:
+        await HTTPClientPool.aclose()
+
+
+def _run_loop_forever(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+    asyncio.set_event_loop(loop)
+    loop.call_soon(ready.set)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the SDK's background event loop, starting its thread if needed.
+
+    Returns:
+        asyncio.AbstractEventLoop: A running loop owned by a daemon thread.
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed() or not _loop_thread.is_alive():
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=_run_loop_forever,
+                args=(loop, ready),
+                name="xpander-sdk-event-loop",
+                daemon=True,
+            )
+            thread.start()
+            ready.wait()
+            _loop, _loop_thread = loop, thread
+        return _loop
+
+
+def _run_in_new_loop(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine on a fresh event loop in a helper thread."""
+    context = contextvars.copy_context()
+
+    def _run_in_thread():
+        new_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(new_loop)
+        try:
+            return new_loop.run_until_complete(_run_and_release_connections(coro))
+        finally:
+            new_loop.close()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(context.run, _run_in_thread).result()
 
 
 def run_sync(coro: Awaitable[Any]) -> Any:
@@ -15,53 +90,89 @@ def run_sync(coro: Awaitable[Any]) -> Any:
     Synchronously run an asynchronous coroutine, ensuring compatibility
     with nested event loops in environments like Jupyter Notebooks or
     web frameworks such as FastAPI.
-    
-    This function detects and manages running event loops to prevent
-    runtime errors. For uvloop compatibility, it uses asyncio.create_task
-    and waits for completion instead of nest_asyncio when uvloop is detected.
-    
+
+    The coroutine is submitted to the SDK's long-lived background loop and
+    the calling thread blocks until it completes. The caller's context
+    variables (e.g. the request deadline) are propagated.
+
+    When the calling thread runs an event loop itself (asyncio or uvloop, e.g.
+    a sync SDK method called from an async handler or a notebook cell), the
+    coroutine runs on a fresh loop in a helper thread instead. Coroutines are
+    no longer nested into the caller's loop (nest_asyncio is not used), so
+    that loop is blocked until the call returns and the coroutine must not
+    wait on objects bound to it. Prefer the async API (`a*` methods) in async
+    code.
+
     Args:
         coro (Awaitable[Any]): The coroutine to be executed.
-        
+
     Returns:
         Any: The result of the coroutine execution.
-        
+
     Example:
         >>> async def fetch_data():
         ...     # simulate async operation
         ...     await asyncio.sleep(1)
         ...     return "data"
-        
+
         >>> result = run_sync(fetch_data())
         >>> print(result)  # Outputs: "data"
     """
     try:
-        loop = asyncio.get_running_loop()
-        if loop.is_running():
-            # Check if we're running with uvloop
-            loop_module = type(loop).__module__
-            if 'uvloop' in loop_module.lower():
-                # uvloop doesn't support nest_asyncio, so we need a different approach
-                # Create a task and run it in the current loop context
-                import concurrent.futures
-                
-                # Use a separate thread with a new event loop
-                def _run_in_thread():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        return new_loop.run_until_complete(coro)
-                    finally:
-                        new_loop.close()
-                
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(_run_in_thread)
-                    return future.result()
-            else:
-                # Use `nest_asyncio` for standard asyncio loops
-                import nest_asyncio
-                nest_asyncio.apply()
-                return loop.run_until_complete(coro)
+        asyncio.get_running_loop()
+        in_running_loop = True
     except RuntimeError:
-        # No event loop in this context, safe to run
-        return asyncio.run(coro)
+        in_running_loop = False
+    if in_running_loop or threading.current_thread() is _loop_thread:
+        # the caller's loop is blocked for the duration of the call, so do not also
+        # make it wait behind the shared background loop's other work
+        return _run_in_new_loop(coro)
+
+    # the loop schedules the coroutine with a copy of the caller's context
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+async def _ashutdown() -> None:
+    from xpander_sdk.core.http_client_pool import HTTPClientPool
+
+    await HTTPClientPool.aclose()
+
+
+def shutdown_background_loop(timeout: float = 5.0) -> None:
+    """
+    Close the background loop's connection pools and stop its thread.
+
+    Called automatically at interpreter exit; the next `run_sync` call
+    starts a new loop.
+
+    Args:
+        timeout (float): Seconds to wait for the pools to close.
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop, _loop_thread = None, None
+    if loop is None or loop.is_closed() or not thread.is_alive():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_ashutdown(), loop).result(timeout=timeout)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=timeout)
+
+
+def _reset_after_fork() -> None:
+    # the loop thread does not survive fork; the child starts its own on demand
+    global _loop, _loop_thread, _loop_lock
+    _loop, _loop_thread, _loop_lock = None, None, threading.Lock()
+
+
+atexit.register(shutdown_background_loop)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,196 @@
+"""
+Fast and incremental JSON decoding utilities for the xpander.ai SDK.
+
+This module decodes JSON with orjson when it is installed (falling back to the
+standard library), and provides an incremental decoder that yields the items of
+a top-level JSON array while it is being received, so very large list
+responses never have to be held in memory as a whole.
+"""
+
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Callable, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_WHITESPACE = b" \t\r\n"
+_STRUCTURAL = re.compile(rb'[\[\]{}",]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Decode a JSON document, using orjson when available.
+
+    Args:
+        data (Union[bytes, bytearray, str]): The JSON document.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. integers beyond 64 bits, which the standard library handles
+    return json.loads(data)
+
+
+class JSONArrayItemDecoder:
+    """
+    Incremental decoder for the items of a top-level JSON array.
+
+    Feed it the response body chunk by chunk; every call returns the raw bytes
+    of the items completed so far. Only the item currently being received is
+    buffered.
+
+    Example:
+        >>> decoder = JSONArrayItemDecoder()
+        >>> decoder.feed(b'[{"id": 1}, {"i')
+        [b'{"id": 1}']
+        >>> decoder.feed(b'd": 2}]')
+        [b'{"id": 2}']
+        >>> decoder.close()
+    """
+
+    def __init__(self):
+        self._buffer = b""
+        self._pos = 0
+        self._item_start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Consume a chunk of the document.
+
+        Args:
+            chunk (bytes): Next chunk of the JSON document.
+
+        Returns:
+            List[bytes]: Raw JSON of the items completed by this chunk.
+
+        Raises:
+            ValueError: If the document is not a JSON array.
+        """
+        if self._finished:
+            if chunk.strip(_WHITESPACE):
+                raise ValueError("Unexpected data after the end of the JSON array")
+            return []
+
+        self._buffer += chunk
+        buffer = self._buffer
+        items: List[bytes] = []
+
+        while self._pos < len(buffer) and not self._finished:
+            if not self._started:
+                self._skip_whitespace()
+                if self._pos == len(buffer):
+                    break
+                if buffer[self._pos : self._pos + 1] != b"[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                self._pos += 1
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, self._pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    break
+                if match.group() == b"\\":
+                    if match.end() == len(buffer):  # escaped character not received yet
+                        self._pos = match.start()
+                        break
+                    self._pos = match.end() + 1
+                else:
+                    self._in_string = False
+                    self._pos = match.end()
+                continue
+
+            if self._item_start is None:
+                self._skip_whitespace()
+                if self._pos == len(buffer):
+                    break
+                if buffer[self._pos : self._pos + 1] == b"]":
+                    self._finished = True
+                    self._pos += 1
+                    break
+                self._item_start = self._pos
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                break
+
+            token = match.group()
+            self._pos = match.end()
+            if token == b'"':
+                self._in_string = True
+            elif token in (b"{", b"["):
+                self._depth += 1
+            elif token in (b"}", b"]") and self._depth > 0:
+                self._depth -= 1
+            elif token == b"," and self._depth == 0:
+                items.append(buffer[self._item_start : match.start()].strip(_WHITESPACE))
+                self._item_start = None
+            elif token == b"]":
+                items.append(buffer[self._item_start : match.start()].strip(_WHITESPACE))
+                self._item_start = None
+                self._finished = True
+
+        # drop everything already consumed
+        cut = self._item_start if self._item_start is not None else self._pos
+        self._buffer = buffer[cut:]
+        self._pos -= cut
+        if self._item_start is not None:
+            self._item_start = 0
+        return items
+
+    def close(self) -> None:
+        """
+        Verify the whole array was received.
+
+        Raises:
+            ValueError: If the document ended before the closing bracket.
+        """
+        if not self._finished:
+            raise ValueError("Incomplete JSON array")
+
+    def _skip_whitespace(self) -> None:
+        buffer = self._buffer
+        while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+
+
+async def aiter_json_array(
+    chunks: AsyncIterable[bytes],
+    parse: Callable[[bytes], Any] = loads,
+) -> AsyncIterator[Any]:
+    """
+    Yield the items of a JSON array received as an async stream of bytes.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The document, chunk by chunk.
+        parse (Callable[[bytes], Any]): Decoder applied to the raw JSON of each item,
+            e.g. a pydantic model's `model_validate_json`. Defaults to `loads`.
+
+    Yields:
+        Any: The decoded items, in order.
+
+    Raises:
+        ValueError: If the document is not a complete JSON array.
+    """
+    decoder = JSONArrayItemDecoder()
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield parse(item)
+    decoder.close()
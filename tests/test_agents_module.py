@@ -90,3 +90,117 @@ async def test_get_user_sessions():
 
     sessions = await agent.aget_user_sessions(user_id="moriel@xpander.ai")
     assert len(sessions) != 0
+
+
+@pytest.mark.asyncio
+async def test_agent_cache_copy_on_read(monkeypatch):
+    """Test that cached agent loads skip the API and never share per-task state."""
+    from xpander_sdk import Configuration
+    from xpander_sdk.core.xpander_api_client import APIClient
+
+    calls = []
+
+    async def make_request(self, path, headers=None, **kwargs):
+        calls.append(headers)
+        return {
+            "id": "cached-agent", "name": "Cached", "unique_name": "cached", "framework": "agno",
+            "organization_id": "org", "environment_id": "env", "version": 7,
+            "model_provider": "openai", "model_name": "gpt-4o",
+            "graph": [{"id": "g1", "item_id": "tool-1", "name": "tool", "type": "tool", "targets": []}],
+            "tools": [{"id": "tool-1", "name": "tool", "method": "POST", "path": "/tool"}],
+        }
+
+    monkeypatch.setattr(APIClient, "make_request", make_request)
+    configuration = Configuration(api_key="key", organization_id="org", agent_cache_ttl=60)
+    Agent.invalidate_cache()
+
+    first = await Agent.aload(agent_id="cached-agent", configuration=configuration)
+    second = await Agent.aload(agent_id="cached-agent", configuration=Configuration(api_key="key", organization_id="org", agent_cache_ttl=60))
+    by_version = await Agent.aload(agent_id="cached-agent", configuration=configuration, version=7)
+    assert len(calls) == 1
+
+    assert first is not second and first.graph is not second.graph
+    assert first.graph.items[0] is not second.graph.items[0]
+    assert second.configuration.state.agent is second
+    assert by_version.version == 7
+
+    await Agent.aload(agent_id="cached-agent", configuration=Configuration(api_key="other", organization_id="org", agent_cache_ttl=60))
+    assert len(calls) == 2
+
+    assert Agents(configuration=configuration).invalidate_cache("cached-agent") == 4  # latest + v7, for both API keys
+    await Agent.aload(agent_id="cached-agent", configuration=configuration)
+    assert len(calls) == 3
+
+    await Agent.aload(agent_id="cached-agent", configuration=Configuration(api_key="key", organization_id="org", agent_cache_ttl=0))
+    assert len(calls) == 4
+    Agent.invalidate_cache()
+
+
+@pytest.mark.asyncio
+async def test_agent_cache_survives_local_tool_sync(monkeypatch):
+    """Test that local tools are synced once per agent and only invalidate cached agents when the graph changed."""
+    import asyncio
+    from xpander_sdk import Configuration
+    from xpander_sdk.core.xpander_api_client import APIClient
+    from xpander_sdk.modules.tools_repository.sub_modules.tool import Tool
+    from xpander_sdk.modules.tools_repository.tools_repository_module import ToolsRepository
+
+    graph = [{"id": "g1", "item_id": "tool-1", "name": "tool", "type": "tool", "targets": []}]
+    calls = []
+
+    async def make_request(self, path, method="GET", payload=None, headers=None, **kwargs):
+        calls.append(method)
+        if method == "PATCH":
+            for tool in payload:
+                if not any(item["item_id"] == tool["id"] for item in graph):
+                    graph.append({"id": f"g-{tool['id']}", "item_id": tool["id"], "name": tool["name"], "type": "tool", "targets": []})
+        return {
+            "id": "synced-agent", "name": "Synced", "unique_name": "synced", "framework": "agno",
+            "organization_id": "org", "environment_id": "env", "version": 1,
+            "model_provider": "openai", "model_name": "gpt-4o",
+            "graph": [dict(item) for item in graph],
+            "tools": [{"id": "tool-1", "name": "tool", "method": "POST", "path": "/tool"}],
+        }
+
+    monkeypatch.setattr(APIClient, "make_request", make_request)
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    monkeypatch.setattr(ToolsRepository, "_synced_local_tools", set())
+    ToolsRepository.register_tool(
+        Tool(id="local-tool", name="local", method="POST", path="/local", is_local=True, should_add_to_graph=True)
+    )
+    configuration = Configuration(api_key="key", organization_id="org", agent_cache_ttl=300)
+    Agent.invalidate_cache()
+
+    for _ in range(3):
+        await Agent.aload(agent_id="synced-agent", configuration=configuration)
+        await asyncio.sleep(0.01)  # let the background sync finish
+
+    # the first sync added the tool to the graph; later loads are served from the cache
+    # and do not sync the tool again
+    assert calls.count("GET") == 2
+    assert calls.count("PATCH") == 1
+    assert ToolsRepository._local_tools[0].is_synced is False  # only the repositories' copies are marked
+    Agent.invalidate_cache()
+
+
+def test_agent_graph_indexes():
+    """Test that graph lookups are indexed and follow item replacement."""
+    from xpander_sdk.modules.agents.models.agent import AgentGraphItemType
+    from xpander_sdk.modules.agents.sub_modules.agent import AgentGraph
+
+    graph = AgentGraph(
+        [{"id": f"g{i}", "item_id": f"tool-{i}", "type": "tool", "targets": []} for i in range(50)]
+        + [
+            {"id": "sub", "item_id": "agent-2", "type": "agent", "targets": []},
+            {"id": "mcp", "item_id": "mcp-1", "type": "mcp", "targets": [], "settings": {"mcp_settings": {"type": "remote", "url": "https://mcp.example.com"}}},
+        ]
+    )
+    assert graph.get_graph_item("item_id", "tool-42").id == "g42"
+    assert graph.get_item_by_id("g7").item_id == "tool-7"
+    assert graph.get_mcp_item_by_url("https://mcp.example.com").id == "mcp"
+    assert len(graph.get_items_by_type(AgentGraphItemType.TOOL)) == 50
+    assert graph.sub_agents == ["agent-2"]
+
+    graph.items = graph.get_items_by_type(AgentGraphItemType.TOOL)[:1]
+    assert graph.sub_agents == [] and graph.get_item_by_id("g7") is None
+    assert graph.get_graph_item("id", "g0").item_id == "tool-0"
@@ -1,10 +1,18 @@
+import asyncio
+import json
 from pathlib import Path
 from dotenv import load_dotenv
 import httpx
 import pytest
 from xpander_sdk.consts.api_routes import APIRoute
+from xpander_sdk.core.http_client_pool import HTTPClientPool
+from xpander_sdk.core.retry_policy import RetryPolicy
+from xpander_sdk.core.timeouts import DeadlineExceededError, RouteTimeout, TimeoutSettings, deadline, remaining_time
 from xpander_sdk.core.xpander_api_client import APIClient
 from xpander_sdk import Configuration
+from xpander_sdk.models.configuration import ConnectionPoolSettings
+from xpander_sdk.modules.tasks.models.tasks_list import TasksListItem
+from xpander_sdk.utils.json_stream import JSONArrayItemDecoder
 
 # Load test environment variables
 test_env_path = Path(__file__).parent / ".env"
@@ -32,3 +40,297 @@ async def test_bad_api_key():
         )
 
     assert exc_info.value.response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_is_reused_per_loop():
+    """Test that make_request reuses one pooled client per loop and settings."""
+    configuration = Configuration(api_key="key", base_url="https://inbound.xpander.ai")
+    first = HTTPClientPool.get_client(configuration=configuration)
+    second = HTTPClientPool.get_client(configuration=Configuration(api_key="other"))
+    assert first is second
+
+    limited = Configuration(connection_pool=ConnectionPoolSettings(max_connections=2))
+    assert HTTPClientPool.get_client(configuration=limited) is not first
+
+    await APIClient.aclose_connections()
+    assert first.is_closed
+    assert HTTPClientPool.get_client(configuration=configuration) is not first
+    await APIClient.aclose_connections()
+
+
+def _mock_client(monkeypatch, statuses):
+    """Serve the given statuses in order from a mocked pooled client."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(statuses[min(len(calls), len(statuses)) - 1], json={"ok": True})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(HTTPClientPool, "get_client", classmethod(lambda cls, configuration=None: client))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_retries_idempotent_requests(monkeypatch):
+    """Test that transient failures are retried for GET but not for POST without an idempotency key."""
+    policy = RetryPolicy(backoff_base=0, jitter=False)
+    configuration = Configuration(api_key="key", base_url="https://inbound.xpander.ai", retry_policy=policy)
+    client = APIClient(configuration=configuration)
+
+    calls = _mock_client(monkeypatch, [502, 503, 200])
+    assert await client.make_request(path="/agents/agent-1") == {"ok": True}
+    assert len(calls) == 3
+
+    calls = _mock_client(monkeypatch, [502, 200])
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.make_request(path="/agents/agent-1/invoke", method="POST", payload={})
+    assert len(calls) == 1
+
+    calls = _mock_client(monkeypatch, [502, 200])
+    await client.make_request(
+        path="/agents/agent-1/invoke", method="POST", payload={}, headers={"Idempotency-Key": "abc"}
+    )
+    assert len(calls) == 2
+
+    stats = policy.stats
+    assert (stats.requests, stats.attempts, stats.retries) == (3, 6, 3)
+    assert stats.amplification == 2
+    assert policy.stats_by_route[APIRoute.GetAgent.value].retries == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_budget_and_route_overrides(monkeypatch):
+    """Test that retries stop when the budget is spent and honour per-route overrides."""
+    policy = RetryPolicy(
+        backoff_base=0,
+        budget_max_retries=1,
+        route_overrides={APIRoute.GetAgent: RetryPolicy(max_attempts=1)},
+    )
+    configuration = Configuration(api_key="key", base_url="https://inbound.xpander.ai", retry_policy=policy)
+    client = APIClient(configuration=configuration)
+
+    calls = _mock_client(monkeypatch, [500])
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.make_request(path="/agents/agent-1")
+    assert len(calls) == 1
+    assert policy.stats.exhausted == 1
+
+    calls = _mock_client(monkeypatch, [500])
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.make_request(path=APIRoute.ListAgent)
+    assert len(calls) == 2
+    assert policy.stats.budget_rejections == 1
+
+
+def test_retry_policy_delay():
+    """Test backoff growth, its cap and Retry-After handling."""
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+    assert [policy.get_delay(attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+    assert policy.get_delay(1, httpx.Response(429, headers={"Retry-After": "3"})) == 3
+    assert 0 <= RetryPolicy(backoff_base=1).get_delay(3) <= 4
+
+
+@pytest.mark.asyncio
+async def test_route_timeouts_and_deadline(monkeypatch):
+    """Test per-route timeouts, configuration overrides and deadline capping."""
+    timeouts = TimeoutSettings(routes={APIRoute.GetAgent: RouteTimeout(read=3)})
+    assert TimeoutSettings().for_route(APIRoute.GetTask).read == 15
+    assert TimeoutSettings().for_route(APIRoute.InvokeTool).read == 1200
+    assert timeouts.for_route(APIRoute.GetAgent).read == 3
+    assert timeouts.for_route(None) == timeouts.default
+
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"ok": True})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(HTTPClientPool, "get_client", classmethod(lambda cls, configuration=None: client))
+    # coalesced GETs run without a deadline, so only uncoalesced requests get their timeouts capped
+    api = APIClient(
+        configuration=Configuration(
+            api_key="key", base_url="https://inbound.xpander.ai", timeouts=timeouts, coalesce_requests=False
+        )
+    )
+
+    await api.make_request(path="/agents/agent-1")
+    assert seen[-1]["read"] == 3
+
+    with deadline(0.05):
+        with pytest.raises(DeadlineExceededError):
+            await api.make_request(path="/agents/agent-1")
+        assert seen[-1]["read"] <= 0.05
+        await asyncio.sleep(0.05)
+        with pytest.raises(DeadlineExceededError):
+            await api.make_request(path="/agents/agent-1")
+    assert len(seen) == 2
+
+
+def test_json_array_item_decoder():
+    """Test that array items are emitted as soon as they are complete, across chunk boundaries."""
+    decoder = JSONArrayItemDecoder()
+    assert decoder.feed(rb' [{"a": "x,]\"}"},') == [rb'{"a": "x,]\"}"}']
+    assert decoder.feed(rb' [1, [2]], "') == [rb"[1, [2]]"]
+    assert decoder.feed(b"\\") == []  # escape split across chunks
+    assert decoder.feed(rb'"" , 3 ]') == [rb'"\""', rb"3"]
+    decoder.close()
+
+    empty = JSONArrayItemDecoder()
+    assert empty.feed(b"[ ]") == []
+    empty.close()
+
+    with pytest.raises(ValueError):
+        JSONArrayItemDecoder().feed(b'{"a": 1}')
+    with pytest.raises(ValueError):
+        incomplete = JSONArrayItemDecoder()
+        incomplete.feed(b"[1, 2")
+        incomplete.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_list_and_model_validation(monkeypatch):
+    """Test list streaming and single-pass model validation from bytes."""
+    items = [{"id": f"task-{i}", "agent_id": "agent", "organization_id": "org", "status": "completed"} for i in range(50)]
+    body = json.dumps(items).encode()
+
+    async def chunks():
+        for i in range(0, len(body), 7):
+            yield body[i : i + 7]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/one"):
+            return httpx.Response(200, json=items[0])
+        return httpx.Response(200, headers={"Content-Type": "application/json"}, content=chunks())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(HTTPClientPool, "get_client", classmethod(lambda cls, configuration=None: client))
+    api = APIClient(configuration=Configuration(api_key="key", base_url="https://inbound.xpander.ai"))
+
+    streamed = [item async for item in api.astream_list(path="/agent-execution/executions/history/agent", model=TasksListItem)]
+    assert [item.id for item in streamed] == [item["id"] for item in items]
+
+    item = await api.make_request(path="/one", model=TasksListItem)
+    assert isinstance(item, TasksListItem) and item.id == "task-0"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_are_coalesced(monkeypatch):
+    """Test that concurrent identical GETs share one network call and distinct ones do not."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"items": [1, 2]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(HTTPClientPool, "get_client", classmethod(lambda cls, configuration=None: client))
+    api = APIClient(configuration=Configuration(api_key="key", base_url="https://inbound.xpander.ai"))
+    before = APIClient.get_coalescing_stats()
+
+    results = await asyncio.gather(
+        *(api.make_request(path="/agents/agent-1", headers={"x-agent-version": "2"}) for _ in range(10)),
+        api.make_request(path="/agents/agent-1", headers={"x-agent-version": "3"}),
+        api.make_request(path="/agents/agent-1", configuration=Configuration(api_key="other", base_url="https://inbound.xpander.ai")),
+        api.make_request(path="/agents/agent-1", method="POST", payload={}),
+    )
+    assert len(calls) == 4
+    assert all(result == {"items": [1, 2]} for result in results)
+    assert results[0] is not results[1]  # every caller gets its own parsed copy
+
+    after = APIClient.get_coalescing_stats()
+    assert after.coalesced - before.coalesced == 9
+    assert after.leaders - before.leaders == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesced_gets_apply_each_callers_deadline(monkeypatch):
+    """Test that a coalesced GET runs without a deadline and every caller waits until its own."""
+    deadlines = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        deadlines.append(remaining_time())
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"id": "agent-1"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(HTTPClientPool, "get_client", classmethod(lambda cls, configuration=None: client))
+    api = APIClient(configuration=Configuration(api_key="key", base_url="https://inbound.xpander.ai"))
+
+    async def get(seconds):
+        if seconds is None:
+            return await api.make_request(path="/agents/agent-1")
+        with deadline(seconds):
+            return await api.make_request(path="/agents/agent-1")
+
+    leader = asyncio.create_task(get(0.05))
+    await asyncio.sleep(0)
+    results = await asyncio.gather(leader, get(None), get(5), return_exceptions=True)
+
+    assert deadlines == [None]  # one call, free of the leader's deadline
+    assert isinstance(results[0], DeadlineExceededError)
+    assert results[1] == results[2] == {"id": "agent-1"}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_get_is_cancelled_when_every_caller_left(monkeypatch):
+    """Test that a coalesced GET stops once all its callers gave up on it."""
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(request.url.path)
+            raise
+        return httpx.Response(200, json={"id": "agent-1"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(HTTPClientPool, "get_client", classmethod(lambda cls, configuration=None: client))
+    api = APIClient(configuration=Configuration(api_key="key", base_url="https://inbound.xpander.ai"))
+
+    async def get(seconds):
+        with deadline(seconds):
+            return await api.make_request(path="/agents/agent-1")
+
+    follower = asyncio.create_task(api.make_request(path="/agents/agent-1"))
+    results = await asyncio.gather(get(0.05), get(0.1), asyncio.sleep(0.02), return_exceptions=True)
+    assert all(isinstance(result, DeadlineExceededError) for result in results[:2])
+    await asyncio.sleep(0.01)
+    assert not cancelled  # a caller without a deadline still waits
+
+    follower.cancel()
+    await asyncio.sleep(0.01)
+    assert cancelled == ["/agents/agent-1"]
+    assert not APIClient._single_flight._inflight
+
+
+def test_run_sync_reuses_background_loop():
+    """Test that sync calls share one background loop, except from running loops, and keep the caller's deadline."""
+    from xpander_sdk.utils.event_loop import get_background_loop, run_sync
+
+    async def current_loop():
+        return asyncio.get_running_loop(), remaining_time()
+
+    first, no_deadline = run_sync(current_loop())
+    assert first is get_background_loop() and no_deadline is None
+    with deadline(30):
+        second, remaining = run_sync(current_loop())
+    assert second is first and 0 < remaining <= 30
+
+    async def nested():
+        return run_sync(current_loop())[0]
+
+    assert run_sync(nested()) is not first  # re-entrant calls do not deadlock
+
+    async def called_from_async_code():
+        caller = asyncio.get_running_loop()
+        with deadline(30):
+            used, remaining = run_sync(current_loop())
+        return used is not caller and used is not first and 0 < remaining <= 30
+
+    assert asyncio.run(called_from_async_code())  # runs on a loop of its own, with the caller's deadline
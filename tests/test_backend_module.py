@@ -211,3 +211,96 @@ def test_sync_report_external_task_with_tools():
     assert reported_task.agent_id == XPANDER_AGENT_ID
     assert hasattr(reported_task, 'id')
     assert hasattr(reported_task, 'status')
+
+
+@pytest.mark.asyncio
+async def test_org_default_llm_headers_cache(monkeypatch):
+    """Headers are fetched once, then served stale while a background refresh runs."""
+    import asyncio
+
+    from xpander_sdk import Configuration
+    from xpander_sdk.core.xpander_api_client import APIClient
+    from xpander_sdk.modules.backend.utils import llm_headers
+
+    calls = []
+
+    async def make_request(self, path, **kwargs):
+        calls.append(path)
+        return {"x-org": str(len(calls))}
+
+    monkeypatch.setattr(APIClient, "make_request", make_request)
+    llm_headers.invalidate_org_default_llm_headers()
+    configuration = Configuration(api_key="key", organization_id="org")
+
+    first = await llm_headers.aget_org_default_llm_headers(configuration)
+    first["mutated"] = "yes"
+    assert await llm_headers.aget_org_default_llm_headers(configuration) == {"x-org": "1"}
+    assert len(calls) == 1
+
+    monkeypatch.setattr(llm_headers, "LLM_HEADERS_TTL", 0)
+    assert await llm_headers.aget_org_default_llm_headers(configuration) == {"x-org": "1"}
+    await asyncio.gather(*llm_headers._background_tasks)
+    assert len(calls) == 2
+    assert await llm_headers.aget_org_default_llm_headers(configuration) == {"x-org": "2"}
+
+    llm_headers.invalidate_org_default_llm_headers()
+
+
+@pytest.mark.asyncio
+async def test_build_agent_args_runs_fetches_concurrently(monkeypatch):
+    """Headers and DB are fetched concurrently, the task is reloaded after them, and stages are timed."""
+    import asyncio
+    import time
+    from datetime import datetime
+
+    from xpander_sdk import Configuration
+    from xpander_sdk.core.xpander_api_client import APIClient
+    from xpander_sdk.modules.backend.frameworks import agno as agno_framework
+    from xpander_sdk.modules.tasks.sub_modules.task import Task
+
+    configuration = Configuration(api_key="key", organization_id="org")
+
+    async def make_request(self, path, **kwargs):
+        return {
+            "id": "agent-1", "name": "Agent", "unique_name": "agent", "framework": "agno",
+            "organization_id": "org", "environment_id": "env", "model_provider": "openai",
+            "model_name": "gpt-4o", "deep_planning": True, "agno_settings": {"session_storage": True},
+            "graph": [], "tools": [],
+        }
+
+    async def slow(value):
+        await asyncio.sleep(0.2)
+        return value
+
+    async def areload(self):
+        reloads.append(set(timings) >= {"llm_headers", "db", "tools", "model"})
+        self.instructions_override = await slow("reloaded instructions")
+        return self
+
+    reloads = []
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(APIClient, "make_request", make_request)
+    monkeypatch.setattr(agno_framework, "aget_org_default_llm_headers", lambda configuration: slow({"x-org": "1"}))
+    monkeypatch.setattr(Agent, "aget_db", lambda self, async_db=True: slow("db"))
+    monkeypatch.setattr(Task, "areload", areload)
+
+    agent = await Agent.aload(agent_id="agent-1", configuration=configuration)
+    task = Task(
+        configuration=configuration, id="task-1", agent_id="agent-1", organization_id="org",
+        input={"text": "hi"}, created_at=datetime.now(), deep_planning={"enabled": True},
+        expected_output=None, mcp_servers=[],
+    )
+
+    timings = {}
+    started_at = time.perf_counter()
+    args = await agno_framework.build_agent_args(xpander_agent=agent, task=task, timings=timings)
+    elapsed = time.perf_counter() - started_at
+
+    assert elapsed < 0.6  # the 200ms header and DB fetches overlap, then the task is reloaded
+    assert {"llm_headers", "db", "tools", "task_reload", "model", "total"} <= set(timings)
+    assert reloads == [True]  # after every stage reading the task
+    assert args["db"] == "db"
+    assert args["model"].extra_headers["x-org"] == "1"
+    assert not args["instructions"].startswith("reloaded instructions")
+    assert task.instructions_override == "reloaded instructions"
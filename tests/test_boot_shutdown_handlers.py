@@ -346,6 +346,30 @@ class TestEventsIntegration:
 
         assert executed == ["shutdown_executed"]
 
+    @pytest.mark.asyncio
+    async def test_stop_drains_monitoring_reports(self):
+        """Test that queued monitoring reports are sent during Events.stop()."""
+        from xpander_sdk.core.background_reporter import telemetry_reporter
+
+        sent = []
+
+        async def report(n):
+            await asyncio.sleep(0.01)
+            sent.append(n)
+
+        with patch.dict('os.environ', {
+            'XPANDER_AGENT_ID': 'test-agent',
+            'XPANDER_ORGANIZATION_ID': 'test-org',
+            'XPANDER_API_KEY': 'test-key'
+        }):
+            events = Events()
+            for n in range(3):
+                await telemetry_reporter.asubmit(lambda n=n: report(n))
+            await events.stop()
+
+        assert sorted(sent) == [0, 1, 2]
+        assert telemetry_reporter.stats.pending == 0
+
 
 class TestDecoratorParameters:
     """Test decorator parameter handling."""
@@ -0,0 +1,414 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from xpander_sdk.models.configuration import Configuration
+from xpander_sdk.modules.events.events_module import Events
+from xpander_sdk.modules.events.models.events import EventType
+from xpander_sdk.modules.events.utils.admission_queue import AdmissionQueue
+from xpander_sdk.modules.tasks.sub_modules.task import Task
+
+ENVIRONMENT = {
+    "XPANDER_AGENT_ID": "test-agent",
+    "XPANDER_ORGANIZATION_ID": "test-org",
+    "XPANDER_API_KEY": "test-key",
+}
+
+
+def _sse(event: EventType, data: dict) -> SimpleNamespace:
+    return SimpleNamespace(event=event, data=json.dumps(data))
+
+
+def _task_event(task_id: str, parent_execution: str = None) -> SimpleNamespace:
+    return _sse(
+        EventType.AgentExecution,
+        {
+            "id": task_id,
+            "agent_id": "test-agent",
+            "organization_id": "test-org",
+            "input": {"text": "hi"},
+            "created_at": "2026-01-01T00:00:00",
+            "parent_execution": parent_execution,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_admission_queue_orders_by_priority_and_rejects_when_full():
+    queue = AdmissionQueue(concurrency=1, max_size=2)
+    assert queue.offer("first", priority=1)
+    assert await queue.admit() == "first"
+    assert queue.is_full
+
+    assert queue.offer("second", priority=1)
+    assert queue.offer("child", priority=0)
+    assert not queue.offer("overflow", priority=0)
+
+    admit = asyncio.create_task(queue.admit())
+    await asyncio.sleep(0.01)
+    assert not admit.done()  # waits for a slot
+    queue.release()
+    assert await admit == "child"
+
+    stats = queue.stats
+    assert stats.depth == 1 and stats.in_flight == 1
+    assert stats.admitted == 2 and stats.rejected == 1 and stats.max_wait_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_sse_reader_keeps_reading_at_capacity():
+    """Test that tasks beyond capacity are queued while the stream keeps being read."""
+    finish = asyncio.Event()
+    started = []
+
+    async def handle(self, agent_worker, task, on_execution_request, retry_count=0):
+        started.append(task.id)
+        await finish.wait()
+
+    async def events(self, url):
+        yield _sse(
+            EventType.WorkerRegistration,
+            {
+                "id": "worker-1",
+                "name": "worker",
+                "organization_id": "test-org",
+                "type": "worker",
+                "created_at": "2026-01-01T00:00:00",
+                "created_by": None,
+                "last_heartbeat": "2026-01-01T00:00:00",
+                "dedicated_agent_id": None,
+                "parent_asset_id": None,
+            },
+        )
+        for event in (_task_event("t1"), _task_event("t2"), _task_event("t3", parent_execution="t1"), _task_event("t4")):
+            await asyncio.sleep(0.01)
+            yield event
+
+    with patch.dict("os.environ", ENVIRONMENT), \
+         patch.object(Events, "_sse_events_with_retries", events), \
+         patch.object(Events, "handle_task_execution_request", handle), \
+         patch.object(Events, "heartbeat_loop", AsyncMock()), \
+         patch.object(Events, "_notify_capacity_status", AsyncMock()) as notify, \
+         patch.object(Task, "asave", AsyncMock()) as save:
+        events_module = Events(configuration=Configuration())
+        events_module.max_queued_tasks = 2
+        events_module._admission = AdmissionQueue(concurrency=1, max_size=2)
+        events_module._capacity_notifier.window = 0.01
+        dispatcher = asyncio.create_task(events_module._dispatch_admitted_tasks(lambda task: task))
+
+        await asyncio.wait_for(events_module.register_agent_worker("test-agent", lambda task: task), timeout=5)
+        await asyncio.sleep(0.01)
+
+        assert started == ["t1"]
+        assert events_module.admission_stats.depth == 2 and events_module.admission_stats.rejected == 1
+        save.assert_awaited_once()  # t4 was failed
+        notify.assert_awaited_with("worker-1", is_busy=True)
+
+        finish.set()
+        await asyncio.sleep(0.05)
+        assert started == ["t1", "t3", "t2"]  # sub-task first
+        assert events_module.admission_stats.in_flight == 0
+        notify.assert_awaited_with("worker-1", is_busy=False)
+
+        dispatcher.cancel()
+        await events_module.stop()
+
+
+@pytest.mark.asyncio
+async def test_capacity_notifier_sends_only_sustained_changes():
+    from xpander_sdk.modules.events.utils.capacity_notifier import CapacityNotifier
+
+    send = AsyncMock()
+    notifier = CapacityNotifier(send=send, window=0.05, max_delay=1.0)
+
+    for is_busy in (True, False, True, False):  # flapping within the window
+        notifier.update(is_busy=is_busy)
+        await asyncio.sleep(0.005)
+    await asyncio.sleep(0.1)
+    send.assert_not_awaited()
+
+    notifier.update(is_busy=True)
+    notifier.update(is_busy=True)
+    await asyncio.sleep(0.1)
+    send.assert_awaited_once_with(True)
+
+    stats = notifier.stats
+    assert stats.transitions == 5 and stats.sent == 1 and stats.failed == 0
+    notifier.close()
+
+
+def test_adaptive_concurrency_aimd():
+    from xpander_sdk.modules.events.utils.concurrency_controller import AdaptiveConcurrencyController
+
+    controller = AdaptiveConcurrencyController(initial_limit=6, min_limit=1, max_limit=8, max_rss_mb=512, cooldown=0)
+    assert controller.adjust(in_flight=3) == 6  # not saturated
+    assert [controller.adjust(in_flight=controller.limit) for _ in range(3)] == [7, 8, 8]
+
+    controller.loop_lag = 1.0
+    assert controller.adjust(in_flight=8) == 5
+    controller.loop_lag = 0.0
+
+    controller.rss_mb = 1024
+    assert controller.adjust(in_flight=5) == 3
+    controller.rss_mb = 100
+
+    for latency in [1.0] * 20 + [10.0] * 5:
+        controller.observe(latency)
+    assert controller.baseline_latency == 1.0
+    assert controller.is_overloaded and controller.adjust(in_flight=3) == 2
+    for _ in range(10):
+        controller.adjust(in_flight=1)
+    assert controller.limit == 1  # never below the minimum
+
+
+def test_adaptive_concurrency_tolerates_latency_variance():
+    import random
+
+    from xpander_sdk.modules.events.utils.concurrency_controller import AdaptiveConcurrencyController
+
+    controller = AdaptiveConcurrencyController(initial_limit=6, min_limit=1, max_limit=16)
+    rng = random.Random(0)
+    for _ in range(500):
+        controller.observe(rng.uniform(3, 12))
+        controller.adjust(in_flight=controller.limit)
+        assert not controller.is_overloaded
+    assert controller.limit == 16
+
+
+def test_adaptive_concurrency_decreases_once_per_cooldown():
+    from xpander_sdk.modules.events.utils.concurrency_controller import AdaptiveConcurrencyController
+
+    controller = AdaptiveConcurrencyController(initial_limit=10, min_limit=1, max_limit=16)
+    controller.loop_lag = 1.0
+    assert [controller.adjust(in_flight=10) for _ in range(5)] == [7] * 5  # within the cooldown
+
+    controller._decreased_at -= controller.interval  # one cooldown later
+    assert controller.adjust(in_flight=7) == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("adaptive", [False, True])
+async def test_async_handlers_are_limited_by_max_async_tasks(adaptive):
+    """Test that async handlers get their own limit, with and without adaptive concurrency."""
+
+    async def events(self, url):
+        yield _sse(EventType.EnvironmentConflict, {"error": "stop after setup"})
+
+    async def async_handler(task):
+        return task
+
+    limits = {}
+    with patch.dict("os.environ", ENVIRONMENT), \
+         patch.object(Events, "_sse_events_with_retries", events):
+        for kind, handler in (("sync", lambda task: task), ("async", async_handler)):
+            events_module = Events(
+                configuration=Configuration(), max_sync_workers=4, max_async_tasks=32, adaptive_concurrency=adaptive
+            )
+            await asyncio.wait_for(events_module.start(handler), timeout=2)
+            limits[kind] = (events_module._admission.concurrency, events_module._concurrency.max_limit)
+            await events_module.stop()
+
+    if adaptive:
+        assert limits == {"sync": (4, 4), "async": (4, 32)}  # grows from max_sync_workers
+    else:
+        assert limits == {"sync": (4, 4), "async": (32, 32)}
+
+
+@pytest.mark.asyncio
+async def test_capacity_report_is_sent_with_capacity_updates():
+    from xpander_sdk.modules.events.utils.concurrency_controller import AdaptiveConcurrencyController
+
+    with patch.dict("os.environ", ENVIRONMENT), \
+         patch.object(Events, "_request_with_retries", AsyncMock()) as request:
+        events_module = Events(configuration=Configuration())
+        events_module._admission = AdmissionQueue(concurrency=2, max_size=10)
+        events_module._concurrency = AdaptiveConcurrencyController(initial_limit=2, min_limit=1, max_limit=64)
+        events_module._handler_kind = "async"
+        events_module._admission.offer("task")
+        await events_module._admission.admit()
+
+        await events_module._notify_capacity_status("worker-1", is_busy=False)
+
+    data = request.await_args.kwargs["json"]["data"]
+    assert data["is_busy"] is False
+    assert data["capacity"]["limit"] == 2 and data["capacity"]["free_slots"] == 1
+    assert data["capacity"]["handler_kind"] == "async" and data["capacity"]["max_limit"] == 64
+
+
+def _task(task_id: str) -> Task:
+    event = _task_event(task_id)
+    return Task(**json.loads(event.data), configuration=Configuration())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("requeue", [False, True])
+async def test_plan_continuations_run_iteratively(requeue):
+    from xpander_sdk.models.deep_planning import PlanFollowingStatus
+    from xpander_sdk.modules.events.utils.continuations import ContinuationPolicy
+
+    runs = []
+
+    async def handler(task):
+        runs.append(task.id)
+        return task
+
+    # incomplete twice, then complete
+    statuses = [PlanFollowingStatus(can_finish=False)] * 2 + [PlanFollowingStatus(can_finish=True)]
+
+    with patch.dict("os.environ", ENVIRONMENT), \
+         patch.object(Task, "aset_status", AsyncMock()), \
+         patch.object(Task, "aget_plan_following_status", AsyncMock(side_effect=statuses)), \
+         patch.object(Task, "asave", AsyncMock()) as save:
+        events_module = Events(configuration=Configuration())
+        events_module.continuation_policy = ContinuationPolicy(
+            max_continuations=5, backoff_base=0.01, requeue=requeue
+        )
+        events_module._admission = AdmissionQueue(concurrency=1, max_size=0)
+        dispatcher = asyncio.create_task(events_module._dispatch_admitted_tasks(handler))
+
+        events_module._admission.offer((None, _task("t1"), None), force=True)
+        await asyncio.sleep(0.2)
+        dispatcher.cancel()
+        await events_module.stop()
+
+    assert runs == ["t1"] * 3
+    save.assert_awaited_once()  # the outcome is persisted once, after the last run
+    stats = events_module.continuation_stats
+    assert stats.continuations == 2 and stats.exhausted == 0
+    assert stats.requeued == (2 if requeue else 0)
+    assert events_module.admission_stats.admitted == (3 if requeue else 1)
+
+
+@pytest.mark.asyncio
+async def test_plan_continuation_budget():
+    from xpander_sdk.models.deep_planning import PlanFollowingStatus
+    from xpander_sdk.modules.events.utils.continuations import ContinuationPolicy
+
+    handler = AsyncMock(side_effect=lambda task: task)
+    with patch.dict("os.environ", ENVIRONMENT), \
+         patch.object(Task, "aset_status", AsyncMock()), \
+         patch.object(Task, "aget_plan_following_status", AsyncMock(return_value=PlanFollowingStatus(can_finish=False))), \
+         patch.object(Task, "asave", AsyncMock()) as save:
+        events_module = Events(configuration=Configuration())
+        events_module.continuation_policy = ContinuationPolicy(max_continuations=3, backoff_base=0)
+        await events_module.handle_task_execution_request(None, _task("t1"), handler)
+
+    assert handler.await_count == 4
+    save.assert_awaited_once()
+    assert events_module.continuation_stats.exhausted == 1
+    assert ContinuationPolicy(backoff_base=1, backoff_max=5).delay(4) == 5
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_running_tasks():
+    finish = asyncio.Event()
+
+    async def handle(self, agent_worker, task, on_execution_request, retry_count=0):
+        await finish.wait()
+
+    with patch.dict("os.environ", ENVIRONMENT), \
+         patch.object(Events, "handle_task_execution_request", handle):
+        events_module = Events(configuration=Configuration())
+        events_module._admission = AdmissionQueue(concurrency=1, max_size=10)
+        events_module._reader = reader = asyncio.create_task(asyncio.sleep(60))
+        dispatcher = asyncio.create_task(events_module._dispatch_admitted_tasks(lambda task: task))
+        events_module._admission.offer((None, _task("t1"), None))
+        events_module._admission.offer((None, _task("t2"), None))
+        await asyncio.sleep(0.01)
+
+        assert not await events_module.adrain(timeout=0.2)  # t1 still running
+        await asyncio.sleep(0)
+        assert reader.cancelled()  # no new tasks are received
+
+        finish.set()
+        assert await events_module.adrain(timeout=1)
+        assert events_module.admission_stats.admitted == 2
+        dispatcher.cancel()
+
+
+@pytest.mark.asyncio
+async def test_start_returns_on_environment_conflict():
+    """Test that the worker stops, instead of waiting for tasks forever, when its environment conflicts."""
+
+    async def events(self, url):
+        yield _sse(EventType.EnvironmentConflict, {"error": "another worker is attached"})
+
+    with patch.dict("os.environ", ENVIRONMENT), \
+         patch.object(Events, "_sse_events_with_retries", events):
+        events_module = Events(configuration=Configuration())
+        events_module.adaptive_concurrency = True
+        await asyncio.wait_for(events_module.start(lambda task: task), timeout=2)
+
+        await asyncio.sleep(0)
+        assert all(task.done() for task in events_module._bg)  # admission loops were stopped
+        await events_module.stop()
+
+
+def test_worker_supervisor_restarts_crashed_workers(tmp_path):
+    import os
+
+    from xpander_sdk.modules.events.utils.worker_supervisor import WorkerSupervisor
+
+    def run_worker(index):
+        marker = tmp_path / f"started-{index}"
+        if index == 1 and not marker.exists():
+            marker.write_text("")
+            raise RuntimeError("crash")  # first run of worker 1
+        (tmp_path / f"done-{index}").write_text(
+            f"{os.environ['XPANDER_WORKER_PROCESS_INDEX']}/{os.environ['XPANDER_WORKER_PROCESS_COUNT']}"
+        )
+
+    WorkerSupervisor(processes=2, run_worker=run_worker, restart_delay=0.01).run()
+
+    assert (tmp_path / "done-0").read_text() == "0/2"
+    assert (tmp_path / "done-1").read_text() == "1/2"  # restarted after the crash
+    with pytest.raises(ValueError):
+        WorkerSupervisor(processes=0, run_worker=run_worker)
+
+
+def test_worker_supervisor_drains_workers_on_sigterm(tmp_path):
+    import os
+    import signal
+    import threading
+    import time
+
+    from xpander_sdk.modules.events.utils.worker_supervisor import WorkerSupervisor
+
+    def run_worker(index):
+        def on_sigterm(signum, frame):
+            (tmp_path / f"drained-{index}").write_text("")
+            os._exit(0)
+
+        signal.signal(signal.SIGTERM, on_sigterm)
+        (tmp_path / f"ready-{index}").write_text("")
+        time.sleep(30)
+
+    def stop_when_ready():
+        while len(list(tmp_path.glob("ready-*"))) < 2:
+            time.sleep(0.01)
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    threading.Thread(target=stop_when_ready, daemon=True).start()
+    started = time.monotonic()
+    WorkerSupervisor(processes=2, run_worker=run_worker, drain_timeout=5).run()
+
+    assert time.monotonic() - started < 5
+    assert sorted(path.name for path in tmp_path.glob("drained-*")) == ["drained-0", "drained-1"]
+
+
+def test_register_runs_one_worker_per_process(tmp_path):
+    import os
+
+    async def start(self, on_execution_request):
+        index = os.environ["XPANDER_WORKER_PROCESS_INDEX"]
+        (tmp_path / f"worker-{index}").write_text(str(self.drain_timeout))
+
+    with patch.dict("os.environ", ENVIRONMENT), patch.object(Events, "start", start):
+        events_module = Events(configuration=Configuration())
+        events_module.register(on_task=lambda task: task, processes=3)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["worker-0", "worker-1", "worker-2"]
+    assert (tmp_path / "worker-0").read_text() == "30.0"  # workers drain on shutdown
@@ -236,3 +236,366 @@ async def test_return_list_of_functions_with_local_tools():
 
     assert isinstance(agent.tools.functions, list)
     assert len(agent.tools.functions) != 0
+
+
+def test_tool_schema_is_memoized():
+    """Test that Tool.schema is built once per definition and rebuilt when it changes."""
+    from xpander_sdk.modules.agents.models.agent import AgentGraphItemSchema
+    from xpander_sdk.modules.tools_repository.sub_modules.tool import Tool
+
+    parameters = {"type": "object", "properties": {"city": {"type": "string"}, "days": {"type": "integer"}}}
+    tool = Tool(id="weather-tool", name="weather", method="POST", path="/weather", parameters=parameters)
+    twin = Tool(id="weather-tool", name="weather", method="POST", path="/weather", parameters=parameters)
+
+    schema = tool.schema
+    assert tool.schema is schema and twin.schema is schema
+
+    tool.parameters = {**parameters, "properties": {**parameters["properties"], "units": {"type": "string"}}}
+    assert tool.schema is not schema
+    assert "units" in tool.schema.model_fields
+
+    tool.schema_overrides = AgentGraphItemSchema(input={"properties": {"units": {"isBlocked": True}}})
+    assert "units" not in tool.schema.model_fields
+
+    tool.is_local = True
+    assert tool.schema is not twin.schema
+
+
+def test_tools_repository_indexes(monkeypatch):
+    """Test that lookups use indexes kept in sync with backend and local tools."""
+    from xpander_sdk.modules.tools_repository.sub_modules.tool import Tool
+
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    repo = ToolsRepository(
+        configuration=Configuration(),
+        tools=[{"id": f"tool-{i}", "name": f"tool_{i}", "method": "POST", "path": "/tool"} for i in range(100)],
+    )
+    assert repo.get_tool_by_id("tool-42").name == "tool_42"
+    assert repo.get_tool_by_name("tool_7").id == "tool-7"
+    assert repo.get_tool_by_id("missing") is None
+
+    ToolsRepository.register_tool(Tool(id="local-tool", name="local", method="POST", path="/local", is_local=True))
+    ToolsRepository.register_tool(Tool(id="tool-1", name="shadowed", method="POST", path="/local", is_local=True))
+    assert repo.get_tool_by_name("local").id == "local-tool"
+    assert repo.get_tool_by_id("tool-1").name == "tool_1"  # backend tools take precedence
+    assert len(repo.list) == 101
+
+    repo.tools = [Tool(id="reloaded", name="reloaded", method="GET", path="/reloaded")]
+    assert repo.get_tool_by_id("tool-42") is None
+    assert [tool.id for tool in repo.list] == ["reloaded", "local-tool", "tool-1"]
+
+    configuration = Configuration(api_key="other")
+    repo.configuration = configuration
+    assert repo.get_tool_by_id("local-tool").configuration is configuration
+
+
+def test_local_tools_are_configured_per_repository(monkeypatch):
+    """Test that graph settings applied to a local tool stay with the repository that applied them."""
+    from xpander_sdk.modules.agents.sub_modules.agent import AgentGraph
+    from xpander_sdk.modules.tools_repository.sub_modules.tool import Tool
+
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    registered = Tool(id="lookup", name="lookup", method="POST", path="/lookup", is_local=True)
+    ToolsRepository.register_tool(registered)
+
+    def graph(**settings):
+        return AgentGraph([{"id": "g1", "item_id": "lookup", "type": "tool", "targets": ["g2"], "settings": settings},
+                           {"id": "g2", "item_id": "other", "type": "tool", "targets": []}])
+
+    ordered = ToolsRepository(
+        configuration=Configuration(),
+        agent_graph=graph(schemas={"input": {"properties": {"units": {"isBlocked": True}}}}, result_cache={"ttl": 60}),
+    )
+    plain = ToolsRepository(configuration=Configuration(api_key="other"), agent_graph=AgentGraph([]))
+
+    first, second = ordered.get_tool_by_id("lookup"), plain.get_tool_by_id("lookup")
+    assert first.has_schema_override("input") and first.cache_ttl == 60 and first.graph_enforces_ordering
+    assert not second.has_schema_override("input") and second.cache_ttl is None and not second.graph_enforces_ordering
+    assert first.configuration is ordered.configuration and second.configuration is plain.configuration
+    assert not registered.schema_overrides and registered.cache_ttl is None  # the registry is untouched
+    assert first.fn is registered.fn
+
+
+def test_tool_functions_are_cached(monkeypatch):
+    """Test that tool functions are reused until the tool definition changes."""
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    definitions = [
+        {"id": f"tool-{i}", "name": f"tool_{i}", "method": "POST", "path": "/tool", "description": f"Tool {i}",
+         "parameters": {"type": "object", "properties": {"query": {"type": "string"}}}}
+        for i in range(3)
+    ]
+    repo = ToolsRepository(configuration=Configuration(), tools=definitions)
+
+    functions = repo.functions
+    assert [fn.__name__ for fn in functions] == ["tool-0", "tool-1", "tool-2"]
+    assert all(first is second for first, second in zip(functions, repo.functions))
+    assert "'payload'" in repo.tools[0].schema.__doc__
+    assert functions[0].__doc__.startswith("Tool 0")
+
+    repo.tools[0].description = "Updated"
+    updated = repo.functions
+    assert updated[0] is not functions[0] and updated[0].__doc__.startswith("Updated")
+    assert updated[1] is functions[1]
+
+    repo.is_async = False
+    assert not asyncio.iscoroutinefunction(repo.functions[1])
+
+
+@pytest.mark.asyncio
+async def test_invoke_many_runs_concurrently_in_order(monkeypatch):
+    """Test that batched invocations respect the cap and keep per-call ordering."""
+    from xpander_sdk.core.xpander_api_client import APIClient
+
+    in_flight, peak = 0, 0
+
+    async def make_request(self, path, payload=None, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return {"path": path, "echo": payload}
+
+    monkeypatch.setattr(APIClient, "make_request", make_request)
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    repo = ToolsRepository(
+        configuration=Configuration(),
+        tools=[{"id": f"tool-{i}", "name": f"tool_{i}", "method": "POST", "path": "/tool"} for i in range(4)],
+    )
+    calls = [{"tool_id": f"tool-{i}", "payload": {"n": i}, "tool_call_id": f"call-{i}"} for i in range(4)]
+    calls.insert(2, {"tool_id": "missing", "tool_call_id": "call-missing"})
+
+    results = await repo.ainvoke_many(calls, agent_id="agent-1", max_concurrency=2)
+
+    assert [result.tool_call_id for result in results] == ["call-0", "call-1", "call-missing", "call-2", "call-3"]
+    assert results[2].is_error and results[2].status_code == 404
+    assert all(result.is_success for i, result in enumerate(results) if i != 2)
+    assert results[3].result == {"path": "/agents/agent-1/operations/tool-2", "echo": {"n": 2}}
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_async_preflight_for_unordered_local_tools(monkeypatch):
+    """Test that only tools ordered by the graph wait for their preflight report."""
+    from xpander_sdk.core.background_reporter import telemetry_reporter
+    from xpander_sdk.core.xpander_api_client import APIClient
+    from xpander_sdk.modules.agents.sub_modules.agent import AgentGraph
+    from xpander_sdk.modules.tools_repository.sub_modules.tool import Tool
+
+    preflights = []
+
+    async def make_request(self, path, payload=None, **kwargs):
+        await asyncio.sleep(0.05)
+        preflights.append(path)
+        return {}
+
+    monkeypatch.setattr(APIClient, "make_request", make_request)
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    for tool_id in ("ordered", "free"):
+        ToolsRepository.register_tool(
+            Tool(id=tool_id, name=tool_id, method="POST", path=f"/{tool_id}", is_local=True, fn=lambda: "done")
+        )
+    repo = ToolsRepository(
+        configuration=Configuration(async_preflight=True),
+        agent_graph=AgentGraph(
+            [
+                {"id": "g1", "item_id": "ordered", "type": "tool", "targets": ["g2"]},
+                {"id": "g2", "item_id": "other", "type": "tool", "targets": []},
+                {"id": "g3", "item_id": "free", "type": "tool", "targets": []},
+            ]
+        ),
+    )
+
+    result = await repo.get_tool_by_id("ordered").ainvoke(agent_id="agent-1", payload={}, task_id="task-1")
+    assert result.is_success and preflights == ["/agents/agent-1/operations/ordered"]
+
+    result = await repo.get_tool_by_id("free").ainvoke(agent_id="agent-1", payload={}, task_id="task-1")
+    assert result.is_success and len(preflights) == 1  # reported in the background
+
+    submitted = telemetry_reporter.stats.submitted
+    result = await repo.get_tool_by_id("free").ainvoke(agent_id="agent-1", payload={})
+    assert result.is_success
+    assert telemetry_reporter.stats.submitted == submitted + 1  # submitted also without a task
+
+    await telemetry_reporter.adrain(timeout=5)
+    assert preflights[1:] == ["/agents/agent-1/operations/free"]
+    assert telemetry_reporter.stats.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_background_reports_ignore_the_submitter_deadline():
+    """Test that a task deadline does not apply to reports sent by the background worker."""
+    from xpander_sdk.core.background_reporter import BackgroundReporter
+    from xpander_sdk.core.timeouts import deadline, remaining_time
+
+    reporter = BackgroundReporter(name="test", flush_interval=0.01)
+    deadlines = []
+
+    async def report():
+        deadlines.append(remaining_time())
+
+    with deadline(0.05):
+        await reporter.asubmit(report)  # starts the worker
+    await asyncio.sleep(0.1)
+    await reporter.asubmit(report)
+    await reporter.adrain(timeout=5)
+
+    assert deadlines == [None, None]
+    assert reporter.stats.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_local_tool_argument_binder_is_cached():
+    """Test that local functions are introspected once and bound per invocation."""
+    from xpander_sdk.modules.tools_repository.utils import local_tools
+
+    class Filters(BaseModel):
+        limit: int = 10
+
+    async def search(query: str, filters: Filters, *, page: int = 1):
+        return query, filters.limit, page
+
+    binder = local_tools.get_argument_binder(search)
+    assert local_tools.get_argument_binder(search) is binder
+    assert await local_tools.invoke_local_fn(search, {"query": "q", "filters": {"limit": 3}, "page": 2}) == ("q", 3, 2)
+    with pytest.raises(TypeError, match="Missing required argument: query"):
+        await local_tools.invoke_local_fn(search, {"filters": {}})
+
+    class Service:
+        def echo(self, value: str):
+            return value
+
+    service = Service()
+    assert await local_tools.invoke_local_fn(service.echo, "scalar") == "scalar"
+    assert local_tools.get_argument_binder(service.echo) is local_tools.get_argument_binder(Service().echo)
+    assert Service.echo in local_tools._method_binders  # cached by function, not by instance
+
+
+def _worker_pid(n: int) -> tuple:
+    return n * n, os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_local_tool_execution_classes(monkeypatch):
+    """Test that local tools run on the pool of their execution class."""
+    import threading
+    from xpander_sdk import ToolExecutionClass
+    from xpander_sdk.modules.tools_repository.utils.local_tools import invoke_local_fn
+
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    register_tool(execution_class=ToolExecutionClass.PROCESS)(_worker_pid)
+    tool = ToolsRepository(configuration=Configuration()).get_tool_by_id("_worker_pid")
+    assert tool.execution_class == ToolExecutionClass.PROCESS
+
+    result = await tool.ainvoke(agent_id="agent-1", payload={"n": 4})
+    square, pid = result.result
+    assert result.is_success and square == 16 and pid != os.getpid()
+
+    def thread_name(value: str) -> str:
+        return threading.current_thread().name
+
+    assert await invoke_local_fn(thread_name, "x", ToolExecutionClass.ASYNC) == threading.current_thread().name
+    assert (await invoke_local_fn(thread_name, "x")).startswith("xpander-local-tool")
+
+    stats = {stats.execution_class: stats for stats in ToolsRepository.executor_stats()}
+    assert stats[ToolExecutionClass.PROCESS].completed >= 1
+    assert stats[ToolExecutionClass.THREAD].completed >= 1 and stats[ToolExecutionClass.THREAD].in_flight == 0
+
+    async def async_tool(value: str) -> str:
+        return value
+
+    with pytest.raises(ValueError):
+        register_tool(execution_class=ToolExecutionClass.THREAD)(async_tool)
+
+
+@pytest.mark.asyncio
+async def test_tool_and_connector_limits(monkeypatch):
+    """Test that connector concurrency caps and tool rate limits throttle invocations."""
+    import time
+    from xpander_sdk import ToolLimits
+    from xpander_sdk.core.xpander_api_client import APIClient
+
+    in_flight, peak = 0, 0
+
+    async def make_request(self, path, payload=None, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return {}
+
+    monkeypatch.setattr(APIClient, "make_request", make_request)
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    repo = ToolsRepository(
+        configuration=Configuration(),
+        tools=[
+            {"id": f"tool-{i}", "name": f"tool_{i}", "method": "POST", "path": "/tool", "connector_id": "crm"}
+            for i in range(3)
+        ],
+    )
+    ToolsRepository.set_connector_limits("crm", ToolLimits(max_concurrency=2))
+    ToolsRepository.set_tool_limits("tool-0", ToolLimits(rate=20, burst=1))
+    try:
+        waiter = asyncio.create_task(repo.get_tool_by_id("tool-1").ainvoke(agent_id="agent-1", payload={}))
+        calls = [{"tool_id": f"tool-{i % 3}", "payload": {}} for i in range(9)]
+        started = time.monotonic()
+        results = await repo.ainvoke_many(calls, agent_id="agent-1")
+        elapsed = time.monotonic() - started
+        await waiter
+
+        assert all(result.is_success for result in results)
+        assert peak == 2
+        assert elapsed >= 0.1  # 3 calls to tool-0 at 20/s with a burst of 1
+        stats = ToolsRepository.limiter_stats()
+        assert stats["connector:crm"].acquired == 10 and stats["connector:crm"].in_flight == 0
+        assert stats["tool:tool-0"].throttled == 2
+    finally:
+        ToolsRepository.set_connector_limits("crm", None)
+        ToolsRepository.set_tool_limits("tool-0", None)
+    assert ToolsRepository.limiter_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_tool_result_cache(monkeypatch):
+    """Test that cacheable tools reuse results and still run after-hooks on hits."""
+    from xpander_sdk.core.xpander_api_client import APIClient
+    from xpander_sdk.modules.agents.sub_modules.agent import AgentGraph
+    from xpander_sdk.modules.events.decorators.on_tool import ToolHooksRegistry
+    from xpander_sdk.modules.tasks.models.task import AgentExecutionInput
+
+    requests, after_hook_results = [], []
+
+    async def make_request(self, path, payload=None, **kwargs):
+        requests.append(payload)
+        return {"rows": [len(requests)]}
+
+    monkeypatch.setattr(APIClient, "make_request", make_request)
+    monkeypatch.setattr(ToolsRepository, "_local_tools", [])
+    monkeypatch.setattr(ToolHooksRegistry, "_after_hooks", [lambda *args: after_hook_results.append(args[-1])])
+    ToolsRepository.invalidate_result_cache()
+    configuration = Configuration()
+    repo = ToolsRepository(
+        configuration=configuration,
+        tools=[{"id": "lookup", "name": "lookup", "method": "GET", "path": "/lookup"}],
+        agent_graph=AgentGraph(
+            [{"id": "g1", "item_id": "lookup", "type": "tool", "targets": [], "settings": {"result_cache": {"ttl": 60, "per_user": True}}}]
+        ),
+    )
+    tool = repo.get_tool_by_id("lookup")
+    assert tool.cache_ttl == 60 and tool.cache_per_user
+
+    before = ToolsRepository.result_cache_stats()
+    first = await tool.ainvoke(agent_id="agent-1", payload={"query_params": {"a": 1, "b": 2}})
+    second = await tool.ainvoke(agent_id="agent-1", payload={"query_params": {"b": 2, "a": 1}})
+    assert first.result == second.result == {"rows": [1]} and len(requests) == 1
+    assert after_hook_results == [{"rows": [1]}, {"rows": [1]}]
+
+    second.result["rows"].append("mutated")
+    configuration.state.task = type("Task", (), {"input": AgentExecutionInput(user={"id": "u2", "email": "u2@example.com"})})()
+    other_user = await tool.ainvoke(agent_id="agent-1", payload={"query_params": {"a": 1, "b": 2}})
+    assert other_user.result == {"rows": [2]} and len(requests) == 2
+
+    stats = ToolsRepository.result_cache_stats()
+    assert stats.hits - before.hits == 1 and stats.misses - before.misses == 2
+    assert ToolsRepository.invalidate_result_cache("lookup") == 2